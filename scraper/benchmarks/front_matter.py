@@ -0,0 +1,117 @@
+"""
+Micro-benchmark for front-matter parsing over the BIPs and BitcoinOps corpora.
+
+Both repositories must already be cloned in DATA_DIR (e.g. by a previous
+scrape). Run with:
+
+    python -m scraper.benchmarks.front_matter --repeat 5
+"""
+
+import os
+import re
+import time
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+import click
+import yaml
+
+from scraper.config import settings
+from scraper.scrapers import BIPsScraper, BitcoinOpsScraper, GithubScraper
+from scraper.scrapers.front_matter import (
+    YAML_LOADER,
+    get_front_matter_parser,
+    load_yaml,
+)
+from scraper.utils import slugify
+
+CORPORA: Dict[str, Type[GithubScraper]] = {
+    "BIPs": BIPsScraper,
+    "BitcoinOps": BitcoinOpsScraper,
+}
+
+
+def legacy_parse(text: str, start: str, end: str) -> Tuple[Any, str]:
+    """Front-matter parsing as done before the precompiled parser."""
+    text = re.sub(r"{%.*?%}", "", text, flags=re.MULTILINE | re.DOTALL)
+    pattern = re.compile(
+        rf"^{re.escape(start)}\s*$(.*?)^{re.escape(end)}\s*$",
+        re.DOTALL | re.MULTILINE,
+    )
+    match = pattern.search(text)
+    if not match:
+        return None, text.strip()
+    front_matter = match.group(1).strip()
+    try:
+        metadata = yaml.safe_load(front_matter)
+    except yaml.YAMLError:
+        metadata = None
+    return metadata, text[match.end() :].strip()
+
+
+def current_parse(text: str, start: str, end: str) -> Tuple[Any, str]:
+    front_matter, body = get_front_matter_parser(start, end).split(text)
+    if front_matter is None:
+        return None, body
+    try:
+        metadata = load_yaml(front_matter)
+    except yaml.YAMLError:
+        metadata = None
+    return metadata, body
+
+
+def load_corpus(name: str) -> List[str]:
+    repo_path = os.path.join(settings.DATA_DIR, slugify(name))
+    if not os.path.isdir(repo_path):
+        raise click.ClickException(
+            f"{repo_path} not found, scrape {name} first to clone it"
+        )
+    texts = []
+    for root, dirs, files in os.walk(repo_path):
+        dirs[:] = [d for d in dirs if d != ".git"]
+        for file in files:
+            if file.endswith((".md", ".mediawiki")):
+                with open(os.path.join(root, file), encoding="utf-8") as f:
+                    texts.append(f.read())
+    return texts
+
+
+def measure(
+    parse: Callable[[str, str, str], Tuple[Any, str]],
+    texts: List[str],
+    start: str,
+    end: str,
+    repeat: int,
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in texts:
+            parse(text, start, end)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+@click.command()
+@click.option("--repeat", default=5, help="Timed passes per corpus (best is kept)")
+def main(repeat: int):
+    """Compare the legacy and current front-matter parsers."""
+    click.echo(f"YAML loader: {YAML_LOADER.__name__}")
+    for name, scraper_class in CORPORA.items():
+        texts = load_corpus(name)
+        start, end = scraper_class.FRONT_MATTER_START, scraper_class.FRONT_MATTER_END
+
+        mismatches = sum(
+            legacy_parse(text, start, end) != current_parse(text, start, end)
+            for text in texts
+        )
+        legacy = measure(legacy_parse, texts, start, end, repeat)
+        current = measure(current_parse, texts, start, end, repeat)
+        click.echo(
+            f"{name}: {len(texts)} files, legacy {legacy * 1000:.1f} ms, "
+            f"current {current * 1000:.1f} ms ({legacy / current:.1f}x), "
+            f"{mismatches} mismatching results"
+        )
+
+
+if __name__ == "__main__":
+    main()
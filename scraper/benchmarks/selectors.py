@@ -0,0 +1,109 @@
+"""
+Micro-benchmark for the Scrapy selector engines on saved BitcoinTalk pages.
+
+Save some topic pages (e.g. with `curl -o`) as `.html` files in
+DATA_DIR/benchmarks/bitcointalk, then run:
+
+    python -m scraper.benchmarks.selectors --repeat 5
+"""
+
+import os
+import time
+from typing import Any, Callable, Dict, List
+
+import click
+from bs4 import BeautifulSoup
+from scrapy.http import HtmlResponse
+
+from scraper.config import get_project_root, settings
+from scraper.scrapers.scrapy.bitcointalk import BitcoinTalkSpider
+from scraper.scrapers.scrapy.selector_extractor import SelectorExtractor
+from scraper.scrapers.scrapy.spider_config import SpiderConfig
+
+PAGES_DIR = os.path.join(settings.DATA_DIR, "benchmarks", "bitcointalk")
+PAGE_URL = "https://bitcointalk.org/index.php?topic=1.0"
+
+
+class BitcoinTalkExtractor(SelectorExtractor):
+    """Applies the BitcoinTalk spider's HTML processing without a crawler."""
+
+    QUOTE_SELECTOR = BitcoinTalkSpider.QUOTE_SELECTOR
+    process_html = BitcoinTalkSpider.process_html
+    process_element = BitcoinTalkSpider.process_element
+
+
+def parse_with_soup(body: bytes) -> Any:
+    return BeautifulSoup(body.decode("utf-8", errors="replace"), "html.parser")
+
+
+def parse_with_lxml(body: bytes) -> Any:
+    response = HtmlResponse(url=PAGE_URL, body=body, encoding="utf-8")
+    return response.selector.root
+
+
+def extract_page(
+    extractor: SelectorExtractor, root: Any, spider_config: SpiderConfig
+) -> List[Dict[str, Any]]:
+    item_config = spider_config.scraping_config.resource_page.items
+    results = []
+    for item in extractor._extract_items(root, item_config.item_selector):
+        fields = {}
+        for name in ("title", "author", "date", "url", "content"):
+            result = extractor._extract_field(item, getattr(item_config, name))
+            fields[name] = result.text
+        results.append(fields)
+    return results
+
+
+def measure(
+    parse: Callable[[bytes], Any],
+    pages: List[bytes],
+    extractor: SelectorExtractor,
+    spider_config: SpiderConfig,
+    repeat: int,
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for body in pages:
+            extract_page(extractor, parse(body), spider_config)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+@click.command()
+@click.option("--repeat", default=5, help="Timed passes over the pages (best is kept)")
+def main(repeat: int):
+    """Compare the BeautifulSoup and lxml selector engines."""
+    if not os.path.isdir(PAGES_DIR):
+        raise click.ClickException(f"Save BitcoinTalk pages to {PAGES_DIR} first")
+    pages = []
+    for file in sorted(os.listdir(PAGES_DIR)):
+        if file.endswith(".html"):
+            with open(os.path.join(PAGES_DIR, file), "rb") as f:
+                pages.append(f.read())
+
+    spider_config = SpiderConfig(
+        os.path.join(get_project_root(), "scrapy_sources_configs", "bitcointalk.yaml")
+    )
+    extractor = BitcoinTalkExtractor()
+
+    items = 0
+    mismatches = 0
+    for body in pages:
+        soup_items = extract_page(extractor, parse_with_soup(body), spider_config)
+        lxml_items = extract_page(extractor, parse_with_lxml(body), spider_config)
+        items += len(soup_items)
+        mismatches += sum(a != b for a, b in zip(soup_items, lxml_items))
+        mismatches += abs(len(soup_items) - len(lxml_items))
+
+    soup = measure(parse_with_soup, pages, extractor, spider_config, repeat)
+    lxml = measure(parse_with_lxml, pages, extractor, spider_config, repeat)
+    click.echo(
+        f"{len(pages)} pages, {items} posts: beautifulsoup {soup * 1000:.1f} ms, "
+        f"lxml {lxml * 1000:.1f} ms ({soup / lxml:.1f}x), {mismatches} mismatching posts"
+    )
+
+
+if __name__ == "__main__":
+    main()
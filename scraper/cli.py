@@ -1,3 +1,6 @@
+import asyncio
+from typing import Dict, List
+
 import click
 from twisted.internet import asyncioreactor, defer
 from twisted.internet.task import react
@@ -7,6 +10,7 @@ from scraper.commands.elastic import elastic
 from scraper.commands.scrapy import scrapy
 from scraper.commands.github import github
 from scraper.config import settings
+from scraper.models import SourceConfig
 from scraper.scraper_factory import ScraperFactory
 
 
@@ -29,8 +33,55 @@ cli.add_command(elastic)
 
 
 def run_in_reactor(coro):
-    """Bridge between coroutines and Twisted's deferred system."""
-    return defer.ensureDeferred(coro)
+    """
+    Bridge between coroutines and Twisted's deferred system.
+
+    The coroutine runs as a task of the asyncio loop driving the reactor, so it
+    can use asyncio primitives as well as await Deferreds converted with
+    `Deferred.asFuture`.
+    """
+    return defer.Deferred.fromFuture(asyncio.ensure_future(coro))
+
+
+# Sources of each resource pool scraped at once, unless set in config.ini
+DEFAULT_POOL_CONCURRENCY = {"git": 2, "api": 2, "scrapy": 2}
+
+# Source types too heavy for every run, only scraped when named with --source
+ON_DEMAND_SOURCE_TYPES = ["dump"]
+
+
+async def scrape_sources(sources: List[SourceConfig], output: str):
+    """
+    Scrape sources concurrently.
+
+    At most `scrape_concurrency` sources are scraped at once. Within that,
+    each resource pool of scrapers (git, api, scrapy...) is limited by
+    `scrape_concurrency_{pool}`, so that sources sharing a resource do not
+    all compete for it at the same time.
+    """
+    global_slots = asyncio.Semaphore(settings.config.getint("scrape_concurrency", 4))
+    pool_slots: Dict[str, asyncio.Semaphore] = {}
+
+    async def scrape_source(src: SourceConfig):
+        try:
+            scraper = ScraperFactory.create_scraper(src, output)
+            pool = scraper.resource_pool
+            if pool not in pool_slots:
+                pool_slots[pool] = asyncio.Semaphore(
+                    settings.config.getint(
+                        f"scrape_concurrency_{pool}",
+                        DEFAULT_POOL_CONCURRENCY.get(pool, 1),
+                    )
+                )
+            # Wait for the pool first, so that no global slot is held meanwhile
+            async with pool_slots[pool], global_slots:
+                logger.info(f"Scraping {src.name} ({pool})")
+                await scraper.run()
+        except Exception as e:
+            click.echo(f"Error scraping {src.name}: {str(e)}")
+            logger.exception("Full traceback:")
+
+    await asyncio.gather(*(scrape_source(src) for src in sources))
 
 
 @cli.command()
@@ -46,8 +97,9 @@ def scrape(source, output):
     Start scraping operations for one or all sources.
 
     If --source is provided, scrapes only that source. Otherwise, scrapes all
-    sources defined in sources.yaml. The scraped data is sent to the specified
-    output (elasticsearch by default).
+    sources defined in sources.yaml concurrently (see `scrape_concurrency`),
+    except data dumps, which are only scraped when named.
+    The scraped data is sent to the specified output (elasticsearch by default).
 
     Example usage:
     $ scraper scrape --source bitcointalk
@@ -74,14 +126,15 @@ def scrape(source, output):
                         f"Error: Source '{source}' not found. Please check the source name and try again."
                     )
                     return
+            else:
+                sources_to_scrape = [
+                    src
+                    for source_type, source_list in sources.items()
+                    if source_type not in ON_DEMAND_SOURCE_TYPES
+                    for src in source_list
+                ]
 
-                for src in sources_to_scrape:
-                    try:
-                        scraper = ScraperFactory.create_scraper(src, output)
-                        await scraper.run()
-                    except Exception as e:
-                        click.echo(f"Error scraping {src.name}: {str(e)}")
-                        logger.exception("Full traceback:")
+            await scrape_sources(sources_to_scrape, output)
 
         return run_in_reactor(run_scraping())
 
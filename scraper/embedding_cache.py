@@ -0,0 +1,124 @@
+import hashlib
+import mmap
+import os
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+from scraper.config import settings
+from scraper.storage import SQLiteStore
+from scraper.utils import slugify
+
+# Keys looked up per query, below SQLite's limit on bound parameters
+LOOKUP_CHUNK_SIZE = 500
+
+
+class EmbeddingCache(SQLiteStore):
+    """
+    Content-addressed cache of embedding vectors, stored in `DATA_DIR/embeddings`.
+
+    Each model gets a `{model}-{dimensions}.f32` file of float32 rows in native
+    byte order, appended to and read back through a memory map, and a SQLite
+    index from the key of each cached text to its row. Keys hash the model
+    name with the text, so a text is encoded at most once per model and size.
+
+    Several caches (one per scraper) can append to the same file, so row
+    numbers are taken from the end of the file at write time rather than
+    counted by each instance.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS vectors (
+            key TEXT PRIMARY KEY,
+            row INTEGER NOT NULL
+        );
+    """
+
+    def __init__(
+        self, model_name: str, dimensions: int, directory: Optional[str] = None
+    ):
+        directory = directory or os.path.join(settings.DATA_DIR, "embeddings")
+        name = f"{slugify(model_name)}-{dimensions}"
+        super().__init__(name, os.path.join(directory, f"{name}.sqlite"))
+        self.model_name = model_name
+        self.dimensions = dimensions
+        self.row_size = dimensions * array("f").itemsize
+        self.vectors_path = os.path.join(directory, f"{name}.f32")
+
+        # Rows are indexed after they are written, so a partial row left by an
+        # interrupted write is never referenced and can be dropped
+        size = (
+            os.path.getsize(self.vectors_path)
+            if os.path.exists(self.vectors_path)
+            else 0
+        )
+        self._rows = size // self.row_size
+        if size % self.row_size:
+            os.truncate(self.vectors_path, self._rows * self.row_size)
+        self._file = open(self.vectors_path, "ab+")
+        self._mmap: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+
+    def key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode()).hexdigest()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, List[float]]:
+        """Return the cached vectors among the given keys."""
+        keys = list(keys)
+        rows = []
+        for i in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+            chunk = keys[i : i + LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows += self.conn.execute(
+                f"SELECT key, row FROM vectors WHERE key IN ({placeholders})", chunk
+            ).fetchall()
+        if not rows:
+            return {}
+
+        vectors = self._vectors(max(row for _, row in rows) + 1)
+        return {
+            key: vectors[row * self.dimensions : (row + 1) * self.dimensions].tolist()
+            for key, row in rows
+        }
+
+    def put_many(self, vectors: Dict[str, List[float]]):
+        """Append vectors to the cache."""
+        self._file.seek(0, os.SEEK_END)
+        first_row = self._file.tell() // self.row_size
+        data = array("f")
+        index = []
+        for key, vector in vectors.items():
+            if len(vector) != self.dimensions:
+                raise ValueError(
+                    f"Expected {self.dimensions} dimensions, got {len(vector)}"
+                )
+            index.append((key, first_row + len(index)))
+            data.extend(vector)
+
+        self._file.write(data.tobytes())
+        self._file.flush()
+        with self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO vectors VALUES (?, ?)", index)
+
+    def _vectors(self, rows: int) -> memoryview:
+        """Map the vectors file, again if it is missing some of the first `rows`."""
+        if self._view is None or len(self._view) < rows * self.dimensions:
+            self._unmap()
+            self._rows = os.fstat(self._file.fileno()).st_size // self.row_size
+            self._mmap = mmap.mmap(
+                self._file.fileno(), self._rows * self.row_size, access=mmap.ACCESS_READ
+            )
+            self._view = memoryview(self._mmap).cast("f")
+        return self._view
+
+    def _unmap(self):
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def close(self):
+        self._unmap()
+        self._file.close()
+        super().close()
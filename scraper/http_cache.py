@@ -0,0 +1,169 @@
+import json
+import os
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import aiohttp
+import requests
+from loguru import logger
+
+from scraper.config import settings
+from scraper.storage import SQLiteStore
+
+# Headers kept with a cached body, enough to revalidate and decode it
+STORED_HEADERS = {"content-type", "etag", "last-modified"}
+
+
+@dataclass
+class CachedResponse:
+    """A response served from (or just written to) the HTTP cache."""
+
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    stored_at: float
+
+    @property
+    def text(self) -> str:
+        content_type = self.headers.get("content-type", "")
+        encoding = "utf-8"
+        if "charset=" in content_type:
+            encoding = content_type.split("charset=")[-1].split(";")[0].strip()
+        return self.body.decode(encoding, errors="replace")
+
+    def is_fresh(self, ttl: Optional[float]) -> bool:
+        """Whether the response can be served without revalidation."""
+        return ttl is not None and time.time() - self.stored_at < ttl
+
+    def validators(self) -> Dict[str, str]:
+        """Request headers that revalidate this response."""
+        headers = {}
+        if "etag" in self.headers:
+            headers["If-None-Match"] = self.headers["etag"]
+        if "last-modified" in self.headers:
+            headers["If-Modified-Since"] = self.headers["last-modified"]
+        return headers
+
+
+class HttpCache(SQLiteStore):
+    """
+    Persistent HTTP cache keyed by URL, stored in `DATA_DIR/http_cache/{namespace}.sqlite`.
+
+    A cached page is served as-is while it is younger than the caller's TTL.
+    Older pages are revalidated with `If-None-Match`/`If-Modified-Since`, and a
+    `304 Not Modified` answer serves the cached body again. Without a TTL every
+    use revalidates. Only successful responses are cached.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            url TEXT PRIMARY KEY,
+            status INTEGER NOT NULL,
+            headers TEXT NOT NULL,
+            body BLOB NOT NULL,
+            stored_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, namespace: str, path: Optional[str] = None):
+        super().__init__(
+            namespace,
+            path or os.path.join(settings.DATA_DIR, "http_cache", f"{namespace}.sqlite"),
+        )
+        self.namespace = namespace
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        row = self.conn.execute(
+            "SELECT status, headers, body, stored_at FROM responses WHERE url = ?",
+            (url,),
+        ).fetchone()
+        if not row:
+            return None
+        status, headers, body, stored_at = row
+        return CachedResponse(
+            url=url,
+            status=status,
+            headers=json.loads(headers),
+            body=zlib.decompress(body),
+            stored_at=stored_at,
+        )
+
+    def store(
+        self, url: str, status: int, headers: Dict[str, str], body: bytes
+    ) -> CachedResponse:
+        """Cache a successful response; return the response either way."""
+        response = CachedResponse(
+            url=url,
+            status=status,
+            headers={
+                name.lower(): value
+                for name, value in headers.items()
+                if name.lower() in STORED_HEADERS
+            },
+            body=body,
+            stored_at=time.time(),
+        )
+        if status == 200:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                    (
+                        url,
+                        status,
+                        json.dumps(response.headers),
+                        zlib.compress(body),
+                        response.stored_at,
+                    ),
+                )
+        return response
+
+    def touch(self, url: str):
+        """Mark a cached response as revalidated now."""
+        with self.conn:
+            self.conn.execute(
+                "UPDATE responses SET stored_at = ? WHERE url = ?", (time.time(), url)
+            )
+
+    def fetch(
+        self,
+        url: str,
+        ttl: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 60,
+    ) -> CachedResponse:
+        """Fetch a URL with `requests`, going through the cache."""
+        cached = self.get(url)
+        if cached and cached.is_fresh(ttl):
+            return cached
+
+        request_headers = {**(headers or {}), **(cached.validators() if cached else {})}
+        response = requests.get(url, headers=request_headers, timeout=timeout)
+        if response.status_code == 304 and cached:
+            logger.debug(f"{url} not modified, serving it from the cache")
+            self.touch(url)
+            return cached
+        return self.store(url, response.status_code, response.headers, response.content)
+
+    async def fetch_async(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        ttl: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> CachedResponse:
+        """Fetch a URL with an aiohttp session, going through the cache."""
+        cached = self.get(url)
+        if cached and cached.is_fresh(ttl):
+            return cached
+
+        request_headers = {**(headers or {}), **(cached.validators() if cached else {})}
+        async with session.get(url, headers=request_headers) as response:
+            if response.status == 304 and cached:
+                logger.debug(f"{url} not modified, serving it from the cache")
+                self.touch(url)
+                return cached
+            body = await response.read()
+            return self.store(url, response.status, dict(response.headers), body)
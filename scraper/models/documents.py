@@ -1,5 +1,7 @@
+import hashlib
+import json
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import ClassVar, List, Optional, Set
 from datetime import datetime
 
 
@@ -52,6 +54,30 @@ class ScrapedDocument(BaseModel):
     authors: Optional[List[str]] = Field(
         default=None, description="List of authors of the document"
     )
+    content_hash: Optional[str] = Field(
+        default=None,
+        description="Fingerprint of the scraped content, used to skip unchanged documents",
+    )
+
+    # Fields that change on every run or are derived from the content
+    FINGERPRINT_EXCLUDED_FIELDS: ClassVar[Set[str]] = {
+        "indexed_at",
+        "content_hash",
+        "summary_vector_embeddings",
+    }
+
+    def compute_content_hash(self) -> str:
+        """
+        Compute a stable fingerprint of the document's scraped content.
+
+        Fields that vary between runs without the content changing (such as
+        `indexed_at`) are left out, so identical content always yields the same hash.
+        """
+        content = self.model_dump(
+            exclude=self.FINGERPRINT_EXCLUDED_FIELDS, exclude_none=True
+        )
+        serialized = json.dumps(content, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
 
 
 class BitcoinTranscriptDocument(ScrapedDocument):
@@ -26,6 +26,14 @@ class SourceConfig(BaseModel):
     checkout_commit: Optional[
         str
     ] = None  # Specific commit hash to checkout for testing
+    read_from_git_objects: Optional[
+        bool
+    ] = False  # Read files from the commit's tree instead of the working tree
+    clone_depth: Optional[int] = None  # Shallow clone with this many commits
+    clone_filter: Optional[str] = None  # Partial clone filter, e.g. "blob:none"
+    sparse_checkout: Optional[
+        bool
+    ] = False  # Only check out the configured `directories`
 
 
 __all__ = ["SourceConfig", "AnalyzerConfig"]
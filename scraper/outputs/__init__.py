@@ -1,5 +1,13 @@
 from .abstract_output import AbstractOutput
 from .elasticsearch_output import ElasticsearchOutput
+from .async_elasticsearch_output import AsyncElasticsearchOutput
 from .mock_output import MockOutput
+from .jsonl_output import JsonlOutput
 
-__all__ = ["AbstractOutput", "ElasticsearchOutput", "MockOutput"]
+__all__ = [
+    "AbstractOutput",
+    "ElasticsearchOutput",
+    "AsyncElasticsearchOutput",
+    "MockOutput",
+    "JsonlOutput",
+]
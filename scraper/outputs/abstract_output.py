@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from loguru import logger
 
@@ -19,10 +19,17 @@ class AbstractOutput(ABC):
     how data is stored or transmitted (e.g., to a database, file, or API).
     """
 
-    def __init__(self, index_name: str = None, batch_size: int = 100):
+    def __init__(
+        self, index_name: str = None, batch_size: int = 100, source_name: str = None
+    ):
         self.batch_size = batch_size
         self.document_buffer: List[ScrapedDocument] = []
         self.index_name = index_name or settings.DEFAULT_INDEX
+        # Source this output is used for, if any. File outputs include it in
+        # their file names, so that sources scraped concurrently do not share one
+        self.source_name = source_name
+        # Ids of documents that could not be indexed during this run
+        self.failed_document_ids: Set[str] = set()
 
     async def __aenter__(self):
         await self._initialize()
@@ -86,11 +93,25 @@ class AbstractOutput(ABC):
         It's called automatically when the buffer reaches the batch size, but can also be called manually.
         """
         if self.document_buffer:
-            await self._index_batch(self.document_buffer)
+            # Take the batch first, documents added while it is indexed go to the next one
+            batch, self.document_buffer = self.document_buffer, []
+            await self._index_batch(batch)
             logger.debug(
-                f"{self.__class__.__name__}: Indexed {len(self.document_buffer)} documents to {self.index_name}"
+                f"{self.__class__.__name__}: Indexed {len(batch)} documents to {self.index_name}"
             )
-            self.document_buffer.clear()
+
+    @abstractmethod
+    async def delete_documents(self, ids: List[str]):
+        """
+        Delete documents by id.
+
+        Pending documents are flushed first, so a deletion is never overtaken
+        by an earlier buffered write.
+
+        Args:
+            ids (List[str]): Ids of the documents to delete.
+        """
+        pass
 
     @abstractmethod
     async def get_last_successful_run(
@@ -0,0 +1,157 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from elasticsearch import AsyncElasticsearch
+from loguru import logger
+
+from scraper.config import settings
+from scraper.models import ScraperRunDocument
+from scraper.outputs.elasticsearch_output import ElasticsearchOutput
+from scraper.registry import output_registry
+
+
+@output_registry.register("async_elasticsearch")
+class AsyncElasticsearchOutput(ElasticsearchOutput):
+    """
+    Handles document indexing and retrieval using the asynchronous Elasticsearch client.
+
+    Full batches from AbstractOutput's buffer are handed to a bounded queue that is
+    drained by `bulk_concurrency` worker tasks, so several bulk requests can be in
+    flight while the scraper keeps producing documents. When `bulk_queue_size`
+    batches are already waiting, `index_document` blocks until a worker catches up.
+    """
+
+    client_class = AsyncElasticsearch
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bulk_concurrency = settings.config.getint("bulk_concurrency", 4)
+        self.bulk_queue_size = settings.config.getint(
+            "bulk_queue_size", 2 * self.bulk_concurrency
+        )
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+    async def _initialize(self):
+        """Set up the async Elasticsearch client and the bulk workers."""
+        try:
+            self.es = self._acquire_client()
+        except Exception as e:
+            logger.error(f"Failed to initialize Elasticsearch: {e}")
+            raise
+
+        self._queue = asyncio.Queue(maxsize=self.bulk_queue_size)
+        self._workers = [
+            asyncio.create_task(self._bulk_worker(i))
+            for i in range(self.bulk_concurrency)
+        ]
+
+    async def _cleanup(self):
+        """Wait for in-flight batches, then stop the workers and close the client."""
+        if self._queue:
+            await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        client = self._release_client()
+        if client:
+            await client.close()
+
+    async def _bulk_worker(self, worker_id: int):
+        """Index batches from the queue until cancelled."""
+        while True:
+            batch = await self._queue.get()
+            try:
+                await self._index_batch(batch)
+                logger.debug(
+                    f"{self.__class__.__name__} worker {worker_id}: "
+                    f"Indexed {len(batch)} documents to {self.index_name}"
+                )
+            except Exception as e:
+                logger.error(f"Error indexing batch of {len(batch)} documents: {e}")
+                logger.exception("Full traceback:")
+            finally:
+                self._queue.task_done()
+
+    async def flush_buffer(self):
+        """
+        Hand the current buffer over to the bulk workers.
+
+        Unlike the synchronous output this returns as soon as the batch is queued;
+        it only waits when the queue is full.
+        """
+        if not self.document_buffer:
+            return
+        if self._queue is None:
+            # Not initialized (e.g. used outside a context manager)
+            await super().flush_buffer()
+            return
+
+        batch = list(self.document_buffer)
+        self.document_buffer.clear()
+        await self._queue.put(batch)
+
+    async def wait_until_indexed(self):
+        """Flush the buffer and wait until every queued batch is acknowledged."""
+        await self.flush_buffer()
+        if self._queue:
+            await self._queue.join()
+
+    async def delete_documents(self, ids: List[str]):
+        """Delete documents once earlier queued batches have been indexed."""
+        await self.wait_until_indexed()
+        await super().delete_documents(ids)
+
+    async def _send_bulk(self, chunk: List[Tuple[str, bytes]]) -> Dict[str, Any]:
+        response = await self.es.bulk(operations=[lines for _, lines in chunk])
+        return response.body
+
+    async def record_run(self, run_document: ScraperRunDocument) -> None:
+        """Record statistics for a scraper run once all its documents are indexed"""
+        await self.wait_until_indexed()
+        await self.es.index(
+            index=self.index_name,
+            document=run_document.model_dump(exclude_none=True),
+        )
+
+    async def _query_runs(
+        self,
+        source: str,
+        must_terms: dict[str, Any] = None,
+        size: int = 1,
+    ) -> List[ScraperRunDocument]:
+        try:
+            must_clauses = [
+                {"term": {"source": source.lower()}},
+                {"term": {"type": "scraper_run"}},
+            ]
+            if must_terms:
+                must_clauses.extend({"term": {k: v}} for k, v in must_terms.items())
+
+            query = {
+                "query": {"bool": {"must": must_clauses}},
+                "sort": [{"finished_at": {"order": "desc"}}],
+                "size": size,
+            }
+
+            result = await self.es.search(index=self.index_name, body=query)
+            return [
+                ScraperRunDocument(**hit["_source"]) for hit in result["hits"]["hits"]
+            ]
+
+        except Exception as e:
+            logger.error(f"Error querying runs for {source}: {e}")
+            return []
+
+    async def create_index_with_mapping(self, index_name: str, mapping: dict):
+        try:
+            if await self.es.indices.exists(index=index_name):
+                raise ValueError(f"Index {index_name} already exists")
+
+            await self.es.indices.create(index=index_name, body=mapping)
+            logger.info(f"Created index {index_name} with custom mapping")
+
+        except Exception as e:
+            logger.error(f"Error creating index {index_name}: {e}")
+            raise
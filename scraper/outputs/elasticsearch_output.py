@@ -1,5 +1,7 @@
+import asyncio
+import json
 from elasticsearch import Elasticsearch
-from typing import Any, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import logging
 from loguru import logger
 
@@ -14,11 +16,31 @@ class ElasticsearchOutput(AbstractOutput):
     """
     Handles document indexing and retrieval using synchronous Elasticsearch client.
     Leverages AbstractOutput's batching mechanism for efficient indexing.
+
+    Batches are sent through the `_bulk` API. Each request body is capped by
+    both document count (`batch_size`) and size (`bulk_max_bytes`), and items
+    rejected with a retryable status are re-sent on their own.
+
+    Outputs open at the same time (e.g. while several sources are scraped
+    concurrently) share one client, and so one connection pool. The client is
+    closed when the last of them is cleaned up.
     """
 
+    # Per-item statuses worth retrying (throttling and transient node errors)
+    RETRYABLE_STATUSES = {429, 502, 503, 504}
+
+    client_class = Elasticsearch
+    # Shared client and number of open outputs using it, per client class
+    _shared_clients: Dict[type, List[Any]] = {}
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.es = None
+        self.bulk_max_bytes = settings.config.getint(
+            "bulk_max_bytes", 10 * 1024 * 1024
+        )
+        self.bulk_max_retries = settings.config.getint("bulk_max_retries", 3)
+        self.bulk_retry_backoff = settings.config.getfloat("bulk_retry_backoff", 2.0)
 
         # Configure logging levels for noisy libraries
         logging.getLogger("urllib3.connectionpool").setLevel(logging.WARNING)
@@ -27,41 +49,184 @@ class ElasticsearchOutput(AbstractOutput):
     async def _initialize(self):
         """Set up the Elasticsearch client."""
         try:
-            self.es = Elasticsearch(
-                cloud_id=settings.CLOUD_ID, api_key=settings.API_KEY, timeout=120
-            )
+            self.es = self._acquire_client()
         except Exception as e:
             logger.error(f"Failed to initialize Elasticsearch: {e}")
             raise
 
     async def _cleanup(self):
         """Clean up Elasticsearch client resources."""
-        if self.es:
-            self.es.close()
+        client = self._release_client()
+        if client:
+            client.close()
+
+    def _acquire_client(self):
+        """Return the shared client, creating it for the first open output."""
+        shared = self._shared_clients.get(self.client_class)
+        if shared is None:
+            client = self.client_class(
+                cloud_id=settings.CLOUD_ID, api_key=settings.API_KEY, timeout=120
+            )
+            shared = self._shared_clients[self.client_class] = [client, 0]
+        shared[1] += 1
+        return shared[0]
+
+    def _release_client(self):
+        """Stop using the shared client, returning it if it should be closed."""
+        if self.es is None:
+            return None
+        self.es = None
+        shared = self._shared_clients[self.client_class]
+        shared[1] -= 1
+        if shared[1] > 0:
+            return None
+        del self._shared_clients[self.client_class]
+        return shared[0]
 
     async def _index_batch(self, documents: List[ScrapedDocument]):
         """
-        Index a batch of documents directly using Elasticsearch.
+        Index a batch of documents using the Elasticsearch bulk API.
         Uses AbstractOutput's batching mechanism.
         """
-        try:
-            # Process documents one by one in the batch
-            for doc in documents:
-                try:
-                    self.es.index(
-                        index=self.index_name,
-                        id=doc.id,
-                        document=doc.model_dump(exclude_none=True),
+        actions = [
+            self._encode_action(
+                {"index": {"_index": self.index_name, "_id": doc.id}},
+                doc.model_dump(exclude_none=True),
+            )
+            for doc in documents
+        ]
+        succeeded, failed = await self._bulk(actions)
+
+        if failed:
+            self.failed_document_ids.update(item["_id"] for item in failed)
+            logger.error(
+                f"Failed to index {len(failed)} of {len(documents)} documents: "
+                f"{[item['_id'] for item in failed]}"
+            )
+        logger.info(f"Successfully indexed batch of {succeeded} documents")
+
+    async def delete_documents(self, ids: List[str]):
+        """Delete documents by id using the Elasticsearch bulk API."""
+        await self.flush_buffer()
+        actions = [
+            self._encode_action({"delete": {"_index": self.index_name, "_id": doc_id}})
+            for doc_id in ids
+        ]
+        succeeded, failed = await self._bulk(actions)
+
+        if failed:
+            logger.error(
+                f"Failed to delete {len(failed)} of {len(ids)} documents: "
+                f"{[item['_id'] for item in failed]}"
+            )
+        logger.info(f"Successfully deleted {succeeded} documents")
+
+    def _encode_action(
+        self, action: Dict[str, Any], source: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, bytes]:
+        """
+        Serialize a bulk action (and its source, if any) to NDJSON lines.
+
+        Returns:
+            Tuple[str, bytes]: The document id and the encoded lines
+        """
+        lines = [json.dumps(action)]
+        if source is not None:
+            lines.append(json.dumps(source, default=str))
+        doc_id = next(iter(action.values()))["_id"]
+        return doc_id, ("\n".join(lines) + "\n").encode("utf-8")
+
+    def _chunk_actions(
+        self, actions: List[Tuple[str, bytes]]
+    ) -> Iterator[List[Tuple[str, bytes]]]:
+        """Split encoded actions into request bodies bounded by count and bytes."""
+        chunk, chunk_bytes = [], 0
+        for action in actions:
+            size = len(action[1])
+            if chunk and (
+                len(chunk) >= self.batch_size
+                or chunk_bytes + size > self.bulk_max_bytes
+            ):
+                yield chunk
+                chunk, chunk_bytes = [], 0
+            chunk.append(action)
+            chunk_bytes += size
+        if chunk:
+            yield chunk
+
+    def _parse_bulk_response(
+        self, response: Dict[str, Any], chunk: List[Tuple[str, bytes]]
+    ) -> Tuple[int, List[Tuple[str, bytes]], List[Dict[str, Any]]]:
+        """
+        Split a bulk response into successes, retryable items and hard failures.
+
+        Items in the response are returned in request order, so they map
+        one-to-one onto the actions in `chunk`.
+        """
+        if not response.get("errors"):
+            return len(chunk), [], []
+
+        succeeded, retry, failed = 0, [], []
+        for action, item in zip(chunk, response["items"]):
+            result = next(iter(item.values()))
+            status = result.get("status", 500)
+            if status < 300 or (status == 404 and "delete" in item):
+                succeeded += 1
+            elif status in self.RETRYABLE_STATUSES:
+                retry.append(action)
+            else:
+                failed.append(result)
+                logger.error(
+                    f"Bulk operation failed for document {result.get('_id')}: "
+                    f"{result.get('error')}"
+                )
+        return succeeded, retry, failed
+
+    async def _send_bulk(self, chunk: List[Tuple[str, bytes]]) -> Dict[str, Any]:
+        """Send a single NDJSON request body to the bulk API."""
+        response = self.es.bulk(operations=[lines for _, lines in chunk])
+        return response.body
+
+    async def _bulk(
+        self, actions: List[Tuple[str, bytes]]
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Send encoded actions through the bulk API, retrying only failed items.
+
+        Returns:
+            Tuple[int, List[Dict]]: Number of successful operations and the
+            per-item results of operations that could not be completed
+        """
+        succeeded, failed = 0, []
+        for chunk in self._chunk_actions(actions):
+            pending = chunk
+            for attempt in range(self.bulk_max_retries + 1):
+                if attempt:
+                    delay = self.bulk_retry_backoff * 2 ** (attempt - 1)
+                    logger.warning(
+                        f"Retrying {len(pending)} bulk operations in {delay}s "
+                        f"(attempt {attempt}/{self.bulk_max_retries})"
                     )
+                    await asyncio.sleep(delay)
+                try:
+                    response = await self._send_bulk(pending)
                 except Exception as e:
-                    logger.error(f"Failed to index document {doc.id}: {e}")
+                    # The whole request failed, so every item is retried
+                    logger.error(f"Bulk request failed: {e}")
                     continue
 
-            logger.info(f"Successfully indexed batch of {len(documents)} documents")
+                ok, pending, errors = self._parse_bulk_response(response, pending)
+                succeeded += ok
+                failed.extend(errors)
+                if not pending:
+                    break
 
-        except Exception as e:
-            logger.error(f"Error during batch indexing: {e}")
-            logger.exception("Full traceback:")
+            failed.extend(
+                {"_id": doc_id, "error": "bulk retries exhausted"}
+                for doc_id, _ in pending
+            )
+
+        return succeeded, failed
 
     async def record_run(self, run_document: ScraperRunDocument) -> None:
         """Record statistics for a scraper run"""
@@ -0,0 +1,139 @@
+import gzip
+import json
+import os
+from datetime import datetime
+from typing import IO, List, Optional
+
+from loguru import logger
+
+from scraper.config import settings
+from scraper.models import ScrapedDocument, ScraperRunDocument
+from scraper.outputs import AbstractOutput
+from scraper.registry import output_registry
+from scraper.utils import slugify
+
+try:
+    import zstandard
+except ImportError:  # zstd compression is optional
+    zstandard = None
+
+
+@output_registry.register("jsonl")
+class JsonlOutput(AbstractOutput):
+    """
+    Writes documents as JSON Lines under `DATA_DIR/jsonl_output`.
+
+    Every run of a source gets its own documents file, to which each batch is appended
+    with a single write, so the cost of a run grows linearly with its size.
+    Deleted documents are written as `{"id": ..., "deleted": true}` lines.
+    Run records are appended to a sidecar file shared by all runs of an index,
+    which is what `get_last_successful_run` reads back.
+    """
+
+    EXTENSIONS = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.output_dir = os.path.join(settings.DATA_DIR, "jsonl_output")
+        self.compression = (
+            settings.config.get("jsonl_output_compression", "none").strip().lower()
+        )
+        if self.compression not in self.EXTENSIONS:
+            raise ValueError(
+                f"Unknown jsonl_output_compression '{self.compression}', "
+                f"expected one of {list(self.EXTENSIONS)}"
+            )
+        if self.compression == "zstd" and zstandard is None:
+            raise ValueError(
+                "jsonl_output_compression = zstd requires the zstandard package"
+            )
+        self.excluded_fields = {
+            field.strip()
+            for field in settings.config.get("jsonl_output_excluded_fields", "").split(
+                ","
+            )
+            if field.strip()
+        }
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        name = (
+            f"{self.index_name}_{slugify(self.source_name)}"
+            if self.source_name
+            else self.index_name
+        )
+        self.output_file = os.path.join(
+            self.output_dir,
+            f"{name}_{timestamp}.jsonl{self.EXTENSIONS[self.compression]}",
+        )
+        self.runs_file = os.path.join(self.output_dir, f"{self.index_name}.runs.jsonl")
+        self._file: Optional[IO[bytes]] = None
+
+    async def _initialize(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._file = self._open(self.output_file)
+
+    async def _cleanup(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+        logger.info(
+            f"JSONL output written to {self.output_file} (excluded fields: {self.excluded_fields})"
+        )
+
+    def _open(self, path: str) -> IO[bytes]:
+        """Open the documents file for appending with the configured compression"""
+        if self.compression == "gzip":
+            return gzip.open(path, "ab")
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor().stream_writer(open(path, "ab"))
+        return open(path, "ab")
+
+    def _write_lines(self, records: List[dict]):
+        """Append records to the documents file with a single write"""
+        if self._file is None:
+            # Used outside a context manager
+            os.makedirs(self.output_dir, exist_ok=True)
+            self._file = self._open(self.output_file)
+        data = "".join(json.dumps(record, default=str) + "\n" for record in records)
+        self._file.write(data.encode("utf-8"))
+
+    async def _index_batch(self, documents: List[ScrapedDocument]):
+        """Index a batch of documents"""
+        self._write_lines(
+            [
+                doc.model_dump(exclude_none=True, exclude=self.excluded_fields)
+                for doc in documents
+            ]
+        )
+
+    async def delete_documents(self, ids: List[str]):
+        """Append a tombstone line for each deleted document"""
+        await self.flush_buffer()
+        self._write_lines([{"id": doc_id, "deleted": True} for doc_id in ids])
+
+    async def get_last_successful_run(
+        self, source: str
+    ) -> Optional[ScraperRunDocument]:
+        """Get the most recent successful run for a source from the runs file"""
+        if not os.path.exists(self.runs_file):
+            return None
+
+        last_run = None
+        with open(self.runs_file, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                run = json.loads(line)
+                if run.get("source", "").lower() != source.lower() or not run.get(
+                    "success"
+                ):
+                    continue
+                if last_run is None or run["finished_at"] >= last_run["finished_at"]:
+                    last_run = run
+
+        return ScraperRunDocument(**last_run) if last_run else None
+
+    async def record_run(self, run_document: ScraperRunDocument) -> None:
+        """Append the run to the runs file"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        with open(self.runs_file, "a") as f:
+            f.write(run_document.model_dump_json(exclude_none=True) + "\n")
@@ -9,15 +9,19 @@ from scraper.models import ScrapedDocument, ScraperRunDocument
 from scraper.outputs import AbstractOutput
 from scraper.config import settings
 from scraper.registry import output_registry
+from scraper.utils import slugify
 
 
 @output_registry.register("mock")
 class MockOutput(AbstractOutput):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.output_file = (
-            f"mock_output_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        prefix = (
+            f"mock_output_{slugify(self.source_name)}"
+            if self.source_name
+            else "mock_output"
         )
+        self.output_file = f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         self.excluded_fields = [
             field.strip()
             for field in settings.config.get("mock_output_excluded_fields", "").split(
@@ -30,6 +34,7 @@ class MockOutput(AbstractOutput):
         self._write_json(
             {
                 "documents": [],
+                "deleted": [],
                 "runs": [],  # Store runs as an array for future extensibility
             }
         )
@@ -49,7 +54,7 @@ class MockOutput(AbstractOutput):
         if os.path.exists(self.output_file):
             with open(self.output_file, "r") as f:
                 return json.load(f)
-        return {"documents": [], "runs": []}
+        return {"documents": [], "deleted": [], "runs": []}
 
     def _append_documents(self, documents: List[Dict]):
         """Append documents to the output file"""
@@ -66,6 +71,13 @@ class MockOutput(AbstractOutput):
 
         self._append_documents(docs_to_index)
 
+    async def delete_documents(self, ids: List[str]):
+        """Record the ids of deleted documents"""
+        await self.flush_buffer()
+        data = self._read_json()
+        data["deleted"].extend(ids)
+        self._write_json(data)
+
     async def get_last_successful_run(
         self, source: str
     ) -> Optional[ScraperRunDocument]:
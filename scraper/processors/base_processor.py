@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from scraper.models import ScrapedDocument
 
 
 class BaseProcessor(ABC):
+    # Registered names of processors that must run before this one, when the
+    # source uses them. Processors without a dependency between them run
+    # concurrently, each on its own copy of the document.
+    depends_on: List[str] = []
+
     @abstractmethod
     async def process(self, document: ScrapedDocument) -> ScrapedDocument:
         """
@@ -17,3 +22,28 @@ class BaseProcessor(ABC):
             Dict[ScrapedDocument]: The processed document.
         """
         pass
+
+    async def process_batch(
+        self, documents: List[ScrapedDocument]
+    ) -> List[ScrapedDocument]:
+        """
+        Process several documents at once.
+
+        Override this method when the processor is more efficient on batches.
+        By default, each document goes through `process` in turn.
+
+        Args:
+            documents (List[ScrapedDocument]): The documents to process.
+
+        Returns:
+            List[ScrapedDocument]: The processed documents, in the same order.
+        """
+        return [await self.process(document) for document in documents]
+
+    def close(self):
+        """
+        Release resources held by the processor, such as open caches.
+
+        Called by the `ProcessorManager` once the scrape is over.
+        """
+        pass
@@ -0,0 +1,90 @@
+import hashlib
+import math
+import re
+from abc import ABC, abstractmethod
+from typing import List
+
+from scraper.config import settings
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # local transformer models are optional
+    SentenceTransformer = None
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class BaseEncoder(ABC):
+    """Turns texts into embedding vectors of a fixed size."""
+
+    model_name: str
+    dimensions: int
+
+    @abstractmethod
+    def encode(self, texts: List[str]) -> List[List[float]]:
+        """
+        Encode a batch of texts.
+
+        This is CPU-bound and blocking, callers should run it off the event loop.
+
+        Returns:
+            List[List[float]]: One vector of `dimensions` floats per text.
+        """
+        pass
+
+
+class HashingEncoder(BaseEncoder):
+    """
+    Dependency-free encoder hashing the words of a text into a fixed number of
+    buckets, with a hashed sign, then normalizing the vector.
+
+    It captures word overlap only, but is deterministic and fast.
+    """
+
+    def __init__(self, dimensions: int = 384):
+        self.dimensions = dimensions
+        self.model_name = "hashing"
+
+    def encode(self, texts: List[str]) -> List[List[float]]:
+        return [self._encode(text) for text in texts]
+
+    def _encode(self, text: str) -> List[float]:
+        vector = [0.0] * self.dimensions
+        for token in TOKEN_PATTERN.findall(text.lower()):
+            digest = hashlib.blake2b(token.encode(), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            vector[value % self.dimensions] += 1.0 if value >> 63 else -1.0
+        norm = math.sqrt(sum(x * x for x in vector))
+        return [x / norm for x in vector] if norm else vector
+
+
+class SentenceTransformerEncoder(BaseEncoder):
+    """Encoder running a sentence-transformers model locally."""
+
+    def __init__(self, model_name: str):
+        if SentenceTransformer is None:
+            raise ValueError(
+                "embedding_encoder = sentence_transformers requires the "
+                "sentence-transformers package"
+            )
+        self.model_name = model_name
+        self.model = SentenceTransformer(model_name)
+        self.dimensions = self.model.get_sentence_embedding_dimension()
+
+    def encode(self, texts: List[str]) -> List[List[float]]:
+        return self.model.encode(texts, batch_size=len(texts)).tolist()
+
+
+def create_encoder() -> BaseEncoder:
+    """Create the encoder selected by `embedding_encoder` in the configuration."""
+    encoder = settings.config.get("embedding_encoder", "hashing").strip().lower()
+    if encoder == "hashing":
+        return HashingEncoder(settings.config.getint("embedding_dimensions", 384))
+    if encoder == "sentence_transformers":
+        return SentenceTransformerEncoder(
+            settings.config.get("embedding_model", "all-MiniLM-L6-v2")
+        )
+    raise ValueError(
+        f"Unknown embedding_encoder '{encoder}', "
+        "expected one of ['hashing', 'sentence_transformers']"
+    )
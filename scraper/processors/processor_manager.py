@@ -1,13 +1,214 @@
-from typing import List
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from scraper.config import settings
 from scraper.models import ScrapedDocument
+from scraper.registry import processor_registry
 from .base_processor import BaseProcessor
 
+DocumentSink = Callable[[ScrapedDocument], Awaitable[None]]
+
 
 class ProcessorManager:
-    def __init__(self, processors: List[BaseProcessor]):
+    """
+    Runs documents through the configured processors.
+
+    Processors are grouped into stages from their `depends_on` declarations:
+    a processor runs in the stage after the last of its dependencies. The
+    processors of a stage run concurrently, each on a copy of the document,
+    and the fields each of them changed are merged back into the document
+    (on conflict, the processor listed last in the source wins).
+
+    With a batch size above 1 (`processor_batch_size`), documents given to
+    `submit` are queued and processed together, so processors that implement
+    `process_batch` see whole batches. A batch is processed once it is full or
+    `processor_max_latency` seconds after its first document was queued,
+    whichever comes first. `flush` processes whatever is still queued.
+    """
+
+    def __init__(
+        self,
+        processors: List[BaseProcessor],
+        batch_size: Optional[int] = None,
+        max_latency: Optional[float] = None,
+    ):
         self.processors = processors
+        self.stages = self._resolve_stages(processors)
+        self.batch_size = (
+            batch_size
+            if batch_size is not None
+            else settings.config.getint("processor_batch_size", 1)
+        )
+        self.max_latency = (
+            max_latency
+            if max_latency is not None
+            else settings.config.getfloat("processor_max_latency", 1.0)
+        )
+        self._pending: List[Tuple[ScrapedDocument, DocumentSink]] = []
+        self._timer: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        # Error raised by a batch flushed from the latency timer
+        self._error: Optional[Exception] = None
+
+    @staticmethod
+    def _resolve_stages(
+        processors: List[BaseProcessor],
+    ) -> List[List[BaseProcessor]]:
+        """
+        Group processors into stages that only depend on earlier stages.
+
+        Dependencies on processors the source does not use are ignored.
+        """
+        dependencies: Dict[int, List[int]] = {}
+        for i, processor in enumerate(processors):
+            dependency_classes = tuple(
+                processor_registry.get(name) for name in processor.depends_on
+            )
+            dependencies[i] = [
+                j
+                for j, other in enumerate(processors)
+                if j != i
+                and dependency_classes
+                and isinstance(other, dependency_classes)
+            ]
+
+        levels: Dict[int, int] = {}
+        remaining = set(dependencies)
+        while remaining:
+            ready = [
+                i for i in remaining if all(j in levels for j in dependencies[i])
+            ]
+            if not ready:
+                names = [processors[i].__class__.__name__ for i in remaining]
+                raise ValueError(f"Circular processor dependencies between {names}")
+            for i in ready:
+                levels[i] = 1 + max((levels[j] for j in dependencies[i]), default=-1)
+            remaining.difference_update(ready)
+
+        stages: List[List[BaseProcessor]] = [
+            [] for _ in range(max(levels.values(), default=-1) + 1)
+        ]
+        for i in sorted(levels):
+            stages[levels[i]].append(processors[i])
+        return stages
+
+    @property
+    def batching(self) -> bool:
+        return self.batch_size > 1 and bool(self.processors)
 
     async def process_document(self, document: ScrapedDocument) -> ScrapedDocument:
-        for processor in self.processors:
-            document = await processor.process(document)
+        for stage in self.stages:
+            if len(stage) == 1:
+                document = await stage[0].process(document)
+                continue
+            results = await asyncio.gather(
+                *(
+                    processor.process(document.model_copy(deep=True))
+                    for processor in stage
+                )
+            )
+            document = self._merge(document, results)
         return document
+
+    async def process_batch(
+        self, documents: List[ScrapedDocument]
+    ) -> List[ScrapedDocument]:
+        for stage in self.stages:
+            if len(stage) == 1:
+                documents = await stage[0].process_batch(documents)
+                continue
+            results = await asyncio.gather(
+                *(
+                    processor.process_batch(
+                        [doc.model_copy(deep=True) for doc in documents]
+                    )
+                    for processor in stage
+                )
+            )
+            documents = [
+                self._merge(document, [result[i] for result in results])
+                for i, document in enumerate(documents)
+            ]
+        return documents
+
+    @staticmethod
+    def _merge(
+        document: ScrapedDocument, results: List[ScrapedDocument]
+    ) -> ScrapedDocument:
+        """Apply the fields each result changed to the document."""
+        changes = {}
+        for result in results:
+            for field in type(document).model_fields:
+                value = getattr(result, field)
+                if value != getattr(document, field):
+                    if field in changes and changes[field] != value:
+                        logger.debug(
+                            f"Processors disagree on {field} of {document.id}, "
+                            "keeping the last one"
+                        )
+                    changes[field] = value
+        return document.model_copy(update=changes)
+
+    async def submit(self, document: ScrapedDocument, sink: DocumentSink):
+        """
+        Process a document and pass the result to `sink`.
+
+        When batching, the document is queued and `sink` is called once its
+        batch has been processed.
+        """
+        if not self.batching:
+            await sink(await self.process_document(document))
+            return
+
+        self._raise_timer_error()
+        self._pending.append((document, sink))
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_latency())
+
+    async def flush(self):
+        """Process the queued documents and pass them to their sinks."""
+        if self._timer:
+            self._timer.cancel()
+        self._timer = None
+
+        async with self._lock:
+            pending, self._pending = self._pending, []
+            if pending:
+                documents = await self.process_batch([doc for doc, _ in pending])
+                for (_, sink), document in zip(pending, documents):
+                    await sink(document)
+        self._raise_timer_error()
+
+    async def close(self):
+        """
+        Process the documents still queued, then close the processors.
+
+        Called before the output is closed, whether scraping succeeded or not,
+        so the latency timer can no longer flush a batch into a closed output.
+        Errors are logged rather than raised, as another one may be on its way.
+        """
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Error processing the remaining documents: {e}")
+        for processor in self.processors:
+            processor.close()
+
+    async def _flush_after_latency(self):
+        await asyncio.sleep(self.max_latency)
+        # Once the batch is being processed, cancelling would lose its documents
+        self._timer = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Error processing a batch of documents: {e}")
+            self._error = e
+
+    def _raise_timer_error(self):
+        if self._error:
+            error, self._error = self._error, None
+            raise error
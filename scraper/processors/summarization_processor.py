@@ -1,12 +1,78 @@
+import asyncio
+from typing import List
+
+from scraper.config import settings
 from scraper.models import ScrapedDocument
+from scraper.storage import SummaryCache
 from .base_processor import BaseProcessor
+from .summarizers import create_summarizer, split_markdown
 from scraper.registry import processor_registry
 
 
 @processor_registry.register("summarization")
 class SummarizationProcessor(BaseProcessor):
+    """
+    Summarizes document bodies with the engine selected by `summarization_engine`.
+
+    Summaries are kept in a `SummaryCache`, so unchanged bodies are never
+    summarized again. Bodies longer than the engine's `max_input_chars` are
+    split on markdown headings, the chunks are summarized concurrently (and
+    cached on their own, so only changed chunks cost a call) and their
+    summaries are combined. At most `summarization_concurrency` calls to the
+    engine run at once.
+    """
+
+    def __init__(self):
+        self.summarizer = create_summarizer()
+        self.cache = (
+            SummaryCache(self.summarizer.model_name)
+            if self.summarizer.cached
+            else None
+        )
+        self._semaphore = asyncio.Semaphore(
+            settings.config.getint("summarization_concurrency", 4)
+        )
+
     async def process(self, document: ScrapedDocument) -> ScrapedDocument:
-        # Placeholder logic - replace with actual summary generation
         if document.body:
-            document.summary = document.body[:200] + "..."
+            document.summary = await self.summarize(document.body)
         return document
+
+    async def process_batch(
+        self, documents: List[ScrapedDocument]
+    ) -> List[ScrapedDocument]:
+        return list(await asyncio.gather(*(self.process(doc) for doc in documents)))
+
+    async def summarize(self, text: str) -> str:
+        summary = self.cache.get(text) if self.cache else None
+        if summary is not None:
+            return summary
+
+        max_chars = self.summarizer.max_input_chars
+        if max_chars and len(text) > max_chars:
+            summary = await self._map_reduce(text, max_chars)
+        else:
+            async with self._semaphore:
+                summary = await self.summarizer.summarize(text)
+
+        if self.cache:
+            self.cache.put(text, summary)
+        return summary
+
+    async def _map_reduce(self, text: str, max_chars: int) -> str:
+        chunks = split_markdown(text, max_chars)
+        if len(chunks) == 1:
+            # Only surrounding whitespace was over the limit, nothing to combine
+            return await self.summarize(chunks[0])
+
+        summaries = await asyncio.gather(*(self.summarize(chunk) for chunk in chunks))
+        joined = "\n\n".join(summaries)
+        if max_chars < len(joined) < len(text):
+            # Too many chunks to combine at once, summarize the summaries
+            return await self.summarize(joined)
+        async with self._semaphore:
+            return await self.summarizer.combine(summaries)
+
+    def close(self):
+        if self.cache:
+            self.cache.close()
@@ -0,0 +1,139 @@
+import re
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from openai import AsyncOpenAI
+
+from scraper.config import settings
+
+HEADING_PATTERN = re.compile(r"^#{1,6}\s")
+CODE_FENCE = "```"
+
+
+class BaseSummarizer(ABC):
+    """Turns a text into a short summary."""
+
+    model_name: str
+    # Longest text summarized in a single call, longer ones are split into
+    # chunks whose summaries are combined (None: no limit)
+    max_input_chars: Optional[int] = None
+    # Whether summaries are worth keeping in the summary cache
+    cached: bool = True
+
+    @abstractmethod
+    async def summarize(self, text: str) -> str:
+        pass
+
+    async def combine(self, summaries: List[str]) -> str:
+        """Merge the summaries of consecutive chunks of a document."""
+        return await self.summarize("\n\n".join(summaries))
+
+
+class TruncateSummarizer(BaseSummarizer):
+    """Uses the beginning of the text as its summary."""
+
+    model_name = "truncate"
+    cached = False
+
+    def __init__(self, length: int = 200):
+        self.length = length
+
+    async def summarize(self, text: str) -> str:
+        return text[: self.length] + "..."
+
+
+class OpenAISummarizer(BaseSummarizer):
+    """Summarizes with an OpenAI chat completion model."""
+
+    SUMMARIZE_PROMPT = (
+        "Summarize the following text in at most three sentences. Keep technical "
+        "terms, names and numbers exact."
+    )
+    COMBINE_PROMPT = (
+        "The following are summaries of consecutive parts of one document. "
+        "Merge them into a single summary of at most three sentences."
+    )
+
+    def __init__(self, model: str, max_input_chars: int):
+        self.model = model
+        self.model_name = f"openai:{model}"
+        self.max_input_chars = max_input_chars
+        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+
+    async def summarize(self, text: str) -> str:
+        return await self._complete(self.SUMMARIZE_PROMPT, text)
+
+    async def combine(self, summaries: List[str]) -> str:
+        return await self._complete(self.COMBINE_PROMPT, "\n\n".join(summaries))
+
+    async def _complete(self, instructions: str, text: str) -> str:
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": instructions},
+                {"role": "user", "content": text},
+            ],
+        )
+        return response.choices[0].message.content.strip()
+
+
+def split_markdown(text: str, max_chars: int) -> List[str]:
+    """
+    Split markdown into chunks of at most `max_chars`.
+
+    Chunks start at headings (outside code blocks) and hold as many
+    consecutive sections as fit. A section that is too long on its own is
+    split between paragraphs, and a paragraph that is still too long is cut.
+    """
+    sections: List[str] = []
+    lines: List[str] = []
+    in_code = False
+    for line in text.splitlines(keepends=True):
+        if line.lstrip().startswith(CODE_FENCE):
+            in_code = not in_code
+        if not in_code and HEADING_PATTERN.match(line) and lines:
+            sections.append("".join(lines))
+            lines = []
+        lines.append(line)
+    if lines:
+        sections.append("".join(lines))
+
+    pieces: List[str] = []
+    for section in sections:
+        if len(section) <= max_chars:
+            pieces.append(section)
+            continue
+        for paragraph in re.split(r"(?<=\n\n)", section):
+            pieces += [
+                paragraph[i : i + max_chars]
+                for i in range(0, len(paragraph), max_chars)
+            ]
+
+    chunks: List[str] = []
+    for piece in pieces:
+        if chunks and len(chunks[-1]) + len(piece) <= max_chars:
+            chunks[-1] += piece
+        else:
+            chunks.append(piece)
+    return [chunk.strip() for chunk in chunks if chunk.strip()]
+
+
+def create_summarizer() -> BaseSummarizer:
+    """Create the summarizer selected by `summarization_engine` in the configuration."""
+    engine = settings.config.get("summarization_engine", "truncate").strip().lower()
+    if engine == "truncate":
+        return TruncateSummarizer()
+    if engine == "openai":
+        return OpenAISummarizer(
+            model=settings.config.get(
+                "summarization_model",
+                settings.config.get("chat_completion_model", "gpt-4o-mini"),
+            ),
+            max_input_chars=settings.config.getint(
+                "summarization_max_input_chars", 12000
+            ),
+        )
+    raise ValueError(
+        f"Unknown summarization_engine '{engine}', "
+        "expected one of ['truncate', 'openai']"
+    )
@@ -6,13 +6,24 @@ from loguru import logger
 from scraper.config import get_project_root
 from scraper.models import ScrapedDocument
 from .base_processor import BaseProcessor
+from .topic_matcher import TopicMatcher
 from scraper.registry import processor_registry
 
 
 @processor_registry.register("topic_extractor")
 class TopicExtractorProcessor(BaseProcessor):
+    """
+    Tags documents with the topics of `topics_list.json` they mention most.
+
+    Topics are matched as whole words, case-insensitively, in a single pass
+    over the body.
+    """
+
+    MAX_TOPICS = 5
+
     def __init__(self):
         self.topics_list = self.load_topics()
+        self.matcher = TopicMatcher(self.topics_list)
 
     def load_topics(self) -> List[str]:
         topics_path = Path(get_project_root()) / "processors" / "topics_list.json"
@@ -36,11 +47,6 @@ class TopicExtractorProcessor(BaseProcessor):
             return []
 
     async def process(self, document: ScrapedDocument) -> ScrapedDocument:
-        # Placeholder logic - replace with actual topic extraction
         if document.body:
-            document.tags = [
-                topic
-                for topic in self.topics_list
-                if topic.lower() in document.body.lower()
-            ][:5]
+            document.tags = self.matcher.top(document.body, self.MAX_TOPICS)
         return document
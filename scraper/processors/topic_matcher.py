@@ -0,0 +1,110 @@
+from collections import Counter, deque
+from typing import Dict, List
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class TopicMatcher:
+    """
+    Finds whole-word occurrences of many topics in a single pass over a text.
+
+    The topics are compiled once into an Aho-Corasick automaton over their
+    lowercased form, so matching is case-insensitive and its cost depends on
+    the length of the text, not on the number of topics. A match only counts
+    when it is not part of a longer word: "taproot" matches in "taproot's"
+    but not in "taprooted". Edges of a topic that are not word characters
+    (as in "C++") need no boundary.
+    """
+
+    def __init__(self, topics: List[str]):
+        self._order = {topic: i for i, topic in reversed(list(enumerate(topics)))}
+        # Topics sharing a lowercased form are reported together
+        self.patterns: List[str] = []
+        self.topics: List[List[str]] = []
+        indexes: Dict[str, int] = {}
+        for topic in topics:
+            pattern = topic.lower()
+            if not pattern:
+                continue
+            if pattern not in indexes:
+                indexes[pattern] = len(self.patterns)
+                self.patterns.append(pattern)
+                self.topics.append([])
+            self.topics[indexes[pattern]].append(topic)
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._build()
+
+    def _build(self):
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            self._output[state].append(index)
+
+        # Breadth-first, so the failure state of every node is built before it.
+        # Each state's transitions are completed with those of its failure
+        # state, so scanning never has to follow failure links.
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            fail = self._fail[state]
+            self._output[state] += self._output[fail]
+            trie_transitions = self._goto[state]
+            self._goto[state] = {**self._goto[fail], **trie_transitions}
+            for char, next_state in trie_transitions.items():
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                queue.append(next_state)
+
+    def count(self, text: str) -> Counter:
+        """Count the whole-word occurrences of each topic in the text."""
+        counts: Counter = Counter()
+        text = text.lower()
+        goto, output = self._goto, self._output
+        state = 0
+        for end, char in enumerate(text):
+            state = goto[state].get(char, 0)
+            if not output[state]:
+                continue
+            for index in output[state]:
+                if self._is_whole_word(text, end, self.patterns[index]):
+                    counts[index] += 1
+
+        topic_counts: Counter = Counter()
+        for index, count in counts.items():
+            for topic in self.topics[index]:
+                topic_counts[topic] = count
+        return topic_counts
+
+    @staticmethod
+    def _is_whole_word(text: str, end: int, pattern: str) -> bool:
+        start = end - len(pattern) + 1
+        if _is_word_char(pattern[0]) and start > 0 and _is_word_char(text[start - 1]):
+            return False
+        if (
+            _is_word_char(pattern[-1])
+            and end + 1 < len(text)
+            and _is_word_char(text[end + 1])
+        ):
+            return False
+        return True
+
+    def top(self, text: str, limit: int) -> List[str]:
+        """
+        The topics found in the text, most frequent first.
+
+        Ties keep the order of the topics list.
+        """
+        counts = self.count(text)
+        return sorted(
+            counts, key=lambda topic: (-counts[topic], self._order[topic])
+        )[:limit]
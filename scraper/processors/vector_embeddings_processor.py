@@ -1,15 +1,59 @@
+import asyncio
+from typing import List
+
+from scraper.config import settings
+from scraper.embedding_cache import EmbeddingCache
 from scraper.models import ScrapedDocument
 from .base_processor import BaseProcessor
+from .encoders import create_encoder
 from scraper.registry import processor_registry
 
 
 @processor_registry.register("vector_embeddings")
 class VectorEmbeddingsProcessor(BaseProcessor):
+    """
+    Embeds document summaries with the encoder selected by `embedding_encoder`.
+
+    Vectors are looked up in an `EmbeddingCache` first, so an unchanged summary
+    is never encoded again. The others are encoded on a worker thread, in
+    batches of `embedding_batch_size`.
+    """
+
+    depends_on = ["summarization"]
+
+    def __init__(self):
+        self.encoder = create_encoder()
+        self.batch_size = settings.config.getint("embedding_batch_size", 32)
+        self.cache = EmbeddingCache(self.encoder.model_name, self.encoder.dimensions)
+
     async def process(self, document: ScrapedDocument) -> ScrapedDocument:
-        # Placeholder logic - replace with actual vector embedding generation
-        if document.summary:
-            # This is just a dummy representation, not a real embedding
-            document.summary_vector_embeddings = [
-                float(ord(c)) for c in document.summary[:10]
-            ]
-        return document
+        return (await self.process_batch([document]))[0]
+
+    async def process_batch(
+        self, documents: List[ScrapedDocument]
+    ) -> List[ScrapedDocument]:
+        keys = [
+            self.cache.key(doc.summary) if doc.summary else None for doc in documents
+        ]
+        texts = {
+            key: doc.summary for key, doc in zip(keys, documents) if key is not None
+        }
+
+        vectors = self.cache.get_many(texts)
+        missing = [key for key in texts if key not in vectors]
+        for i in range(0, len(missing), self.batch_size):
+            batch = missing[i : i + self.batch_size]
+            encoded = await asyncio.to_thread(
+                self.encoder.encode, [texts[key] for key in batch]
+            )
+            new_vectors = dict(zip(batch, encoded))
+            self.cache.put_many(new_vectors)
+            vectors.update(new_vectors)
+
+        for key, doc in zip(keys, documents):
+            if key is not None:
+                doc.summary_vector_embeddings = vectors[key]
+        return documents
+
+    def close(self):
+        self.cache.close()
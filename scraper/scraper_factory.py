@@ -45,6 +45,7 @@ class ScraperFactory:
             output = output_class(
                 index_name=settings.DEFAULT_INDEX,
                 batch_size=settings.config.getint("batch_size", 100),
+                source_name=source.name,
             )
 
             scraper = scraper_class(source, output, processor_manager)
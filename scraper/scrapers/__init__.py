@@ -10,6 +10,7 @@ from .scrapy.scrapy_base import ScrapyScraper
 from .scrapy.spider_base import BaseSpider
 from .scrapy.bitcointalk import BitcoinTalkScraper
 from .stackexchange import StackExchangeScraper
+from .stackexchange_dump import StackExchangeDumpScraper
 
 __all__ = [
     "BaseScraper",
@@ -28,4 +29,6 @@ __all__ = [
     "BitcoinTalkScraper",
     # api
     "StackExchangeScraper",
+    # dump
+    "StackExchangeDumpScraper",
 ]
@@ -1,12 +1,14 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from loguru import logger
 
+from scraper.config import settings
 from scraper.models import RunStats, ScraperRunDocument, ScrapedDocument, SourceConfig
 from scraper.outputs import AbstractOutput
 from scraper.processors import ProcessorManager
+from scraper.storage import FingerprintStore
 
 
 class BaseScraper(ABC):
@@ -18,6 +20,10 @@ class BaseScraper(ABC):
     like interfacing with the output handler.
     """
 
+    # Pool of concurrency slots this scraper takes when several sources are
+    # scraped at once (see `scrape_concurrency_{pool}`)
+    resource_pool = "api"
+
     def __init__(
         self,
         config: SourceConfig,
@@ -38,6 +44,10 @@ class BaseScraper(ABC):
         self.processor_manager = processor_manager
         self.resources_to_process = None
         self.total_documents_processed = 0
+        self.total_documents_unchanged = 0
+        self.total_documents_deleted = 0
+        self.fingerprints: Optional[FingerprintStore] = None
+        self._skip_unchanged = False
         self._error: Optional[str] = None
         self._success = True
         self._started_at: Optional[str] = None
@@ -76,18 +86,45 @@ class BaseScraper(ABC):
         Process a single document through the processor manager and index it.
 
         This method applies all registered processors to the document and then
-        indexes the processed document using the output handler.
+        indexes the processed document using the output handler. Documents whose
+        content fingerprint matches the one stored by a previous run are skipped
+        before any processor runs. When the processor manager batches documents,
+        the document is indexed once its batch is processed.
 
         Args:
             document (ScrapedDocument): The document to process and index.
         """
-        processed_doc = await self.processor_manager.process_document(document)
+        document.content_hash = document.compute_content_hash()
+        if self._skip_unchanged and self.fingerprints.is_unchanged(document):
+            self.total_documents_unchanged += 1
+            logger.debug(f"Skipping unchanged document {document.id}")
+            return
+
+        await self.processor_manager.submit(document, self._index_processed_document)
+
+    async def _index_processed_document(self, processed_doc: ScrapedDocument):
+        """Index a document once the processors are done with it."""
         await self.output.index_document(processed_doc)
+        if self.fingerprints:
+            self.fingerprints.stage(processed_doc)
         self.total_documents_processed += 1
         logger.info(
             f"Processed post {processed_doc.id} by {processed_doc.authors}. Total documents processed: {self.total_documents_processed}"
         )
 
+    async def delete_documents(self, ids: List[str]):
+        """
+        Delete documents that no longer exist in the source.
+
+        Args:
+            ids (List[str]): Ids of the documents to delete.
+        """
+        await self.output.delete_documents(ids)
+        if self.fingerprints:
+            self.fingerprints.forget(ids)
+        self.total_documents_deleted += len(ids)
+        logger.info(f"Deleted {len(ids)} removed documents: {ids}")
+
     async def run(self):
         """
         Run the scraper within the context of the output handler.
@@ -97,15 +134,82 @@ class BaseScraper(ABC):
         even if an exception occurs during scraping.
         """
         self._started_at = datetime.now().isoformat()
-        async with self.output:
-            try:
-                await self.scrape()
-            except Exception as e:
-                self._success = False
-                self._error = str(e)
-                raise
-            finally:
-                await self.record_run()
+        try:
+            async with self.output:
+                await self._open_fingerprint_store()
+                try:
+                    await self.scrape()
+                    # Index documents still waiting for a processor batch
+                    await self.processor_manager.flush()
+                except Exception as e:
+                    self._success = False
+                    self._error = str(e)
+                    raise
+                finally:
+                    await self.processor_manager.close()
+                    await self.record_run()
+                    if self.total_documents_unchanged:
+                        logger.info(
+                            f"Skipped {self.total_documents_unchanged} "
+                            "unchanged documents"
+                        )
+
+            # Only reached once the output has flushed every document successfully
+            if self.fingerprints:
+                self.fingerprints.commit(exclude_ids=self.output.failed_document_ids)
+            self.commit_state()
+        finally:
+            if self.fingerprints:
+                self.fingerprints.close()
+            self.close_state()
+
+    def commit_state(self):
+        """
+        Persist scraper-specific incremental state after a successful run.
+
+        Override this method in subclasses that keep such state.
+        """
+        pass
+
+    def close_state(self):
+        """
+        Release scraper-specific incremental state, whether the run succeeded
+        or not.
+
+        Override this method in subclasses that keep such state.
+        """
+        pass
+
+    @property
+    def state_namespace(self) -> str:
+        """
+        Key for local state that depends on the source, output, index and
+        processors.
+
+        Documents processed differently are different documents, so changing
+        the processors of a source starts from an empty state.
+        """
+        return (
+            f"{self.config.name.lower()}:"
+            f"{self.output.__class__.__name__.lower()}:{self.output.index_name}:"
+            f"{','.join(sorted(self.config.processors))}"
+        )
+
+    async def _open_fingerprint_store(self):
+        """
+        Open the fingerprint store used to skip unchanged documents.
+
+        Fingerprints are always recorded, but documents are only skipped when the
+        output already holds a successful run for this source. Otherwise (new
+        index, mock output) every document has to be sent.
+        """
+        if not settings.config.getboolean("skip_unchanged_documents", True):
+            return
+        if self.config.test_resources:
+            return
+
+        self.fingerprints = FingerprintStore(self.state_namespace)
+        self._skip_unchanged = await self.get_last_successful_run() is not None
 
     async def get_last_successful_run(self) -> Optional[ScraperRunDocument]:
         """
@@ -0,0 +1,79 @@
+import re
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+
+import yaml
+
+# libyaml's loader is several times faster than the pure-Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+LIQUID_TAG_PATTERN = re.compile(r"{%.*?%}", re.DOTALL)
+
+
+def load_yaml(content: str) -> Any:
+    """Parse YAML content with the fastest available safe loader."""
+    return yaml.load(content, Loader=YAML_LOADER)
+
+
+class FrontMatterParser:
+    """
+    Splits a document into its front matter and body.
+
+    The front matter is enclosed between a line holding only the start
+    delimiter and the next line holding only the end delimiter (trailing
+    whitespace allowed). Delimiters are located with `str.find` instead of a
+    multiline regex, so lines without a delimiter are never inspected.
+    """
+
+    def __init__(self, start_delimiter: str, end_delimiter: str):
+        self.start_delimiter = start_delimiter
+        self.end_delimiter = end_delimiter
+
+    def split(self, text: str) -> Tuple[Optional[str], str]:
+        """
+        Returns:
+            Tuple[Optional[str], str]: The stripped front matter (None if the
+            text has none) and the stripped body
+        """
+        # Remove content between {% %}
+        if "{%" in text:
+            text = LIQUID_TAG_PATTERN.sub("", text)
+
+        start = self._find_delimiter_line(text, self.start_delimiter, 0)
+        if start is None:
+            return None, text.strip()
+        end = self._find_delimiter_line(text, self.end_delimiter, start[1])
+        if end is None:
+            return None, text.strip()
+
+        return text[start[1] : end[0]].strip(), text[end[1] :].strip()
+
+    @staticmethod
+    def _find_delimiter_line(
+        text: str, delimiter: str, pos: int
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Find the first line at or after `pos` that consists of the delimiter.
+
+        Returns:
+            Optional[Tuple[int, int]]: Start and end offsets of that line
+        """
+        while True:
+            index = text.find(delimiter, pos)
+            if index < 0:
+                return None
+            line_end = text.find("\n", index)
+            if line_end < 0:
+                line_end = len(text)
+            at_line_start = index == 0 or text[index - 1] == "\n"
+            if at_line_start and not text[index + len(delimiter) : line_end].strip():
+                return index, line_end
+            pos = index + 1
+
+
+@lru_cache(maxsize=None)
+def get_front_matter_parser(
+    start_delimiter: str, end_delimiter: str
+) -> FrontMatterParser:
+    """Return the shared parser for a pair of delimiters."""
+    return FrontMatterParser(start_delimiter, end_delimiter)
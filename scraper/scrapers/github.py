@@ -1,25 +1,94 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import multiprocessing
 import os
 from datetime import date, datetime
 import re
+from itertools import islice
 from urllib.parse import urljoin
-from git import Repo
+from git import Commit, GitCommandError, Repo, Tree
 from loguru import logger
-from typing import List, Dict, Any, Optional, Set, Type
+from typing import (
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    Dict,
+    Any,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 import yaml
 
-from scraper.models import ScrapedDocument, RunStats
+from scraper.models import ScrapedDocument, RunStats, SourceConfig
 from scraper.config import settings
+from scraper.scrapers.front_matter import get_front_matter_parser, load_yaml
 from scraper.scrapers.utils import parse_standard_date_formats
 from scraper.utils import slugify, strip_emails
 from scraper.registry import scraper_registry
 from .base import BaseScraper
 
+# Per-process state of parse workers, set up once by `_init_parse_worker`
+_worker_scraper: Optional["GithubScraper"] = None
+_worker_repo: Optional[Repo] = None
+
+
+def _init_parse_worker(
+    scraper_class: Type["GithubScraper"], config: SourceConfig, commit_hash: str
+):
+    """Create a parse-only scraper instance in a worker process."""
+    global _worker_scraper, _worker_repo
+    _worker_scraper = scraper_class(config, output=None, processor_manager=None)
+    _worker_repo = Repo(_worker_scraper.repo_path)
+    _worker_scraper.commit = _worker_repo.commit(commit_hash)
+
+
+def _parse_files_chunk(
+    file_paths: List[str],
+) -> List[Tuple[str, Optional[ScrapedDocument]]]:
+    """Parse a chunk of files in a worker process."""
+    return [
+        (file_path, _worker_scraper.parse_file(_worker_repo, file_path))
+        for file_path in file_paths
+    ]
+
+
+@dataclass
+class ChangeSet:
+    """Relevant files changed between two commits, grouped by kind of change."""
+
+    added: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    # (old path, new path) pairs
+    renamed: List[Tuple[str, str]] = field(default_factory=list)
+
+    def files_to_process(self) -> Iterator[str]:
+        """Files whose current content has to be (re-)indexed."""
+        yield from self.added
+        yield from self.modified
+        yield from (new_path for _, new_path in self.renamed)
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self.added)} added, {len(self.modified)} modified, "
+            f"{len(self.deleted)} deleted, {len(self.renamed)} renamed"
+        )
+
 
 @scraper_registry.register("bolts")
 class GithubScraper(BaseScraper):
     FRONT_MATTER_START = FRONT_MATTER_END = "---"
     DEFAULT_EXCLUDED_FILES = {"README.md", "CONTRIBUTING.md", "LICENSE.md"}
+    resource_pool = "git"
+
+    # Deepen steps tried before fetching the full history of a shallow clone
+    MAX_DEEPEN_ATTEMPTS = 5
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -27,6 +96,10 @@ class GithubScraper(BaseScraper):
         self._excluded_files = self.DEFAULT_EXCLUDED_FILES.copy()
         self.document_class: Type[ScrapedDocument] = ScrapedDocument
         self.test_resources = self.config.test_resources
+        # Commit whose state is being scraped
+        self.commit: Optional[Commit] = None
+        # Changes since the previous run, set on incremental runs only
+        self.change_set: Optional[ChangeSet] = None
 
     @property
     def excluded_files(self) -> Set[str]:
@@ -44,51 +117,154 @@ class GithubScraper(BaseScraper):
         last_run = await self.get_last_successful_run()
         last_commit_hash = last_run.last_commit_hash if last_run else None
 
-        repo = self.clone_or_pull_repo()
-        # If checkout_commit is specified, use that specific commit state
-        if self.config.checkout_commit:
-            try:
-                repo.git.checkout(self.config.checkout_commit)
-            except Exception as e:
-                logger.error(
-                    f"Failed to checkout commit {self.config.checkout_commit}: {e}"
-                )
-                raise
-
-        self.current_commit_hash = repo.head.commit.hexsha
+        # Git commands block, run them off the event loop so that other
+        # sources scraped concurrently keep going
+        repo = await asyncio.to_thread(self.prepare_repo)
+        self.current_commit_hash = self.commit.hexsha
 
         # Handle test mode vs full mode
         if self.test_resources:
             logger.info(f"Running in test mode with resources: {self.test_resources}")
-            files_to_process = self.test_resources
+            files_to_process = (
+                f for f in self.test_resources if self.is_relevant_file(f)
+            )
         else:
             logger.info(
                 f"Running in full mode: {last_commit_hash} -> {self.current_commit_hash}"
             )
-            files_to_process = self.get_changed_files(repo, last_commit_hash)
+            files_to_process = await asyncio.to_thread(
+                self.get_changed_files, repo, last_commit_hash
+            )
+            if self.change_set:
+                await self.delete_removed_documents(self.change_set)
 
         # Process files
-        self.resources_to_process = len(files_to_process)
+        self.resources_to_process = 0
         await self.process_files(repo, files_to_process)
 
+    def prepare_repo(self) -> Repo:
+        """Bring the local repository up to date and resolve `self.commit`."""
+        if self.config.read_from_git_objects:
+            repo = self.fetch_repo()
+            self.commit = self.resolve_commit(repo)
+            return repo
+
+        repo = self.clone_or_pull_repo()
+        # If checkout_commit is specified, use that specific commit state
+        if self.config.checkout_commit:
+            try:
+                repo.git.checkout(self.config.checkout_commit)
+            except Exception as e:
+                logger.error(
+                    f"Failed to checkout commit {self.config.checkout_commit}: {e}"
+                )
+                raise
+        self.commit = repo.head.commit
+        return repo
+
     def get_changed_files(self, repo: Repo, last_commit_hash: str) -> List[str]:
+        """
+        Return the relevant files to (re-)index since `last_commit_hash`.
+
+        Without a previous commit, every relevant file in the tree is listed
+        by `iter_relevant_files`. Otherwise the change set is computed and
+        stored in `self.change_set`, so removed documents can be deleted.
+
+        The list is built eagerly, so that reading the tree happens where this
+        is called, in a thread when scraping.
+        """
         if not last_commit_hash:
             # If no previous commit hash, consider all files as changed
-            return [item.path for item in repo.tree().traverse() if item.type == "blob"]
+            return list(self.iter_relevant_files(self.commit.tree))
 
-        current_commit = repo.head.commit
-        previous_commit = repo.commit(last_commit_hash)
+        if not self.ensure_commit_available(repo, last_commit_hash):
+            logger.warning(
+                f"Commit {last_commit_hash} from the previous run is not available, "
+                "considering all files as changed"
+            )
+            return self.get_changed_files(repo, None)
+
+        self.change_set = self.get_change_set(repo, last_commit_hash)
+        logger.info(f"Changes since {last_commit_hash[:8]}: {self.change_set}")
+        return list(self.change_set.files_to_process())
 
-        diff_index = previous_commit.diff(current_commit)
+    def get_change_set(self, repo: Repo, last_commit_hash: str) -> ChangeSet:
+        """
+        Diff the previous run's commit against the scraped commit with rename
+        detection, keeping only changes that involve relevant files.
 
-        changed_files = []
+        A rename out of the relevant files counts as a deletion, and a rename
+        into them counts as an addition.
+        """
+        previous_commit = repo.commit(last_commit_hash)
+        diff_index = previous_commit.diff(self.commit, M=True)
+
+        change_set = ChangeSet()
         for diff_item in diff_index:
-            if diff_item.a_path:
-                changed_files.append(diff_item.a_path)
-            if diff_item.b_path and diff_item.b_path != diff_item.a_path:
-                changed_files.append(diff_item.b_path)
+            old_path, new_path = diff_item.a_path, diff_item.b_path
+            if diff_item.change_type == "A":
+                if self.is_relevant_file(new_path):
+                    change_set.added.append(new_path)
+            elif diff_item.change_type == "D":
+                if self.is_relevant_file(old_path):
+                    change_set.deleted.append(old_path)
+            elif diff_item.change_type == "R":
+                old_relevant = self.is_relevant_file(old_path)
+                new_relevant = self.is_relevant_file(new_path)
+                if old_relevant and new_relevant:
+                    change_set.renamed.append((old_path, new_path))
+                elif old_relevant:
+                    change_set.deleted.append(old_path)
+                elif new_relevant:
+                    change_set.added.append(new_path)
+            elif self.is_relevant_file(new_path):
+                change_set.modified.append(new_path)
+
+        return change_set
+
+    async def delete_removed_documents(self, change_set: ChangeSet):
+        """
+        Delete documents of removed files, and the old documents of renamed
+        files whose id changed with the path.
+        """
+        ids = [self.generate_id(path) for path in change_set.deleted]
+        for old_path, new_path in change_set.renamed:
+            old_id = self.generate_id(old_path)
+            if old_id != self.generate_id(new_path):
+                ids.append(old_id)
 
-        return list(set(changed_files))
+        if ids:
+            await self.delete_documents(ids)
+
+    def iter_relevant_files(self, tree: Tree) -> Iterator[str]:
+        """
+        Walk a tree depth-first, yielding relevant file paths as they are found.
+
+        Subtrees rejected by `is_relevant_directory` are pruned without being
+        read, so no time is spent listing directories that can't contain
+        relevant files.
+        """
+        for blob in tree.blobs:
+            if self.is_relevant_file(blob.path):
+                yield blob.path
+        for subtree in tree.trees:
+            if self.is_relevant_directory(subtree.path):
+                yield from self.iter_relevant_files(subtree)
+
+    def is_relevant_directory(self, dir_path: str) -> bool:
+        """
+        Check if a directory can contain relevant files.
+        This method can be overridden in subclasses to prune more directories.
+        """
+        if not self.config.directories:
+            return True
+
+        # Keep directories that lie inside a configured directory or lead to one
+        prefix = f"{dir_path}/"
+        return any(
+            dir.startswith(prefix) or prefix.startswith(dir)
+            for dir in self.config.directories
+        )
 
     def clone_or_pull_repo(self) -> Repo:
         if os.path.exists(self.repo_path):
@@ -105,23 +281,218 @@ class GithubScraper(BaseScraper):
             repo.git.checkout(default_branch)
 
             # Now pull the latest changes
+            self._apply_sparse_checkout(repo)
             origin = repo.remotes.origin
             origin.pull()
         else:
             logger.info(f"Cloning repo to path: {self.repo_path}")
-            repo = Repo.clone_from(self.config.url, self.repo_path)
+            repo = Repo.clone_from(
+                self.config.url, self.repo_path, **self._clone_options()
+            )
+            self._apply_sparse_checkout(repo)
+        return repo
+
+    def _clone_options(self, **options) -> Dict[str, Any]:
+        """
+        Build `git clone` options from the source's depth, filter and
+        sparse-checkout settings.
+        """
+        if self.config.clone_depth:
+            options["depth"] = self.config.clone_depth
+        if self.config.clone_filter:
+            options["filter"] = self.config.clone_filter
+        if self.config.sparse_checkout and self.config.directories:
+            options["sparse"] = True
+        return options
+
+    def _apply_sparse_checkout(self, repo: Repo):
+        """Limit the working tree to the configured directories."""
+        if not self.config.sparse_checkout:
+            return
+        if not self.config.directories:
+            logger.warning("sparse_checkout is enabled but no directories are set")
+            return
+        repo.git.sparse_checkout("set", *self.config.directories)
+
+    def _is_shallow(self, repo: Repo) -> bool:
+        return os.path.exists(os.path.join(repo.git_dir, "shallow"))
+
+    def _has_commit(self, repo: Repo, commit_hash: str) -> bool:
+        try:
+            repo.git.cat_file("-e", f"{commit_hash}^{{commit}}")
+            return True
+        except GitCommandError:
+            return False
+
+    def ensure_commit_available(self, repo: Repo, commit_hash: str) -> bool:
+        """
+        Make sure a commit is present locally, fetching more history if needed.
+
+        Shallow clones are deepened step by step (doubling each time) and
+        unshallowed as a last resort. Full clones try to fetch the commit directly.
+
+        Returns:
+            bool: Whether the commit is available after fetching
+        """
+        if self._has_commit(repo, commit_hash):
+            return True
+
+        origin = repo.remotes.origin
+        if self._is_shallow(repo):
+            deepen_by = self.config.clone_depth or 50
+            for _ in range(self.MAX_DEEPEN_ATTEMPTS):
+                logger.info(f"Deepening shallow clone by {deepen_by} commits")
+                repo.git.fetch(origin.name, f"--deepen={deepen_by}")
+                if self._has_commit(repo, commit_hash):
+                    return True
+                if not self._is_shallow(repo):
+                    return False
+                deepen_by *= 2
+
+            logger.info("Fetching full history")
+            repo.git.fetch(origin.name, "--unshallow")
+        else:
+            try:
+                repo.git.fetch(origin.name, commit_hash)
+            except GitCommandError as e:
+                logger.warning(f"Failed to fetch commit {commit_hash}: {e}")
+
+        return self._has_commit(repo, commit_hash)
+
+    def fetch_repo(self) -> Repo:
+        """
+        Clone or fetch the repository without touching its working tree.
+
+        Used when reading files straight from git objects, so the working tree
+        is never reset or checked out.
+        """
+        if os.path.exists(self.repo_path):
+            logger.info(f"Fetching existing repo at path: {self.repo_path}")
+            repo = Repo(self.repo_path)
+            repo.remotes.origin.fetch()
+        else:
+            logger.info(f"Cloning repo without checkout to path: {self.repo_path}")
+            repo = Repo.clone_from(
+                self.config.url,
+                self.repo_path,
+                **self._clone_options(no_checkout=True),
+            )
         return repo
 
-    async def process_files(self, repo: Repo, files: List[str]) -> int:
-        """Process a list of files from the repository."""
+    def resolve_commit(self, repo: Repo) -> Commit:
+        """
+        Resolve the commit to scrape: `checkout_commit` if configured,
+        otherwise the head of the remote's default branch.
+        """
+        if self.config.checkout_commit:
+            try:
+                return repo.commit(self.config.checkout_commit)
+            except Exception as e:
+                logger.error(
+                    f"Failed to resolve commit {self.config.checkout_commit}: {e}"
+                )
+                raise
+        return repo.commit(repo.git.symbolic_ref("refs/remotes/origin/HEAD"))
+
+    def read_file(self, repo: Repo, file_path: str) -> str:
+        """
+        Read a file's content at the scraped commit.
+
+        Reads the blob from the commit's tree when `read_from_git_objects` is
+        enabled, otherwise from the working tree.
+        """
+        if self.config.read_from_git_objects:
+            blob = self.commit.tree / file_path
+            content = blob.data_stream.read().decode("utf-8")
+            # Match the newline translation of reading in text mode
+            return content.replace("\r\n", "\n").replace("\r", "\n")
+
+        with open(
+            os.path.join(repo.working_dir, file_path), "r", encoding="utf-8"
+        ) as file:
+            return file.read()
+
+    async def process_files(self, repo: Repo, files: Iterable[str]):
+        """
+        Process relevant files from the repository.
+
+        `files` may be a lazy iterable; it is consumed as parsing progresses.
+        Files are parsed in-process, or by a pool of `parse_workers` processes
+        when configured. Either way documents are indexed in the order of `files`
+        as soon as they are parsed.
+        """
+        relevant_files = self._count_resources(files)
+        parse_workers = settings.config.getint("parse_workers", 1)
+        if parse_workers > 1:
+            parsed = self._parse_files_parallel(relevant_files, parse_workers)
+        else:
+            parsed = self._parse_files_sequential(repo, relevant_files)
+
+        async for file_path, document in parsed:
+            if document:
+                await self.process_and_index_document(document)
+            else:
+                logger.warning(f"Failed to parse file: {file_path}")
+
+    def _count_resources(self, files: Iterable[str]) -> Iterator[str]:
+        """Count files into `resources_to_process` as they are consumed."""
+        self.resources_to_process = self.resources_to_process or 0
         for file_path in files:
-            if self.is_relevant_file(file_path):
-                logger.info(f"Processing file: {file_path}")
-                document = self.parse_file(repo, file_path)
-                if document:
-                    await self.process_and_index_document(document)
-                else:
-                    logger.warning(f"Failed to parse file: {file_path}")
+            self.resources_to_process += 1
+            yield file_path
+
+    async def _parse_files_sequential(
+        self, repo: Repo, files: Iterator[str]
+    ) -> AsyncIterator[Tuple[str, Optional[ScrapedDocument]]]:
+        """Parse files one at a time in the current process."""
+        for file_path in files:
+            logger.info(f"Processing file: {file_path}")
+            yield file_path, self.parse_file(repo, file_path)
+
+    async def _parse_files_parallel(
+        self, files: Iterator[str], workers: int
+    ) -> AsyncIterator[Tuple[str, Optional[ScrapedDocument]]]:
+        """
+        Parse files in chunks on a process pool, yielding results in order.
+
+        At most two chunks per worker are in flight, so parsing stays ahead of
+        indexing without materializing the whole file list. Chunks are taken
+        from `files` on a worker thread, since that may walk the repository
+        tree. Workers are spawned rather than forked, so they don't inherit
+        the event loop and open connections of this process.
+        """
+        chunk_size = settings.config.getint("parse_chunk_size", 32)
+        logger.info(f"Parsing files with {workers} worker processes")
+
+        def next_chunk() -> List[str]:
+            return list(islice(files, chunk_size))
+
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_parse_worker,
+            initargs=(self.__class__, self.config, self.commit.hexsha),
+        )
+        try:
+            in_flight = deque()
+            for _ in range(2 * workers):
+                chunk = await asyncio.to_thread(next_chunk)
+                if not chunk:
+                    break
+                in_flight.append(executor.submit(_parse_files_chunk, chunk))
+
+            while in_flight:
+                results = await asyncio.wrap_future(in_flight.popleft())
+                chunk = await asyncio.to_thread(next_chunk)
+                if chunk:
+                    in_flight.append(executor.submit(_parse_files_chunk, chunk))
+                for file_path, document in results:
+                    logger.info(f"Processing file: {file_path}")
+                    yield file_path, document
+        finally:
+            # Don't block the event loop on shutdown, and drop the chunks still
+            # queued if parsing stopped early (failed run or cancellation)
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def is_relevant_file(self, file_path: str) -> bool:
         file_name = os.path.basename(file_path)
@@ -151,34 +522,21 @@ class GithubScraper(BaseScraper):
 
     def parse_markdown(self, text: str) -> tuple[Dict[str, Any], str]:
         """Parses a markdown text to extract metadata and the document body"""
-        # Remove content between {% %}
-        text = re.sub(r"{%.*?%}", "", text, flags=re.MULTILINE | re.DOTALL)
-
-        start_delimiter = re.escape(self.FRONT_MATTER_START)
-        end_delimiter = re.escape(self.FRONT_MATTER_END)
-        pattern = re.compile(
-            rf"^{start_delimiter}\s*$(.*?)^{end_delimiter}\s*$",
-            re.DOTALL | re.MULTILINE,
-        )
-        match = pattern.search(text)
-
-        if match:
-            # Extract the front matter and the body
-            front_matter = match.group(1).strip()
-            body = text[match.end() :].strip()
+        parser = get_front_matter_parser(self.FRONT_MATTER_START, self.FRONT_MATTER_END)
+        front_matter, body = parser.split(text)
 
-            # Try YAML parsing first
-            try:
-                metadata = yaml.safe_load(front_matter)
-                if not isinstance(metadata, dict):
-                    raise ValueError("YAML content is not a dictionary")
-            except (yaml.YAMLError, ValueError):
-                # If YAML parsing fails, fall back to BIP-style parsing
-                metadata = self._parse_bip_style_content(front_matter)
-        else:
+        if front_matter is None:
             # If no front matter is found, treat the entire text as body
-            metadata = {}
-            body = text.strip()
+            return {}, body
+
+        # Try YAML parsing first
+        try:
+            metadata = load_yaml(front_matter)
+            if not isinstance(metadata, dict):
+                raise ValueError("YAML content is not a dictionary")
+        except (yaml.YAMLError, ValueError):
+            # If YAML parsing fails, fall back to BIP-style parsing
+            metadata = self._parse_bip_style_content(front_matter)
 
         return metadata, body
 
@@ -206,10 +564,7 @@ class GithubScraper(BaseScraper):
 
     def parse_file(self, repo: Repo, file_path: str) -> ScrapedDocument:
         try:
-            with open(
-                os.path.join(repo.working_dir, file_path), "r", encoding="utf-8"
-            ) as file:
-                content = file.read()
+            content = self.read_file(repo, file_path)
             metadata, body = self.parse_markdown(content)
 
             document_data = {
@@ -382,22 +737,21 @@ class GithubScraper(BaseScraper):
             dict: Analysis results including field frequencies, types, and values/examples
         """
         # Clone or update repository
-        repo = self.clone_or_pull_repo()
+        if self.config.read_from_git_objects:
+            repo = self.fetch_repo()
+            self.commit = self.resolve_commit(repo)
+        else:
+            repo = self.clone_or_pull_repo()
+            self.commit = repo.head.commit
 
         # Initialize analysis data structure
         analysis = {"total_documents": 0, "metadata_fields": {}}
 
         # Analyze all markdown files
-        for item in repo.tree().traverse():
-            if item.type != "blob" or not self.is_relevant_file(item.path):
-                continue
-
+        for file_path in self.iter_relevant_files(self.commit.tree):
             try:
                 # Read and parse file
-                with open(
-                    os.path.join(repo.working_dir, item.path), "r", encoding="utf-8"
-                ) as f:
-                    content = f.read()
+                content = self.read_file(repo, file_path)
                 metadata, _ = self.parse_markdown(content)
 
                 if metadata:
@@ -407,7 +761,7 @@ class GithubScraper(BaseScraper):
                     )
 
             except Exception as e:
-                logger.warning(f"Error analyzing file {item.path}: {e}")
+                logger.warning(f"Error analyzing file {file_path}: {e}")
                 logger.error("Full traceback:", exc_info=True)
                 continue
 
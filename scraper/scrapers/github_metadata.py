@@ -1,5 +1,4 @@
 import json
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 from urllib.parse import urljoin
 from loguru import logger
@@ -48,8 +47,7 @@ class GitHubMetadataScraper(GithubScraper):
         """
         try:
             # Read the JSON file
-            with open(Path(repo.working_dir) / file_path, "r", encoding="utf-8") as f:
-                json_content = json.load(f)
+            json_content = json.loads(self.read_file(repo, file_path))
 
             # Process the JSON content
             document_data = self.map_json_to_document(json_content, file_path)
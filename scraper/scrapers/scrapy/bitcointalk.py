@@ -1,11 +1,13 @@
 from datetime import datetime
 from bs4 import Tag
+from lxml import etree
 from loguru import logger
 from typing import Optional
 
 from scraper.scrapers import ScrapyScraper
 from scraper.registry import scraper_registry
 from scraper.scrapers.scrapy.spider_base import BaseSpider
+from scraper.scrapers.scrapy.selector_extractor import compile_css
 
 
 @scraper_registry.register("bitcointalk")
@@ -15,6 +17,8 @@ class BitcoinTalkScraper(ScrapyScraper):
 
 
 class BitcoinTalkSpider(BaseSpider):
+    QUOTE_SELECTOR = ".quoteheader, .quote"
+
     def _get_thread_url(self, url: str) -> str:
         return url.rsplit(".", 1)[0]
 
@@ -67,6 +71,14 @@ class BitcoinTalkSpider(BaseSpider):
     def process_html(self, element: Tag) -> Tag:
         """Process HTML content for BitcoinTalk posts."""
         # Remove quotes to get original content only
-        for tag in element.select(".quoteheader, .quote"):
+        for tag in element.select(self.QUOTE_SELECTOR):
             tag.decompose()
         return element
+
+    def process_element(self, element: etree._Element) -> etree._Element:
+        """Process HTML content for BitcoinTalk posts (lxml engine)."""
+        # Remove quotes to get original content only
+        for quote in compile_css(self.QUOTE_SELECTOR)(element):
+            if quote.getparent() is not None:
+                quote.drop_tree()
+        return element
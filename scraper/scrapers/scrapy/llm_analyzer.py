@@ -8,6 +8,7 @@ from loguru import logger
 from openai import AsyncOpenAI
 from scraper.models import SourceConfig
 from scraper.config import get_project_root, settings
+from scraper.http_cache import HttpCache
 from scraper.scrapers.scrapy.spider_config import SpiderConfig
 
 
@@ -267,10 +268,13 @@ Return only valid JSON without any other text."""
 
     async def _analyze_page(self, url: str, page_type: str) -> Dict[str, Any]:
         """Analyze a single page using LLM"""
-        # Fetch page content
+        # Fetch page content, shared with the source's spider cache
         async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                html = await response.text()
+            with HttpCache(self.source_config.name.lower()) as cache:
+                response = await cache.fetch_async(
+                    session, url, ttl=settings.config.getint("http_cache_ttl", 0)
+                )
+                html = response.text
 
         # Clean HTML
         cleaned_html = self._clean_html(html)
@@ -0,0 +1,90 @@
+from typing import Optional
+
+from loguru import logger
+from scrapy import signals
+from scrapy.http import Headers
+from scrapy.responsetypes import responsetypes
+
+from scraper.http_cache import CachedResponse, HttpCache
+
+
+class HttpCacheMiddleware:
+    """
+    Downloader middleware that serves pages from the spider's HttpCache.
+
+    The TTL of a request comes from the `cache_ttl` of the page type in
+    `request.meta["page_type"]` (`index_page` or `resource_page`). The
+    middleware sits after HttpCompressionMiddleware, so it caches
+    decompressed bodies.
+    """
+
+    def __init__(self):
+        self.cache: Optional[HttpCache] = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        middleware = cls()
+        crawler.signals.connect(middleware.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(middleware.spider_closed, signal=signals.spider_closed)
+        return middleware
+
+    def spider_opened(self, spider):
+        self.cache = HttpCache(spider.name)
+
+    def spider_closed(self, spider):
+        if self.cache:
+            self.cache.close()
+
+    def _get_ttl(self, request, spider) -> Optional[int]:
+        scraping_config = spider.spider_config.scraping_config
+        page_type = request.meta.get("page_type")
+        if not scraping_config or page_type not in ("index_page", "resource_page"):
+            return None
+        return getattr(scraping_config, page_type).cache_ttl
+
+    def _to_response(self, cached: CachedResponse, request):
+        headers = Headers(cached.headers)
+        response_class = responsetypes.from_args(
+            headers=headers, url=cached.url, body=cached.body
+        )
+        return response_class(
+            url=request.url,
+            status=cached.status,
+            headers=headers,
+            body=cached.body,
+            request=request,
+            flags=["cached"],
+        )
+
+    def process_request(self, request, spider):
+        if request.method != "GET":
+            return None
+
+        cached = self.cache.get(request.url)
+        if cached is None:
+            return None
+        if cached.is_fresh(self._get_ttl(request, spider)):
+            logger.debug(f"Serving {request.url} from the cache")
+            return self._to_response(cached, request)
+
+        for name, value in cached.validators().items():
+            request.headers.setdefault(name, value)
+        return None
+
+    def process_response(self, request, response, spider):
+        # Responses served by process_request come through here too, storing
+        # them again would reset their age and the TTL would never expire
+        if request.method != "GET" or "cached" in response.flags:
+            return response
+
+        if response.status == 304:
+            cached = self.cache.get(request.url)
+            if cached:
+                logger.debug(f"{request.url} not modified, serving it from the cache")
+                self.cache.touch(request.url)
+                return self._to_response(cached, request)
+        elif response.status == 200:
+            self.cache.store(
+                request.url, 200, response.headers.to_unicode_dict(), response.body
+            )
+        return response
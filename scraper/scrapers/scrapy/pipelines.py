@@ -0,0 +1,25 @@
+from loguru import logger
+
+from scraper.models import ScrapedDocument
+
+
+class DocumentIndexingPipeline:
+    """
+    Item pipeline that hands scraped documents to the spider's scraper.
+
+    Spiders yield items of the form `{"document": ScrapedDocument}`, which are
+    processed and indexed through `BaseScraper.process_and_index_document`
+    without requesting the item's URL again.
+    """
+
+    async def process_item(self, item: dict, spider):
+        document: ScrapedDocument = item["document"]
+        logger.info(f"Processing document: {document.id}")
+        try:
+            await spider.scraper.process_and_index_document(document)
+        except Exception:
+            # Scrapy only logs the error, keep the thread from being marked as
+            # crawled in the frontier
+            spider.scraper.failed_item_ids.add(document.id)
+            raise
+        return item
@@ -1,11 +1,16 @@
+import asyncio
 from pathlib import Path
+from typing import Optional, Set
+
 from loguru import logger
 
-from scrapy.crawler import CrawlerProcess
-from scraper.config import get_project_root
+from scrapy.crawler import CrawlerRunner
+from scrapy.utils.log import configure_logging
+from scraper.config import get_project_root, settings
 from scraper.scrapers.base import BaseScraper
 from scraper.scrapers.scrapy.spider_base import BaseSpider
 from scraper.scrapers.scrapy.spider_config import SpiderConfig
+from scraper.storage import CrawlFrontier
 
 
 class ScrapyScraper(BaseScraper):
@@ -13,18 +18,43 @@ class ScrapyScraper(BaseScraper):
     A base class for scrapers that use Scrapy.
     This class extends BaseScraper and provides the necessary setup for using Scrapy
     within the scraper framework.
+
+    Crawls are started with a `CrawlerRunner` on the asyncio reactor that is
+    already running (installed by the CLI), and awaited like any coroutine.
+    Several web sources can therefore crawl concurrently in one process, next
+    to other sources.
     """
 
+    # Scrapy's logging only needs to be set up once per process
+    _logging_configured = False
+
+    resource_pool = "scrapy"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.crawler_process = CrawlerProcess(
-            settings={
-                "COOKIES_ENABLED": False,
-                "CONCURRENT_REQUESTS_PER_DOMAIN": 1,
-                "DOWNLOAD_DELAY": 1,
+        crawler_settings = {
+            # Fail early if another reactor than the CLI's asyncio one is running
+            "TWISTED_REACTOR": "twisted.internet.asyncioreactor.AsyncioSelectorReactor",
+            "COOKIES_ENABLED": False,
+            "CONCURRENT_REQUESTS_PER_DOMAIN": 1,
+            "DOWNLOAD_DELAY": 1,
+            "ITEM_PIPELINES": {
+                "scraper.scrapers.scrapy.pipelines.DocumentIndexingPipeline": 300,
+            },
+        }
+        if settings.config.getboolean("http_cache", True):
+            # Right after HttpCompressionMiddleware (590) so bodies are cached decompressed
+            crawler_settings["DOWNLOADER_MIDDLEWARES"] = {
+                "scraper.scrapers.scrapy.middlewares.HttpCacheMiddleware": 585,
             }
-        )
+        if not ScrapyScraper._logging_configured:
+            configure_logging(crawler_settings)
+            ScrapyScraper._logging_configured = True
+        self.crawler_runner = CrawlerRunner(settings=crawler_settings)
         self.spider_config = self._load_configuration()
+        self.frontier: Optional[CrawlFrontier] = None
+        # Ids of the items the item pipeline failed to process and index
+        self.failed_item_ids: Set[str] = set()
 
     def _load_configuration(self) -> SpiderConfig:
         """
@@ -60,17 +90,45 @@ class ScrapyScraper(BaseScraper):
         """
         Start the scraping process.
 
-        This method retrieves the appropriate spider class, adds it to the crawler process,
-        and starts the crawling. It should be called to begin the scraping operation.
+        This method retrieves the appropriate spider class, starts a crawl with it
+        and waits for the crawl to finish. It should be called to begin the
+        scraping operation.
         """
         spider = self.get_spider_class()
-        self.crawler_process.crawl(
+
+        # Record where each thread was left, and resume from there once the
+        # output holds a successful run
+        incremental = False
+        if not self.config.test_resources and settings.config.getboolean(
+            "incremental_crawl", True
+        ):
+            self.frontier = CrawlFrontier(self.state_namespace)
+            incremental = await self.get_last_successful_run() is not None
+
+        crawl = self.crawler_runner.crawl(
             spider,
             scraper=self,
             source_config=self.config,  # Pass source config separately
             spider_config=self.spider_config,
+            frontier=self.frontier,
+            incremental=incremental,
         )
-        self.crawler_process.start()
+        await crawl.asFuture(asyncio.get_running_loop())
+
+    def commit_state(self):
+        """
+        Persist the crawl frontier once the crawled documents are indexed.
+
+        Threads with items that were not indexed keep their previous state.
+        """
+        if self.frontier:
+            self.frontier.commit(
+                exclude_ids=self.output.failed_document_ids | self.failed_item_ids
+            )
+
+    def close_state(self):
+        if self.frontier:
+            self.frontier.close()
 
     def get_spider_class(self):
         """
@@ -1,10 +1,30 @@
+import copy
 import re
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
 from bs4 import BeautifulSoup, Tag
+from cssselect import HTMLTranslator
 from dataclasses import dataclass
+from lxml import etree, html as lxml_html
 
 from scraper.scrapers.scrapy.selector_types import SelectorConfig
 
+SELECTOR_ENGINES = ("lxml", "beautifulsoup")
+
+# Text nodes as returned by BeautifulSoup's get_text (scripts and styles excluded)
+TEXT_NODES = etree.XPath(".//text()[not(ancestor::script) and not(ancestor::style)]")
+
+
+@lru_cache(maxsize=None)
+def compile_css(selector: str) -> etree.XPath:
+    """
+    Translate a CSS selector to a compiled XPath expression.
+
+    Like soupsieve's `select`, the expression only matches descendants of the
+    element it is evaluated on, never the element itself.
+    """
+    return etree.XPath(HTMLTranslator().css_to_xpath(selector, prefix="descendant::"))
+
 
 @dataclass
 class FieldExtractionResult:
@@ -27,27 +47,58 @@ class FieldExtractionResult:
 
 
 class SelectorExtractor:
-    """Base class for selector-based content extraction"""
+    """
+    Base class for selector-based content extraction.
+
+    Pages can be parsed with either engine in SELECTOR_ENGINES: extraction
+    methods accept BeautifulSoup nodes as well as lxml elements (such as
+    the root of a Scrapy response's selector). On lxml elements, CSS
+    selectors are compiled once to XPath. Subclasses that override
+    `process_html` should also override `process_element`, otherwise each
+    extracted element is converted to BeautifulSoup to be processed.
+    """
 
     def process_html(self, element: Tag) -> Tag:
         """Process HTML content before text extraction
         Default implementation - no processing"""
         return element
 
-    def _extract_items(
-        self, soup: BeautifulSoup, selector_config: SelectorConfig
-    ) -> List[Tag]:
+    def process_element(self, element: etree._Element) -> etree._Element:
+        """Process HTML content before text extraction, lxml engine counterpart
+        of `process_html`. The element is a copy and can be mutated freely.
+        Default implementation - no processing"""
+        return element
+
+    def _overrides(self, method_name: str) -> bool:
+        return getattr(type(self), method_name) is not getattr(
+            SelectorExtractor, method_name
+        )
+
+    def _select(self, node: Any, selector: str) -> List[Any]:
+        """Return all descendants of a node matching a CSS selector"""
+        if isinstance(node, Tag):
+            return node.select(selector)
+        return compile_css(selector)(node)
+
+    def _select_one(self, node: Any, selector: str) -> Optional[Any]:
+        """Return the first descendant of a node matching a CSS selector"""
+        if isinstance(node, Tag):
+            return node.select_one(selector)
+        elements = compile_css(selector)(node)
+        return elements[0] if elements else None
+
+    def _extract_items(self, soup: Any, selector_config: SelectorConfig) -> List[Any]:
         """Extract items from page using configured selector"""
-        return soup.select(selector_config.selector)
+        return self._select(soup, selector_config.selector)
 
     def _extract_field(
-        self, item: Tag, selector_config: Optional[SelectorConfig]
+        self, item: Any, selector_config: Optional[SelectorConfig]
     ) -> FieldExtractionResult:
         """
         Extract a field from an item using configured selector.
 
         Args:
-            item: The BeautifulSoup Tag to extract from
+            item: The BeautifulSoup Tag or lxml element to extract from
             selector_config: Configuration for the selector
 
         Returns:
@@ -57,8 +108,8 @@ class SelectorExtractor:
         if not selector_config:
             return FieldExtractionResult.none()
 
-        element = item.select_one(selector_config.selector)
-        if not element:
+        element = self._select_one(item, selector_config.selector)
+        if element is None:
             return FieldExtractionResult.none()
 
         if selector_config.attribute:
@@ -69,15 +120,20 @@ class SelectorExtractor:
             return FieldExtractionResult.from_attribute(value)
         else:
             # For content fields that might need HTML processing
-            # Store original HTML before any processing
-            original_html = str(element)
+            if isinstance(element, Tag):
+                # Store original HTML before any processing
+                original_html = str(element)
 
-            # Process the HTML
-            processed_element = self.process_html(element)
-            processed_html = str(processed_element)
+                # Process the HTML
+                processed_element = self.process_html(element)
+                processed_html = str(processed_element)
 
-            # Extract text from processed HTML
-            text_value = processed_element.get_text(strip=True)
+                # Extract text from processed HTML
+                text_value = processed_element.get_text(strip=True)
+            else:
+                original_html, processed_html, text_value = self._process_element(
+                    element
+                )
 
             # Apply pattern if specified
             if selector_config.pattern and text_value:
@@ -94,11 +150,38 @@ class SelectorExtractor:
                 original_html=original_html,
             )
 
-    def _extract_links(
-        self, soup: BeautifulSoup, selector_config: SelectorConfig
-    ) -> List[str]:
+    def _process_element(self, element: etree._Element) -> Tuple[str, str, str]:
+        """
+        Serialize an lxml element and extract its text.
+
+        Returns:
+            Tuple[str, str, str]: The original HTML, the processed HTML and the text
+        """
+        original_html = lxml_html.tostring(element, encoding="unicode", with_tail=False)
+        if self._overrides("process_element"):
+            # Process a copy, the response's tree is shared by all fields
+            processed_element = self.process_element(copy.deepcopy(element))
+            processed_html = lxml_html.tostring(
+                processed_element, encoding="unicode", with_tail=False
+            )
+        elif not self._overrides("process_html"):
+            processed_element, processed_html = element, original_html
+        else:
+            # process_html mutates a BeautifulSoup tree, so only this element is converted
+            soup_element = BeautifulSoup(original_html, "html.parser").find()
+            processed_element = self.process_html(soup_element)
+            return (
+                original_html,
+                str(processed_element),
+                processed_element.get_text(strip=True),
+            )
+
+        text_value = "".join(text.strip() for text in TEXT_NODES(processed_element))
+        return original_html, processed_html, text_value
+
+    def _extract_links(self, soup: Any, selector_config: SelectorConfig) -> List[str]:
         """Extract links using configured selector"""
-        elements = soup.select(selector_config.selector)
+        elements = self._select(soup, selector_config.selector)
 
         if selector_config.attribute:
             links = [el.get(selector_config.attribute) for el in elements]
@@ -114,7 +197,7 @@ class SelectorExtractor:
         return links
 
     def _extract_next_page(
-        self, soup: BeautifulSoup, selector_config: SelectorConfig
+        self, soup: Any, selector_config: SelectorConfig
     ) -> Optional[str]:
         """Extract next page link using configured selector"""
         if not selector_config:
@@ -34,6 +34,10 @@ class PageConfig(BaseModel):
     items: ItemConfig
     next_page: Optional[SelectorConfig] = None
     url_pattern: Optional[str] = None
+    cache_ttl: Optional[int] = Field(
+        None,
+        description="Seconds a cached page is used without revalidation (unset: always revalidate)",
+    )
 
 
 class ScrapingConfig(BaseModel):
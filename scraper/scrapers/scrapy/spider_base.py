@@ -1,4 +1,5 @@
 from abc import ABC
+from dataclasses import dataclass
 import json
 from pathlib import Path
 import re
@@ -9,20 +10,33 @@ from loguru import logger
 
 import scrapy
 from scrapy import signals
-from twisted.internet import task, defer
+from twisted.internet import task
 from scrapy.http import Response
 
-from scraper.config import get_project_root
+from scraper.config import get_project_root, settings
 from scraper.models import ScrapedDocument
 from scraper.scrapers.base import BaseScraper
 from scraper.scrapers.scrapy.spider_config import SpiderConfig
 from scraper.scrapers.scrapy.selector_types import ItemConfig
-from scraper.scrapers.scrapy.selector_extractor import SelectorExtractor
+from scraper.scrapers.scrapy.selector_extractor import (
+    SELECTOR_ENGINES,
+    SelectorExtractor,
+)
 from scraper.scrapers.utils import parse_standard_date_formats
+from scraper.storage import CrawlFrontier, ThreadState
 from scraper.utils import slugify
 from scraper.models import SourceConfig
 
 
+@dataclass
+class IndexPageState:
+    """Threads of an index page still being crawled in an incremental crawl."""
+
+    next_page: Optional[str]
+    pending: int = 0
+    changed: bool = False
+
+
 class BaseSpider(scrapy.Spider, SelectorExtractor, ABC):
     name = "base_spider"
     """
@@ -45,6 +59,8 @@ class BaseSpider(scrapy.Spider, SelectorExtractor, ABC):
         source_config: SourceConfig,
         spider_config: SpiderConfig,
         *args,
+        frontier: Optional[CrawlFrontier] = None,
+        incremental: bool = False,
         **kwargs,
     ):
         """
@@ -54,11 +70,16 @@ class BaseSpider(scrapy.Spider, SelectorExtractor, ABC):
             scraper: The BaseScraper instance that created this spider
             source_config: The SourceConfig instance containing source metadata
             spider_config: The SpiderConfig instance containing scraping selectors
+            frontier: Store where the last crawled page of each thread is recorded
+            incremental: Whether to resume known threads from the frontier and
+                stop at the first index page without changes
         """
         super().__init__(*args, **kwargs)
         self.scraper = scraper
         self.source_config = source_config
         self.spider_config = spider_config
+        self.frontier = frontier
+        self.incremental = incremental and frontier is not None
 
         # Initialize spider settings from source config
         self.name = self.source_config.name.lower()
@@ -66,6 +87,14 @@ class BaseSpider(scrapy.Spider, SelectorExtractor, ABC):
         self.test_resources = self.source_config.test_resources
         self.start_urls = self._get_start_urls()
 
+        # Engine used to parse pages and evaluate selectors
+        self.selector_engine = settings.config.get("scrapy_selector_engine", "lxml")
+        if self.selector_engine not in SELECTOR_ENGINES:
+            raise ValueError(
+                f"Unknown scrapy_selector_engine '{self.selector_engine}', "
+                f"expected one of {SELECTOR_ENGINES}"
+            )
+
         # Author filtering
         self.filter_by_author = self._should_filter_by_author()
         self.authors_of_interest = set(self._load_authors_of_interest())
@@ -75,9 +104,13 @@ class BaseSpider(scrapy.Spider, SelectorExtractor, ABC):
         self.total_items_queued = 0
         self.log_interval = 15
 
+        mode = "full"
+        if self.test_resources:
+            mode = "test"
+        elif self.incremental:
+            mode = "incremental"
         logger.info(
-            f"Initializing spider {self.name} in "
-            f"{'test' if self.test_resources else 'full'} mode. "
+            f"Initializing spider {self.name} in {mode} mode. "
             f"Author filtering: {'enabled' if self.filter_by_author else 'disabled'}"
         )
 
@@ -125,6 +158,17 @@ class BaseSpider(scrapy.Spider, SelectorExtractor, ABC):
             return self.test_resources
         return [str(self.source_config.url)]
 
+    def start_requests(self) -> Generator:
+        """Request the start URLs, tagged with their page type for the HTTP cache."""
+        page_type = "resource_page" if self.test_resources else "index_page"
+        for url in self.start_urls:
+            yield scrapy.Request(url, dont_filter=True, meta={"page_type": page_type})
+
+    async def start(self):
+        # Entry point of Scrapy >= 2.13, which no longer calls start_requests
+        for request in self.start_requests():
+            yield request
+
     @classmethod
     def from_crawler(cls, crawler, *args, **kwargs):
         spider = super(BaseSpider, cls).from_crawler(crawler, *args, **kwargs)
@@ -138,10 +182,13 @@ class BaseSpider(scrapy.Spider, SelectorExtractor, ABC):
         self.log_status_task.start(self.log_interval)
         logger.info(f"Spider opened: {self.name}")
 
-    def spider_closed(self, spider):
+    def spider_closed(self, spider, reason):
         """Clean up resources when spider closes."""
         if hasattr(self, "log_status_task") and self.log_status_task.running:
             self.log_status_task.stop()
+        if self.frontier and reason != "finished":
+            # Threads of an interrupted crawl must be crawled again
+            self.frontier.discard()
         logger.info(f"Spider closed: {self.name}")
 
     def log_status(self):
@@ -151,6 +198,17 @@ class BaseSpider(scrapy.Spider, SelectorExtractor, ABC):
             f"Queued: {self.total_items_queued}, Indexed: {self.scraper.total_documents_processed}"
         )
 
+    def _parse_page(self, response: Response) -> Any:
+        """
+        Return the root node that selectors are evaluated on.
+
+        With the lxml engine this is the tree Scrapy already parsed for the
+        response, so pages are not parsed a second time.
+        """
+        if self.selector_engine == "beautifulsoup":
+            return BeautifulSoup(response.text, "html.parser")
+        return response.selector.root
+
     def parse(self, response: Response) -> Generator:
         """
         Main entry point for parsing responses.
@@ -168,27 +226,102 @@ class BaseSpider(scrapy.Spider, SelectorExtractor, ABC):
         if not self.spider_config.scraping_config:
             raise ValueError("No scraping configuration found")
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = self._parse_page(response)
         item_selector = (
             self.spider_config.scraping_config.index_page.items.item_selector
         )
         resource_links = self._extract_links(soup, item_selector)
         logger.info(f"Found {len(resource_links)} resource links")
 
-        for link in resource_links:
-            yield response.follow(link, callback=self.parse_resource)
-
-        # Handle pagination if configured
+        next_page = None
         if self.spider_config.scraping_config.index_page.next_page:
             next_page = self._extract_next_page(
                 soup, self.spider_config.scraping_config.index_page.next_page
             )
-            if next_page:
-                logger.info("Following next index page")
-                yield response.follow(next_page, self.parse_index)
+
+        if self.incremental:
+            yield from self._follow_index_incrementally(
+                response, resource_links, next_page
+            )
+            return
+
+        for link in resource_links:
+            yield response.follow(
+                link, callback=self.parse_resource, meta={"page_type": "resource_page"}
+            )
+
+        # Handle pagination if configured
+        if next_page:
+            logger.info("Following next index page")
+            yield response.follow(
+                next_page, self.parse_index, meta={"page_type": "index_page"}
+            )
+
+    def _follow_index_incrementally(
+        self, response: Response, resource_links: List[str], next_page: Optional[str]
+    ) -> Generator:
+        """
+        Request the threads of an index page, resuming known threads from their
+        last crawled page. The next index page is only requested once all of
+        them are crawled, and only if at least one of them had new items.
+        """
+        state = IndexPageState(
+            next_page=response.urljoin(next_page) if next_page else None
+        )
+        requests = []
+        for url in dict.fromkeys(response.urljoin(link) for link in resource_links):
+            thread = self.frontier.get(self._get_thread_url(url))
+            cb_kwargs = {"index_state": state}
+            if thread:
+                url = thread.last_page_url
+                cb_kwargs.update(
+                    is_first_page=thread.last_page_is_first,
+                    seen_item_id=thread.last_item_id,
+                )
+            requests.append(self._thread_request(url, cb_kwargs))
+
+        state.pending = len(requests)
+        logger.info(
+            f"Crawling {len(requests)} threads from {response.url} incrementally"
+        )
+        yield from requests
+
+    def _thread_request(self, url: str, cb_kwargs: Dict[str, Any]) -> scrapy.Request:
+        # Never filtered as duplicate, the index page waits for every callback
+        return scrapy.Request(
+            url,
+            callback=self.parse_resource,
+            errback=self._thread_failed,
+            cb_kwargs=cb_kwargs,
+            meta={"page_type": "resource_page"},
+            dont_filter=True,
+        )
+
+    def _thread_failed(self, failure) -> Generator:
+        logger.error(f"Failed to crawl {failure.request.url}: {failure.value}")
+        yield from self._thread_done(failure.request.cb_kwargs["index_state"])
+
+    def _thread_done(self, state: "IndexPageState") -> Generator:
+        """Follow the next index page once every thread of this one is crawled."""
+        state.pending -= 1
+        if state.pending > 0 or not state.next_page:
+            return
+        if state.changed:
+            logger.info("Following next index page")
+            yield scrapy.Request(
+                state.next_page,
+                callback=self.parse_index,
+                meta={"page_type": "index_page"},
+            )
+        else:
+            logger.info("No thread of the last index page changed, stopping")
 
     def parse_resource(
-        self, response: Response, is_first_page: bool = True
+        self,
+        response: Response,
+        is_first_page: bool = True,
+        index_state: Optional["IndexPageState"] = None,
+        seen_item_id: Optional[str] = None,
     ) -> Generator:
         """
         Parse a resource page and its items.
@@ -196,12 +329,16 @@ class BaseSpider(scrapy.Spider, SelectorExtractor, ABC):
         Args:
             response: The response to parse
             is_first_page: Whether this is the first page of the resource
+            index_state: State of the index page the resource was found on,
+                in incremental crawls
+            seen_item_id: Id of the last item of this page crawled before,
+                items up to it are skipped
         """
         if not self.spider_config.scraping_config:
             raise ValueError("No scraping configuration found")
 
         resource_config = self.spider_config.scraping_config.resource_page
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = self._parse_page(response)
 
         # Get the thread URL (resource URL without pagination parameters)
         thread_url = self._get_thread_url(response.url)
@@ -210,7 +347,8 @@ class BaseSpider(scrapy.Spider, SelectorExtractor, ABC):
         items = self._extract_items(soup, resource_config.items.item_selector)
         logger.debug(f"Found {len(items)} items on page {response.url}")
 
-        # Process items
+        # Parse items
+        documents = []
         for index, item in enumerate(items):
             try:
                 # First item is the original post only on the first page
@@ -224,28 +362,56 @@ class BaseSpider(scrapy.Spider, SelectorExtractor, ABC):
                 )
 
                 if item_data:  # Skip items that failed to parse
-                    document = ScrapedDocument(**item_data)
-                    self.total_items_scraped += 1
-                    yield scrapy.Request(
-                        url=item_data["url"],
-                        callback=self.process_document,
-                        cb_kwargs={"document": document},
-                        dont_filter=True,
-                    )
+                    documents.append(ScrapedDocument(**item_data))
             except Exception as e:
                 logger.error(f"Error processing item {index} from {thread_url}: {e}")
                 logger.exception("Full traceback:")
+                if self.frontier:
+                    self.frontier.fail(thread_url)
+
+        if self.frontier and not self.test_resources:
+            self.frontier.stage(
+                thread_url,
+                ThreadState(
+                    last_page_url=response.url,
+                    last_page_is_first=is_first_page,
+                    last_item_id=documents[-1].id if documents else None,
+                ),
+                item_ids=[document.id for document in documents],
+            )
+
+        # Skip items crawled by a previous run
+        seen_ids = [document.id for document in documents]
+        if seen_item_id in seen_ids:
+            documents = documents[seen_ids.index(seen_item_id) + 1 :]
+        if documents and index_state:
+            index_state.changed = True
+
+        for document in documents:
+            self.total_items_scraped += 1
+            # Indexed by DocumentIndexingPipeline
+            self.total_items_queued += 1
+            yield {"document": document}
 
         # Handle pagination if configured
+        next_page = None
         if not self.test_resources and resource_config.next_page:
             next_page = self._extract_next_page(soup, resource_config.next_page)
-            if next_page:
-                logger.info("Following pagination")
+        if next_page:
+            logger.info("Following pagination")
+            cb_kwargs = {"is_first_page": False}
+            if index_state:
+                cb_kwargs["index_state"] = index_state
+                yield self._thread_request(response.urljoin(next_page), cb_kwargs)
+            else:
                 yield response.follow(
                     next_page,
                     callback=self.parse_resource,
-                    cb_kwargs={"is_first_page": False},
+                    cb_kwargs=cb_kwargs,
+                    meta={"page_type": "resource_page"},
                 )
+        elif index_state:
+            yield from self._thread_done(index_state)
 
     def _get_thread_url(self, url: str) -> str:
         """
@@ -409,9 +575,3 @@ class BaseSpider(scrapy.Spider, SelectorExtractor, ABC):
             f"Could not parse date format: {date_str}. "
             "Implement parse_date in a subclass to handle this format."
         )
-
-    @defer.inlineCallbacks
-    def process_document(self, response: Response, document: ScrapedDocument):
-        """Process and index a document using the parent scraper."""
-        logger.info(f"Processing document: {document.id}")
-        yield self.scraper.process_and_index_document(document)
@@ -1,35 +1,75 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, Iterable, List, Optional
 import html
 from urllib.parse import urljoin
 
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
 from loguru import logger
 
+from scraper.config import settings
 from scraper.models.documents import StackExchangeDocument
 from scraper.registry import scraper_registry
 from scraper.scrapers.base import BaseScraper
 
 
+def post_url(domain: str, post_type: str, post_id: Any) -> str:
+    """Short link of a question (`/q/{id}`) or an answer (`/a/{id}`)."""
+    prefix = "q" if post_type == "question" else "a"
+    return urljoin(domain, f"/{prefix}/{post_id}")
+
+
+def thread_url(domain: str, question_id: Any) -> str:
+    """Short link of the question a post belongs to."""
+    return urljoin(domain, f"/q/{question_id}")
+
+
 @scraper_registry.register("StackExchange")
 class StackExchangeScraper(BaseScraper):
     """
     Scraper for retrieving and processing posts from Bitcoin StackExchange using their API.
+
+    Requests go through a shared aiohttp session, with at most
+    `stackexchange_concurrency` of them in flight. When the API returns a
+    `backoff`, further calls to the same method wait for that many seconds.
+
+    Post details (accepted answer, tags, thread URL) come from the
+    `/questions/{ids}` and `/answers/{ids}` endpoints, in batches of up to
+    100 ids, with a filter created for just those fields.
     """
 
+    DETAILS_BATCH_SIZE = 100
+    # With base "none", wrapper fields are dropped unless included too
+    DETAILS_FILTER_FIELDS = [
+        ".items",
+        ".backoff",
+        ".quota_remaining",
+        "question.question_id",
+        "question.tags",
+        "question.accepted_answer_id",
+        "answer.answer_id",
+        "answer.question_id",
+    ]
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.page_size = 15
+        self.page_size = 100
 
-        # Calculate date range (last 7 days)
-        current_time = datetime.now()
-        self.to_timestamp = int(current_time.timestamp())
-        self.from_timestamp = int((current_time - timedelta(days=7)).timestamp())
+        # Date range, set by `scrape` from the last successful run
+        self.from_timestamp: Optional[int] = None
+        self.to_timestamp: Optional[int] = None
 
         # Common request headers
         self.headers = {"User-Agent": "Mozilla/5.0"}
 
+        self.concurrency = settings.config.getint("stackexchange_concurrency", 4)
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # Monotonic time until which each API method must not be called
+        self._backoff_until: Dict[str, float] = {}
+        self.details_filter = "default"
+
     def _unescape_text(self, text: str) -> str:
         """Handle unicode escape sequences and HTML entities."""
         if not text:
@@ -44,44 +84,100 @@ class StackExchangeScraper(BaseScraper):
 
     async def scrape(self):
         """Main scraping method that orchestrates the API calls and processing."""
-        try:
-            # Get total number of posts to process
-            total_posts = self._get_total_posts()
-            total_pages = max(1, (total_posts + self.page_size - 1) // self.page_size)
-            self.resources_to_process = total_posts
-            logger.info(f"Found {total_posts} posts across {total_pages} pages")
-
-            # Process each page
-            for page in range(1, total_pages + 1):
-                posts = self._fetch_page(page)
-                for post in posts:
-                    document = self._process_post(post)
-                    if document:
-                        await self.process_and_index_document(document)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        async with aiohttp.ClientSession(
+            headers=self.headers,
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=90),
+        ) as self.session:
+            next_page: Optional[asyncio.Task] = None
+            try:
+                await self._set_date_range()
+                self.details_filter = await self._get_details_filter()
+                self.resources_to_process = 0
 
-        except Exception as e:
-            logger.error(f"Error during scraping: {e}")
-            logger.exception("Full traceback:")
+                # Fetch the next page while the current one is processed
+                next_page = asyncio.create_task(self._fetch_page(1))
+                page = 1
+                while next_page:
+                    data = await next_page
+                    next_page = None
+                    if data.get("has_more"):
+                        page += 1
+                        next_page = asyncio.create_task(self._fetch_page(page))
 
-    def _get_total_posts(self) -> int:
-        """Get the total number of posts for the date range."""
-        url = f"{self.config.url}/posts"
-        params = {
-            "site": "bitcoin.stackexchange",
-            "filter": "total",
-            "fromdate": self.from_timestamp,
-            "todate": self.to_timestamp,
-        }
+                    posts = data.get("items", [])
+                    self.resources_to_process += len(posts)
+                    details = await self._get_post_details(posts)
+                    for post in posts:
+                        document = self._process_post(
+                            post, details.get(post.get("post_id"), {})
+                        )
+                        if document:
+                            await self.process_and_index_document(document)
+
+                logger.info(
+                    f"Found {self.resources_to_process} posts across {page} pages"
+                )
+
+            except Exception as e:
+                # Fail the run, so that the next one covers this window again
+                logger.error(f"Error during scraping: {e}")
+                raise
+            finally:
+                if next_page:
+                    next_page.cancel()
+
+    async def _set_date_range(self):
+        """
+        Cover the posts created since the last successful run started, or the
+        last 7 days on a first run.
+
+        The window starts at the previous run's start rather than its end:
+        that run's window closed when it started, so posts created while it
+        was running are only picked up this way.
+        """
+        current_time = datetime.now()
+        self.to_timestamp = int(current_time.timestamp())
+
+        last_run = await self.get_last_successful_run()
+        if last_run:
+            self.from_timestamp = int(
+                datetime.fromisoformat(last_run.started_at).timestamp()
+            )
+            logger.info(
+                f"Fetching posts created since the last run ({last_run.started_at})"
+            )
+        else:
+            self.from_timestamp = int((current_time - timedelta(days=7)).timestamp())
+            logger.info("No previous successful run, fetching posts of the last 7 days")
 
-        response = requests.get(url, params=params, headers=self.headers, timeout=90)
-        if response.status_code == 200:
-            data = response.json()
-            return data.get("total", 0)
-        raise Exception(f"API request failed with status {response.status_code}")
+    async def _api_get(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Call an API method, honouring any backoff the API requested for it."""
+        # Backoffs apply per method, whatever ids are in the path
+        method_name = method.split("/")[0]
+        delay = self._backoff_until.get(method_name, 0) - time.monotonic()
+        if delay > 0:
+            logger.info(f"Backing off {delay:.1f}s before calling /{method_name}")
+            await asyncio.sleep(delay)
 
-    def _fetch_page(self, page: int) -> list:
+        async with self._semaphore:
+            async with self.session.get(
+                f"{self.config.url}/{method}", params=params
+            ) as response:
+                if response.status != 200:
+                    raise Exception(
+                        f"API request failed with status {response.status}"
+                    )
+                data = await response.json()
+
+        if data.get("backoff"):
+            self._backoff_until[method_name] = time.monotonic() + data["backoff"]
+        return data
+
+    async def _fetch_page(self, page: int) -> Dict[str, Any]:
         """Fetch a single page of posts from the API."""
-        url = f"{self.config.url}/posts"
         params = {
             "site": "bitcoin.stackexchange",
             "filter": "!6WPIomnA_rhBb",  # Filter for titles, body, and body_markdown
@@ -90,65 +186,107 @@ class StackExchangeScraper(BaseScraper):
             "page": page,
             "pagesize": self.page_size,
         }
+        return await self._api_get("posts", params)
 
-        response = requests.get(url, params=params, headers=self.headers, timeout=90)
-        if response.status_code == 200:
-            data = response.json()
-            return data.get("items", [])
-        raise Exception(f"API request failed with status {response.status_code}")
-
-    def _get_post_details(self, url: str) -> Dict[str, Any]:
-        """
-        Fetch additional post details from the webpage.
-        TODO: get this information from the API instead of scraping
-        """
+    async def _get_details_filter(self) -> str:
+        """Create the API filter that returns only the fields of the post details."""
         try:
-            response = requests.get(url, headers=self.headers, timeout=60)
-            if response.status_code != 200:
-                return {}
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Extract accepted answer ID if available
-            accepted_answer = soup.find("div", {"itemprop": "acceptedAnswer"})
-            accepted_answer_id = (
-                accepted_answer.get("data-answerid") if accepted_answer else None
+            data = await self._api_get(
+                "filters/create",
+                {
+                    "include": ";".join(self.DETAILS_FILTER_FIELDS),
+                    "base": "none",
+                    "unsafe": "false",
+                },
             )
+            return data["items"][0]["filter"]
+        except Exception as e:
+            logger.warning(f"Could not create details filter, using default: {e}")
+            return "default"
 
-            # Extract tags - use set to remove duplicates then convert back to list
-            tags = list(
-                set(tag.text for tag in soup.find_all("a", {"class": "post-tag"}))
+    async def _get_items(self, method: str, ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """Fetch questions or answers by id, up to `DETAILS_BATCH_SIZE` per call."""
+        ids = sorted(ids)
+        batches = [
+            ids[i : i + self.DETAILS_BATCH_SIZE]
+            for i in range(0, len(ids), self.DETAILS_BATCH_SIZE)
+        ]
+        responses = await asyncio.gather(
+            *(
+                self._api_get(
+                    f"{method}/{';'.join(map(str, batch))}",
+                    {
+                        "site": "bitcoin.stackexchange",
+                        "filter": self.details_filter,
+                        "pagesize": self.DETAILS_BATCH_SIZE,
+                    },
+                )
+                for batch in batches
             )
+        )
+        return [item for data in responses for item in data.get("items", [])]
+
+    async def _get_post_details(
+        self, posts: List[Dict[str, Any]]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Fetch the accepted answer, tags and thread URL of posts from the API.
+
+        Answers are looked up first to find their question, then all questions
+        are fetched together. Answers get the tags of their question. Errors
+        are raised, rather than indexing the posts without their details.
 
-            # Get the canonical thread URL (works for both questions and answers)
-            thread_link = soup.find("a", title="Short permalink to this question")
-            thread_url = (
-                urljoin(str(self.config.domain), thread_link["href"])
-                if thread_link
-                else None
+        Returns:
+            Dict[int, Dict[str, Any]]: Details keyed by post id
+        """
+        question_ids = {
+            post["post_id"]: post["post_id"]
+            for post in posts
+            if post.get("post_type") == "question"
+        }
+        answer_ids = [
+            post["post_id"] for post in posts if post.get("post_type") == "answer"
+        ]
+        if answer_ids:
+            for answer in await self._get_items("answers", answer_ids):
+                question_ids[answer["answer_id"]] = answer["question_id"]
+
+        questions = {
+            question["question_id"]: question
+            for question in await self._get_items(
+                "questions", set(question_ids.values())
             )
+        }
 
-            return {
-                "accepted_answer_id": accepted_answer_id,
-                "tags": tags,
-                "thread_url": thread_url,
+        details = {}
+        for post_id, question_id in question_ids.items():
+            question = questions.get(question_id, {})
+            accepted_answer_id = question.get("accepted_answer_id")
+            details[post_id] = {
+                "accepted_answer_id": (
+                    str(accepted_answer_id) if accepted_answer_id else None
+                ),
+                "tags": question.get("tags"),
+                "thread_url": thread_url(str(self.config.domain), question_id),
             }
-        except Exception as e:
-            logger.error(f"Error fetching post details: {e}")
-            return {}
+        return details
 
-    def _process_post(self, post: Dict[str, Any]) -> Optional[StackExchangeDocument]:
-        """Process a single post and convert it to a StackExchangeDocument."""
+    def _process_post(
+        self, post: Dict[str, Any], details: Dict[str, Any]
+    ) -> Optional[StackExchangeDocument]:
+        """Process a single post and its details into a StackExchangeDocument."""
         try:
             post_id = post.get("post_id")
             if not post_id:
                 return None
 
-            url = post.get("link")
-            details = self._get_post_details(url)
+            post_type = post.get("post_type")
+            url = post.get("link") or post_url(
+                str(self.config.domain), post_type, post_id
+            )
 
-            # Get author information
-            author = post.get("owner", {}).get("display_name")
+            # Get author information, display names are HTML-escaped
+            author = html.unescape(post.get("owner", {}).get("display_name", ""))
 
             # Get original content and convert body to markdown
             body_markdown = self._unescape_text(post.get("body_markdown", ""))
@@ -172,7 +310,7 @@ class StackExchangeScraper(BaseScraper):
                 ).isoformat(),
                 "indexed_at": datetime.now(timezone.utc).isoformat(),
                 "tags": details.get("tags"),
-                "type": post.get("post_type"),
+                "type": post_type,
             }
 
             # Add accepted answer ID if available
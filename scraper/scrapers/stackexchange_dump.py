@@ -0,0 +1,211 @@
+import asyncio
+import itertools
+import os
+import re
+import shutil
+import subprocess
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import requests
+from loguru import logger
+
+from scraper.config import settings
+from scraper.models.documents import StackExchangeDocument
+from scraper.registry import scraper_registry
+from scraper.scrapers.base import BaseScraper
+from scraper.scrapers.stackexchange import post_url, thread_url
+from scraper.utils import html_to_markdown
+
+QUESTION = "1"
+ANSWER = "2"
+
+# Rows parsed per call to the worker thread in the second pass
+ROWS_PER_BATCH = 1000
+
+# Tags are stored as "<a><b>" in older dumps and "|a|b|" in newer ones
+TAG_PATTERN = re.compile(r"[^<>|]+")
+
+
+def iter_rows(path: str) -> Iterator[Dict[str, str]]:
+    """
+    Stream the attributes of every `<row>` of a StackExchange dump file.
+
+    Each row is cleared from the tree once yielded, so memory stays flat
+    however large the file is.
+    """
+    context = ET.iterparse(path, events=("start", "end"))
+    _, root = next(context)
+    for event, elem in context:
+        if event == "end" and elem.tag == "row":
+            yield elem.attrib
+            root.clear()
+
+
+@scraper_registry.register("StackExchangeDump")
+class StackExchangeDumpScraper(BaseScraper):
+    """
+    Scraper for the Bitcoin StackExchange data dump published on archive.org.
+
+    The archive configured as the source `url` is downloaded and extracted
+    (with `7z`) into `DATA_DIR/bitcoin.stackexchange.com` unless it is already
+    there. `Posts.xml` is then streamed twice: the first pass keeps only the
+    title and tags of every question, the second turns questions and answers
+    into documents. Both passes run on a worker thread, so that other sources
+    keep running while the dump is parsed. Documents get the same ids, links
+    and fields as those of `StackExchangeScraper`, so the dump can backfill an
+    index that the API scraper keeps up to date. The dump has no markdown
+    source of the posts, so bodies are converted from their HTML.
+    """
+
+    resource_pool = "dump"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dump_dir = os.path.join(settings.DATA_DIR, "bitcoin.stackexchange.com")
+        self.archive_path = f"{self.dump_dir}.7z"
+
+    async def scrape(self):
+        await asyncio.to_thread(self._ensure_dump)
+
+        users = await asyncio.to_thread(
+            self._read_users, os.path.join(self.dump_dir, "Users.xml")
+        )
+        posts_path = os.path.join(self.dump_dir, "Posts.xml")
+        questions = await asyncio.to_thread(self._read_questions, posts_path)
+        logger.info(
+            f"Found {len(users)} users and {len(questions)} questions in {posts_path}"
+        )
+
+        self.resources_to_process = 0
+        rows = iter_rows(posts_path)
+        while True:
+            documents = await asyncio.to_thread(
+                self._next_documents, rows, users, questions
+            )
+            if documents is None:
+                break
+            for document in documents:
+                await self.process_and_index_document(document)
+
+    def _next_documents(
+        self,
+        rows: Iterator[Dict[str, str]],
+        users: Dict[str, str],
+        questions: Dict[int, Tuple[str, str]],
+    ) -> Optional[List[StackExchangeDocument]]:
+        """
+        Second pass over the posts: turn the next batch of rows into documents.
+
+        Returns None once all rows have been read.
+        """
+        batch = list(itertools.islice(rows, ROWS_PER_BATCH))
+        if not batch:
+            return None
+
+        documents = []
+        for row in batch:
+            if row.get("PostTypeId") not in (QUESTION, ANSWER):
+                continue
+            self.resources_to_process += 1
+            document = self._process_row(row, users, questions)
+            if document:
+                documents.append(document)
+        return documents
+
+    def _ensure_dump(self):
+        """Download and extract the dump unless it was already extracted."""
+        if os.path.exists(os.path.join(self.dump_dir, "Posts.xml")):
+            logger.info(f"Using the dump extracted in {self.dump_dir}")
+            return
+
+        if not os.path.exists(self.archive_path):
+            logger.info(f"Downloading {self.config.url} to {self.archive_path}")
+            os.makedirs(os.path.dirname(self.archive_path), exist_ok=True)
+            partial_path = f"{self.archive_path}.part"
+            with requests.get(str(self.config.url), stream=True, timeout=60) as r:
+                r.raise_for_status()
+                with open(partial_path, "wb") as f:
+                    for chunk in r.iter_content(chunk_size=1 << 20):
+                        f.write(chunk)
+            os.replace(partial_path, self.archive_path)
+
+        if shutil.which("7z") is None:
+            raise RuntimeError(
+                f"7z is required to extract {self.archive_path} into {self.dump_dir}"
+            )
+        logger.info(f"Extracting {self.archive_path} to {self.dump_dir}")
+        subprocess.run(
+            ["7z", "x", "-y", f"-o{self.dump_dir}", self.archive_path],
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+
+    @staticmethod
+    def _read_users(path: str) -> Dict[str, str]:
+        """Map user ids to display names."""
+        return {
+            row["Id"]: row["DisplayName"]
+            for row in iter_rows(path)
+            if "DisplayName" in row
+        }
+
+    @staticmethod
+    def _read_questions(path: str) -> Dict[int, Tuple[str, str]]:
+        """First pass over the posts: map question ids to their title and tags."""
+        return {
+            int(row["Id"]): (row.get("Title", ""), row.get("Tags", ""))
+            for row in iter_rows(path)
+            if row.get("PostTypeId") == QUESTION
+        }
+
+    def _process_row(
+        self,
+        row: Dict[str, str],
+        users: Dict[str, str],
+        questions: Dict[int, Tuple[str, str]],
+    ) -> Optional[StackExchangeDocument]:
+        """Process a question or answer row into a StackExchangeDocument."""
+        try:
+            post_id = row["Id"]
+            is_question = row["PostTypeId"] == QUESTION
+            question_id = int(post_id if is_question else row["ParentId"])
+            if question_id not in questions:
+                logger.debug(f"Skipping answer {post_id} to missing question")
+                return None
+
+            domain = str(self.config.domain)
+            post_type = "question" if is_question else "answer"
+            title, tags = questions[question_id]
+            author = users.get(row.get("OwnerUserId")) or row.get("OwnerDisplayName")
+            body, original = html_to_markdown(row.get("Body", ""))
+            # Whole seconds, like the timestamps of the API
+            created_at = datetime.fromisoformat(row["CreationDate"]).replace(
+                microsecond=0
+            )
+
+            doc_data = {
+                "id": f"stackexchange-{post_id}",
+                "title": title,
+                "body": body.strip(),
+                "original": original,
+                "authors": [author] if author else None,
+                "domain": domain,
+                "url": post_url(domain, post_type, post_id),
+                "thread_url": thread_url(domain, question_id),
+                "created_at": created_at.isoformat(),
+                "indexed_at": datetime.now(timezone.utc).isoformat(),
+                # Answers get the tags of their question
+                "tags": TAG_PATTERN.findall(tags) or None,
+                "type": post_type,
+            }
+            if is_question:
+                doc_data["accepted_answer_id"] = row.get("AcceptedAnswerId")
+
+            return StackExchangeDocument(**doc_data)
+
+        except Exception as e:
+            logger.error(f"Error processing post {row.get('Id')}: {e}")
+            logger.exception("Full traceback:")
+            return None
@@ -0,0 +1,266 @@
+import hashlib
+import os
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Set
+
+from loguru import logger
+
+from scraper.config import settings
+from scraper.models import ScrapedDocument
+
+
+class SQLiteStore:
+    """
+    Base class for small local stores persisted as SQLite files under DATA_DIR.
+
+    Subclasses define their tables in `SCHEMA`, which is applied when the store
+    is opened.
+    """
+
+    SCHEMA: str = ""
+
+    def __init__(self, name: str, path: Optional[str] = None):
+        self.path = path or os.path.join(settings.DATA_DIR, f"{name}.sqlite")
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript(self.SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class FingerprintStore(SQLiteStore):
+    """
+    Keeps the content hash of every document sent to an output.
+
+    Fingerprints are keyed by namespace (source, output, index and processors)
+    and document id.
+    New fingerprints are staged while a run is in progress and only written by
+    `commit`, so documents from a failed run are sent again on the next one.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS fingerprints (
+            namespace TEXT NOT NULL,
+            id TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (namespace, id)
+        );
+    """
+
+    def __init__(self, namespace: str, path: Optional[str] = None):
+        super().__init__("fingerprints", path)
+        self.namespace = namespace
+        self._staged: Dict[str, str] = {}
+        self._forgotten: Set[str] = set()
+
+    def get(self, doc_id: str) -> Optional[str]:
+        """Return the stored content hash for a document, if any."""
+        row = self.conn.execute(
+            "SELECT content_hash FROM fingerprints WHERE namespace = ? AND id = ?",
+            (self.namespace, doc_id),
+        ).fetchone()
+        return row[0] if row else None
+
+    def is_unchanged(self, document: ScrapedDocument) -> bool:
+        """Check whether the document matches the fingerprint from a previous run."""
+        return (
+            document.content_hash is not None
+            and self.get(document.id) == document.content_hash
+        )
+
+    def stage(self, document: ScrapedDocument):
+        """Remember a document's fingerprint until the run is committed."""
+        if document.content_hash:
+            self._staged[document.id] = document.content_hash
+
+    def forget(self, doc_ids: Iterable[str]):
+        """Drop the fingerprints of deleted documents when the run is committed."""
+        for doc_id in doc_ids:
+            self._staged.pop(doc_id, None)
+            self._forgotten.add(doc_id)
+
+    def commit(self, exclude_ids: Iterable[str] = ()):
+        """
+        Persist staged fingerprints.
+
+        Args:
+            exclude_ids: Ids of documents the output failed to index
+        """
+        exclude_ids = set(exclude_ids)
+        now = datetime.now().isoformat()
+        rows = [
+            (self.namespace, doc_id, content_hash, now)
+            for doc_id, content_hash in self._staged.items()
+            if doc_id not in exclude_ids
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "DELETE FROM fingerprints WHERE namespace = ? AND id = ?",
+                [(self.namespace, doc_id) for doc_id in self._forgotten],
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?)", rows
+            )
+        logger.debug(f"Stored {len(rows)} fingerprints for {self.namespace}")
+        self._staged.clear()
+        self._forgotten.clear()
+
+
+@dataclass
+class ThreadState:
+    """Where a crawl last left a thread."""
+
+    last_page_url: str
+    last_page_is_first: bool
+    last_item_id: Optional[str]
+
+
+class CrawlFrontier(SQLiteStore):
+    """
+    Remembers the last crawled page and item of every thread of a web source.
+
+    Like fingerprints, new states are staged during a run and only written by
+    `commit`, and states are keyed by namespace (source, output, index and
+    processors). A thread keeps its previous state if any of its items could
+    not be parsed or indexed, so that the next run crawls them again.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS threads (
+            namespace TEXT NOT NULL,
+            thread_url TEXT NOT NULL,
+            last_page_url TEXT NOT NULL,
+            last_page_is_first INTEGER NOT NULL,
+            last_item_id TEXT,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (namespace, thread_url)
+        );
+    """
+
+    def __init__(self, namespace: str, path: Optional[str] = None):
+        super().__init__("crawl_frontier", path)
+        self.namespace = namespace
+        self._staged: Dict[str, ThreadState] = {}
+        # Ids of the documents crawled in each thread during this run
+        self._item_ids: Dict[str, Set[str]] = {}
+        # Threads with items that could not be parsed during this run
+        self._failed: Set[str] = set()
+
+    def get(self, thread_url: str) -> Optional[ThreadState]:
+        """Return the state of a thread, including changes staged by this run."""
+        if thread_url in self._staged:
+            return self._staged[thread_url]
+        row = self.conn.execute(
+            "SELECT last_page_url, last_page_is_first, last_item_id FROM threads "
+            "WHERE namespace = ? AND thread_url = ?",
+            (self.namespace, thread_url),
+        ).fetchone()
+        if not row:
+            return None
+        return ThreadState(
+            last_page_url=row[0], last_page_is_first=bool(row[1]), last_item_id=row[2]
+        )
+
+    def stage(
+        self, thread_url: str, state: ThreadState, item_ids: Iterable[str] = ()
+    ):
+        """Remember a thread's state and crawled items until the run is committed."""
+        self._staged[thread_url] = state
+        self._item_ids.setdefault(thread_url, set()).update(item_ids)
+
+    def fail(self, thread_url: str):
+        """Keep the previous state of a thread whose items were not all parsed."""
+        self._failed.add(thread_url)
+
+    def discard(self):
+        """Drop the staged states of an interrupted crawl."""
+        self._staged.clear()
+        self._item_ids.clear()
+        self._failed.clear()
+
+    def commit(self, exclude_ids: Iterable[str] = ()):
+        """
+        Persist staged thread states.
+
+        Args:
+            exclude_ids: Ids of documents that could not be indexed, the
+                threads they belong to keep their previous state
+        """
+        exclude_ids = set(exclude_ids)
+        skipped = {
+            thread_url
+            for thread_url in self._staged
+            if thread_url in self._failed
+            or not self._item_ids.get(thread_url, set()).isdisjoint(exclude_ids)
+        }
+        now = datetime.now().isoformat()
+        rows = [
+            (
+                self.namespace,
+                thread_url,
+                state.last_page_url,
+                int(state.last_page_is_first),
+                state.last_item_id,
+                now,
+            )
+            for thread_url, state in self._staged.items()
+            if thread_url not in skipped
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO threads VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+        logger.debug(f"Stored {len(rows)} thread states for {self.namespace}")
+        if skipped:
+            logger.info(
+                f"Kept the previous state of {len(skipped)} threads with failed items"
+            )
+        self.discard()
+
+
+class SummaryCache(SQLiteStore):
+    """
+    Keeps summaries across runs, keyed by a hash of the summarizer's model name
+    and the summarized text.
+
+    Unlike fingerprints, summaries are written as soon as they are produced: a
+    summary stays valid for its text whether or not the run succeeds.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS summaries (
+            key TEXT PRIMARY KEY,
+            summary TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, model_name: str, path: Optional[str] = None):
+        super().__init__("summaries", path)
+        self.model_name = model_name
+
+    def key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode()).hexdigest()
+
+    def get(self, text: str) -> Optional[str]:
+        row = self.conn.execute(
+            "SELECT summary FROM summaries WHERE key = ?", (self.key(text),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, text: str, summary: str):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?)",
+                (self.key(text), summary, datetime.now().isoformat()),
+            )
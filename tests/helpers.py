@@ -0,0 +1,86 @@
+"""Fixtures shared by the unit tests."""
+
+import os
+import tempfile
+import unittest
+from typing import Optional
+from unittest import mock
+
+from git import Actor, Repo
+
+from scraper.config import settings
+from scraper.models import RunStats, ScrapedDocument, ScraperRunDocument, SourceConfig
+
+AUTHOR = Actor("Test", "test@example.com")
+
+
+def make_document(doc_id: str, **fields) -> ScrapedDocument:
+    return ScrapedDocument(
+        **{
+            "id": doc_id,
+            "title": f"Title {doc_id}",
+            "body": f"Body {doc_id}",
+            "domain": "https://example.com",
+            "url": f"https://example.com/{doc_id}",
+            "indexed_at": "2024-01-01T00:00:00",
+            **fields,
+        }
+    )
+
+
+def make_run(source: str, finished_at: str, success: bool = True):
+    return ScraperRunDocument(
+        scraper=source,
+        source=source,
+        domain="https://example.com",
+        started_at=finished_at,
+        finished_at=finished_at,
+        success=success,
+        stats=RunStats(),
+    )
+
+
+def make_source_config(**fields) -> SourceConfig:
+    return SourceConfig(
+        **{
+            "name": "Test",
+            "domain": "https://example.com",
+            "url": "https://example.com/repo.git",
+            **fields,
+        }
+    )
+
+
+class TempDirTestCase(unittest.TestCase):
+    """Runs each test with a temporary directory as `tmp_dir` and DATA_DIR."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp_dir = tmp.name
+        # Worker processes read DATA_DIR from the environment
+        for patch in (
+            mock.patch.object(settings, "DATA_DIR", self.tmp_dir),
+            mock.patch.dict(os.environ, {"DATA_DIR": self.tmp_dir}),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+
+class GitRepoTestCase(TempDirTestCase):
+    """Runs each test with an empty git repository in `repo_dir`."""
+
+    def setUp(self):
+        super().setUp()
+        self.repo_dir = os.path.join(self.tmp_dir, "repo")
+        self.repo = Repo.init(self.repo_dir)
+
+    def write(self, path: str, content: str, newline: Optional[str] = None):
+        full_path = os.path.join(self.repo_dir, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "w", newline=newline) as f:
+            f.write(content)
+        self.repo.git.add(path)
+
+    def commit(self, message: str = "change") -> str:
+        return self.repo.index.commit(message, author=AUTHOR, committer=AUTHOR).hexsha
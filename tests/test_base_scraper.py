@@ -0,0 +1,76 @@
+import asyncio
+import sqlite3
+import unittest
+
+from scraper.outputs.jsonl_output import JsonlOutput
+from scraper.processors import ProcessorManager
+from scraper.scrapers.base import BaseScraper
+from tests.helpers import TempDirTestCase, make_document, make_source_config
+
+
+class StaticScraper(BaseScraper):
+    """Indexes the given documents, then fails if asked to."""
+
+    def __init__(self, doc_ids, fail: bool = False, **fields):
+        super().__init__(
+            make_source_config(**fields),
+            output=JsonlOutput(index_name="test", batch_size=2),
+            processor_manager=ProcessorManager([]),
+        )
+        self.doc_ids = doc_ids
+        self.fail = fail
+        self.closed_state = False
+
+    async def scrape(self):
+        for doc_id in self.doc_ids:
+            await self.process_and_index_document(make_document(doc_id))
+        if self.fail:
+            raise RuntimeError("scrape failed")
+
+    def close_state(self):
+        self.closed_state = True
+
+
+class StateTest(TempDirTestCase):
+    def test_state_namespace_depends_on_the_processors(self):
+        plain = StaticScraper([])
+        processed = StaticScraper([], processors=["topic_extractor", "summarization"])
+        reordered = StaticScraper([], processors=["summarization", "topic_extractor"])
+
+        self.assertEqual(plain.state_namespace, "test:jsonloutput:test:")
+        self.assertEqual(
+            processed.state_namespace,
+            "test:jsonloutput:test:summarization,topic_extractor",
+        )
+        self.assertEqual(reordered.state_namespace, processed.state_namespace)
+
+    def test_fingerprints_are_committed_and_closed_after_a_run(self):
+        scraper = StaticScraper(["a", "b"])
+        asyncio.run(scraper.run())
+
+        self.assertTrue(scraper.closed_state)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            scraper.fingerprints.get("a")
+
+        # Same source, output and index: the documents are now unchanged
+        next_run = StaticScraper(["a", "b"])
+        asyncio.run(next_run.run())
+        self.assertEqual(next_run.total_documents_unchanged, 2)
+
+        # Other processors: the documents are sent again
+        other_processors = StaticScraper(["a", "b"], processors=["summarization"])
+        asyncio.run(other_processors.run())
+        self.assertEqual(other_processors.total_documents_unchanged, 0)
+
+    def test_state_is_closed_when_scraping_fails(self):
+        scraper = StaticScraper(["a"], fail=True)
+        with self.assertRaisesRegex(RuntimeError, "scrape failed"):
+            asyncio.run(scraper.run())
+
+        self.assertTrue(scraper.closed_state)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            scraper.fingerprints.get("a")
+
+
+if __name__ == "__main__":
+    unittest.main()
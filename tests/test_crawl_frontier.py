@@ -0,0 +1,86 @@
+import unittest
+from types import SimpleNamespace
+
+from scraper.scrapers.scrapy.spider_base import BaseSpider
+from scraper.storage import CrawlFrontier, ThreadState
+from tests.helpers import TempDirTestCase
+
+NAMESPACE = "forum:output:index"
+THREAD = "https://forum.example.com/t/1"
+
+
+def state(page: int, last_item_id: str) -> ThreadState:
+    return ThreadState(
+        last_page_url=f"{THREAD}?page={page}",
+        last_page_is_first=page == 1,
+        last_item_id=last_item_id,
+    )
+
+
+class CrawlFrontierTest(TempDirTestCase):
+    def run_crawl(self, stage, exclude_ids=()):
+        """Stage thread states like a crawl, then commit them."""
+        with CrawlFrontier(NAMESPACE) as frontier:
+            stage(frontier)
+            frontier.commit(exclude_ids=exclude_ids)
+
+    def stored_state(self):
+        with CrawlFrontier(NAMESPACE) as frontier:
+            return frontier.get(THREAD)
+
+    def test_threads_are_resumed_from_their_last_page(self):
+        self.run_crawl(lambda frontier: frontier.stage(THREAD, state(1, "a")))
+        self.run_crawl(lambda frontier: frontier.stage(THREAD, state(2, "b")))
+        self.assertEqual(self.stored_state(), state(2, "b"))
+
+    def test_thread_with_an_unparsed_item_is_crawled_again(self):
+        self.run_crawl(lambda frontier: frontier.stage(THREAD, state(1, "a")))
+
+        def failing_crawl(frontier):
+            frontier.stage(THREAD, state(2, "c"), item_ids=["b", "c"])
+            frontier.fail(THREAD)
+
+        self.run_crawl(failing_crawl)
+        # The next run resumes from the page before the failure
+        self.assertEqual(self.stored_state(), state(1, "a"))
+
+        self.run_crawl(
+            lambda frontier: frontier.stage(THREAD, state(2, "c"), item_ids=["b", "c"])
+        )
+        self.assertEqual(self.stored_state(), state(2, "c"))
+
+    def test_thread_with_an_unindexed_item_is_crawled_again(self):
+        other_thread = "https://forum.example.com/t/2"
+
+        def crawl(frontier):
+            frontier.stage(THREAD, state(1, "b"), item_ids=["a", "b"])
+            frontier.stage(other_thread, state(1, "c"), item_ids=["c"])
+
+        self.run_crawl(crawl, exclude_ids=["b"])
+        self.assertIsNone(self.stored_state())
+        with CrawlFrontier(NAMESPACE) as frontier:
+            self.assertEqual(frontier.get(other_thread), state(1, "c"))
+
+    def test_aborted_crawl_does_not_advance_the_frontier(self):
+        self.run_crawl(lambda frontier: frontier.stage(THREAD, state(1, "a")))
+
+        def aborted_crawl(frontier):
+            frontier.stage(THREAD, state(3, "z"), item_ids=["z"])
+            spider = SimpleNamespace(frontier=frontier, name="forum")
+            BaseSpider.spider_closed(spider, spider, reason="shutdown")
+
+        self.run_crawl(aborted_crawl)
+        self.assertEqual(self.stored_state(), state(1, "a"))
+
+    def test_finished_crawl_keeps_its_staged_states(self):
+        def finished_crawl(frontier):
+            frontier.stage(THREAD, state(1, "a"), item_ids=["a"])
+            spider = SimpleNamespace(frontier=frontier, name="forum")
+            BaseSpider.spider_closed(spider, spider, reason="finished")
+
+        self.run_crawl(finished_crawl)
+        self.assertEqual(self.stored_state(), state(1, "a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
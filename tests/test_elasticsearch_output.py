@@ -0,0 +1,124 @@
+import asyncio
+import unittest
+
+from scraper.outputs.elasticsearch_output import ElasticsearchOutput
+
+
+def make_output(batch_size: int = 100, bulk_max_bytes: int = 1000, **attrs):
+    output = ElasticsearchOutput(index_name="test", batch_size=batch_size)
+    output.bulk_max_bytes = bulk_max_bytes
+    for name, value in attrs.items():
+        setattr(output, name, value)
+    return output
+
+
+def action(doc_id: str, size: int = 10):
+    return doc_id, b"x" * size
+
+
+def bulk_item(doc_id: str, status: int, op: str = "index"):
+    result = {"_id": doc_id, "status": status}
+    if status >= 300:
+        result["error"] = {"type": "some_error"}
+    return {op: result}
+
+
+class ChunkActionsTest(unittest.TestCase):
+    def chunk_ids(self, output, actions):
+        return [
+            [doc_id for doc_id, _ in chunk] for chunk in output._chunk_actions(actions)
+        ]
+
+    def test_chunks_are_bounded_by_count(self):
+        output = make_output(batch_size=2)
+        actions = [action(str(i)) for i in range(5)]
+        self.assertEqual(
+            self.chunk_ids(output, actions), [["0", "1"], ["2", "3"], ["4"]]
+        )
+
+    def test_chunks_are_bounded_by_bytes(self):
+        output = make_output(bulk_max_bytes=25)
+        actions = [action("a", 10), action("b", 10), action("c", 10), action("d", 5)]
+        self.assertEqual(self.chunk_ids(output, actions), [["a", "b"], ["c", "d"]])
+
+    def test_chunk_fills_up_to_the_byte_limit(self):
+        output = make_output(bulk_max_bytes=20)
+        actions = [action("a", 10), action("b", 10), action("c", 1)]
+        self.assertEqual(self.chunk_ids(output, actions), [["a", "b"], ["c"]])
+
+    def test_oversized_action_gets_its_own_chunk(self):
+        output = make_output(bulk_max_bytes=25)
+        actions = [action("a", 10), action("big", 100), action("b", 10)]
+        self.assertEqual(self.chunk_ids(output, actions), [["a"], ["big"], ["b"]])
+
+    def test_no_actions(self):
+        self.assertEqual(self.chunk_ids(make_output(), []), [])
+
+
+class ParseBulkResponseTest(unittest.TestCase):
+    def setUp(self):
+        self.output = make_output()
+
+    def test_response_without_errors(self):
+        chunk = [action("a"), action("b")]
+        response = {"errors": False, "items": []}
+        self.assertEqual(self.output._parse_bulk_response(response, chunk), (2, [], []))
+
+    def test_partial_failure(self):
+        chunk = [action("ok"), action("throttled"), action("bad"), action("down")]
+        response = {
+            "errors": True,
+            "items": [
+                bulk_item("ok", 201),
+                bulk_item("throttled", 429),
+                bulk_item("bad", 400),
+                bulk_item("down", 503),
+            ],
+        }
+        succeeded, retry, failed = self.output._parse_bulk_response(response, chunk)
+        self.assertEqual(succeeded, 1)
+        self.assertEqual([doc_id for doc_id, _ in retry], ["throttled", "down"])
+        self.assertEqual([item["_id"] for item in failed], ["bad"])
+
+    def test_deleting_a_missing_document_succeeds(self):
+        chunk = [action("gone"), action("missing")]
+        response = {
+            "errors": True,
+            "items": [
+                bulk_item("gone", 404, op="delete"),
+                bulk_item("missing", 404),
+            ],
+        }
+        succeeded, retry, failed = self.output._parse_bulk_response(response, chunk)
+        self.assertEqual(succeeded, 1)
+        self.assertEqual(retry, [])
+        self.assertEqual([item["_id"] for item in failed], ["missing"])
+
+
+class BulkRetryTest(unittest.TestCase):
+    def test_only_failed_items_are_retried(self):
+        output = make_output(bulk_max_retries=2, bulk_retry_backoff=0)
+        requests = []
+        statuses = {"a": [201], "b": [429, 201], "c": [503, 503, 503]}
+
+        async def send_bulk(chunk):
+            requests.append([doc_id for doc_id, _ in chunk])
+            return {
+                "errors": True,
+                "items": [
+                    bulk_item(doc_id, statuses[doc_id].pop(0)) for doc_id, _ in chunk
+                ],
+            }
+
+        output._send_bulk = send_bulk
+        succeeded, failed = asyncio.run(
+            output._bulk([action("a"), action("b"), action("c")])
+        )
+
+        self.assertEqual(requests, [["a", "b", "c"], ["b", "c"], ["c"]])
+        self.assertEqual(succeeded, 2)
+        self.assertEqual(failed, [{"_id": "c", "error": "bulk retries exhausted"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import os
+import unittest
+
+from scraper.embedding_cache import EmbeddingCache
+from tests.helpers import TempDirTestCase
+
+
+def vector(value: float):
+    return [value, value + 0.5, value + 0.25]
+
+
+class EmbeddingCacheTest(TempDirTestCase):
+    def open_cache(self) -> EmbeddingCache:
+        cache = EmbeddingCache("test/model", 3)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_vectors_are_read_back_after_reopening(self):
+        cache = self.open_cache()
+        cache.put_many({"a": vector(1), "b": vector(2)})
+        self.assertEqual(
+            cache.get_many(["a", "b", "missing"]), {"a": vector(1), "b": vector(2)}
+        )
+        cache.close()
+
+        reopened = self.open_cache()
+        self.assertEqual(reopened.get_many(["b"]), {"b": vector(2)})
+        reopened.put_many({"c": vector(3)})
+        self.assertEqual(
+            reopened.get_many(["a", "c"]), {"a": vector(1), "c": vector(3)}
+        )
+
+    def test_map_grows_with_the_file(self):
+        cache = self.open_cache()
+        cache.put_many({"a": vector(1)})
+        self.assertEqual(cache.get_many(["a"]), {"a": vector(1)})
+
+        # Rows appended after the file was mapped
+        cache.put_many({"b": vector(2)})
+        self.assertEqual(cache.get_many(["b"]), {"b": vector(2)})
+
+    def test_caches_sharing_a_file_append_distinct_rows(self):
+        first = self.open_cache()
+        second = self.open_cache()
+        first.put_many({"a": vector(1)})
+        self.assertEqual(first.get_many(["a"]), {"a": vector(1)})
+
+        second.put_many({"b": vector(2)})
+        first.put_many({"c": vector(3)})
+        self.assertEqual(
+            first.get_many(["a", "b", "c"]),
+            {"a": vector(1), "b": vector(2), "c": vector(3)},
+        )
+        self.assertEqual(
+            second.get_many(["a", "b", "c"]),
+            {"a": vector(1), "b": vector(2), "c": vector(3)},
+        )
+
+    def test_partial_row_is_dropped_on_open(self):
+        cache = self.open_cache()
+        cache.put_many({"a": vector(1)})
+        cache.close()
+        # Left by a write interrupted before the row was indexed
+        with open(cache.vectors_path, "ab") as f:
+            f.write(b"\0\0")
+
+        reopened = self.open_cache()
+        self.assertEqual(os.path.getsize(reopened.vectors_path), reopened.row_size)
+        reopened.put_many({"b": vector(2)})
+        self.assertEqual(
+            reopened.get_many(["a", "b"]), {"a": vector(1), "b": vector(2)}
+        )
+
+    def test_vectors_must_have_the_model_dimensions(self):
+        cache = self.open_cache()
+        with self.assertRaises(ValueError):
+            cache.put_many({"a": [1.0, 2.0]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import re
+import unittest
+from typing import Optional, Tuple
+
+from scraper.scrapers.front_matter import get_front_matter_parser, load_yaml
+
+DELIMITERS = [("---", "---"), ("<pre>", "</pre>"), ("```", "```")]
+
+
+def legacy_split(text: str, start: str, end: str) -> Tuple[Optional[str], str]:
+    """The regex-based split that FrontMatterParser replaced."""
+    text = re.sub(r"{%.*?%}", "", text, flags=re.MULTILINE | re.DOTALL)
+    pattern = re.compile(
+        rf"^{re.escape(start)}\s*$(.*?)^{re.escape(end)}\s*$",
+        re.DOTALL | re.MULTILINE,
+    )
+    match = pattern.search(text)
+    if not match:
+        return None, text.strip()
+    return match.group(1).strip(), text[match.end() :].strip()
+
+
+# Written with "---" delimiters, replaced by each pair of delimiters
+TEXTS = [
+    "---\ntitle: Hello\nauthor: someone\n---\n\nBody text\n",
+    "No front matter at all\n",
+    "",
+    "---\ntitle: Trailing spaces\n---   \nBody\n",
+    "---  \ntitle: Spaces after the start\n---\nBody\n",
+    "---\r\ntitle: Windows line endings\r\n---\r\nBody\r\n",
+    "---\n---\nEmpty front matter\n",
+    "---\ntitle: Unterminated\nBody\n",
+    "Intro\n\n---\ntitle: Not at the start of the text\n---\nBody\n",
+    " ---\ntitle: Indented start\n---\nBody\n",
+    "---\ntitle: Indented end\n ---\nBody\n---\n",
+    "---\ntitle: Inline --- delimiter\n--- not alone\n---\nBody\n",
+    "---\ntitle: Second block\n---\nBody\n---\nmore: yaml\n---\nEnd\n",
+    "---\ntitle: Liquid\n---\n{% include a.html %}Body{% endif %}\n",
+    "{% raw %}\n---\ntitle: Liquid before\n---\nBody\n",
+    "---\ntitle: Multiline liquid {%\nif x\n%}\n---\nBody\n",
+    "---\ntitle: No final newline\n---",
+    "---\n\n\ntitle: Blank lines\n\n---\n\n\nBody",
+    "----\ntitle: Longer delimiter\n----\nBody\n",
+]
+
+
+class FrontMatterParserTest(unittest.TestCase):
+    def test_matches_legacy_regex(self):
+        for start, end in DELIMITERS:
+            parser = get_front_matter_parser(start, end)
+            for template in TEXTS:
+                text = self.with_delimiters(template, start, end)
+                with self.subTest(start=start, text=text):
+                    self.assertEqual(parser.split(text), legacy_split(text, start, end))
+
+    def test_splits_front_matter_and_body(self):
+        parser = get_front_matter_parser("---", "---")
+        front_matter, body = parser.split(TEXTS[0])
+        self.assertEqual(front_matter, "title: Hello\nauthor: someone")
+        self.assertEqual(body, "Body text")
+        self.assertEqual(
+            load_yaml(front_matter), {"title": "Hello", "author": "someone"}
+        )
+
+    def test_parsers_are_shared_per_delimiters(self):
+        self.assertIs(
+            get_front_matter_parser("---", "---"), get_front_matter_parser("---", "---")
+        )
+        self.assertIsNot(
+            get_front_matter_parser("---", "---"),
+            get_front_matter_parser("<pre>", "</pre>"),
+        )
+
+    @staticmethod
+    def with_delimiters(template: str, start: str, end: str) -> str:
+        """Replace the delimiters of a template, alternating `start` and `end`."""
+        parts = template.split("---")
+        text = parts[0]
+        for i, part in enumerate(parts[1:]):
+            text += (start if i % 2 == 0 else end) + part
+        return text
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import asyncio
+import os
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+from scraper.config import settings
+from scraper.scrapers.github import GithubScraper
+from tests.helpers import GitRepoTestCase, make_source_config
+
+
+async def collect(parsed):
+    return [(file_path, document) async for file_path, document in parsed]
+
+
+class ParseFilesTest(GitRepoTestCase):
+    def setUp(self):
+        super().setUp()
+        # Parse workers open the repository at DATA_DIR/repo
+        self.scraper = GithubScraper(
+            make_source_config(name="Repo"), output=None, processor_manager=None
+        )
+        self.files = []
+        for i in range(70):
+            path = f"docs/{i:02d}/2024-01-{i % 28 + 1:02d}-post.md"
+            front_matter = f"---\ntitle: Post {i}\ntags: [t{i % 3}]\n---\n"
+            self.write(path, f"{front_matter}\nBody {i}\n")
+            self.files.append(path)
+        # Not UTF-8, so it fails to parse
+        with open(os.path.join(self.repo_dir, "docs/latin1.md"), "wb") as f:
+            f.write("# Caf\u00e9\n".encode("latin-1"))
+        self.repo.git.add("docs/latin1.md")
+        self.files.insert(35, "docs/latin1.md")
+        self.commit()
+        self.scraper.commit = self.repo.head.commit
+
+    def dump(self, results):
+        return [
+            (path, document.model_dump(exclude={"indexed_at"}) if document else None)
+            for path, document in results
+        ]
+
+    def test_parallel_parsing_matches_sequential_parsing(self):
+        sequential = asyncio.run(
+            collect(self.scraper._parse_files_sequential(self.repo, iter(self.files)))
+        )
+        # More chunks than the two per worker submitted upfront, so later
+        # chunks are submitted as earlier ones complete
+        with mock.patch.dict(settings.config, {"parse_chunk_size": "8"}):
+            parallel = asyncio.run(
+                collect(self.scraper._parse_files_parallel(iter(self.files), 2))
+            )
+        self.assertEqual([path for path, _ in parallel], self.files)
+        self.assertEqual(self.dump(parallel), self.dump(sequential))
+        self.assertEqual(sequential[0][1].title, "Post 0")
+        self.assertIsNone(sequential[35][1])
+
+    def test_stopping_early_cancels_queued_chunks(self):
+        shutdown = ProcessPoolExecutor.shutdown
+
+        async def parse_first_file():
+            parsed = self.scraper._parse_files_parallel(iter(self.files), 1)
+            first = await anext(parsed)
+            await parsed.aclose()
+            return first
+
+        with mock.patch.dict(
+            settings.config, {"parse_chunk_size": "1"}
+        ), mock.patch.object(
+            ProcessPoolExecutor, "shutdown", autospec=True, side_effect=shutdown
+        ) as shutdown_mock:
+            file_path, document = asyncio.run(parse_first_file())
+
+        self.assertEqual(file_path, self.files[0])
+        self.assertEqual(document.title, "Post 0")
+        shutdown_mock.assert_called_once_with(
+            mock.ANY, wait=False, cancel_futures=True
+        )
+
+
+class GitObjectsTest(GitRepoTestCase):
+    def make_scraper(self, **fields) -> GithubScraper:
+        scraper = GithubScraper(
+            make_source_config(name="Clone", read_from_git_objects=True, **fields),
+            output=None,
+            processor_manager=None,
+        )
+        # Clone the test repository rather than a remote one
+        scraper.config.url = self.repo_dir
+        return scraper
+
+    def test_read_file_translates_newlines_like_the_working_tree(self):
+        self.write("doc.md", "Windows\r\nold Mac\rUnix\n", newline="")
+        self.commit()
+        scraper = self.make_scraper()
+        scraper.commit = self.repo.head.commit
+
+        self.assertEqual(
+            scraper.read_file(self.repo, "doc.md"), "Windows\nold Mac\nUnix\n"
+        )
+        scraper.config.read_from_git_objects = False
+        self.assertEqual(
+            scraper.read_file(self.repo, "doc.md"), "Windows\nold Mac\nUnix\n"
+        )
+
+    def test_fetch_repo_never_checks_out_files(self):
+        self.write("doc.md", "First\n")
+        first = self.commit()
+        scraper = self.make_scraper()
+
+        clone = scraper.fetch_repo()
+        self.assertEqual(os.listdir(scraper.repo_path), [".git"])
+        self.assertEqual(scraper.resolve_commit(clone).hexsha, first)
+
+        self.write("doc.md", "Second\n")
+        second = self.commit()
+        clone = scraper.fetch_repo()
+        self.assertEqual(os.listdir(scraper.repo_path), [".git"])
+        self.assertEqual(scraper.resolve_commit(clone).hexsha, second)
+        scraper.commit = scraper.resolve_commit(clone)
+        self.assertEqual(scraper.read_file(clone, "doc.md"), "Second\n")
+
+    def test_resolve_commit_uses_checkout_commit(self):
+        self.write("doc.md", "First\n")
+        first = self.commit()
+        self.write("doc.md", "Second\n")
+        self.commit()
+        scraper = self.make_scraper(checkout_commit=first)
+
+        clone = scraper.fetch_repo()
+        self.assertEqual(scraper.resolve_commit(clone).hexsha, first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import asyncio
+import os
+import unittest
+
+from scraper.scrapers.github import ChangeSet, GithubScraper
+from tests.helpers import GitRepoTestCase, make_source_config
+
+
+class ChangeSetTest(GitRepoTestCase):
+    def setUp(self):
+        super().setUp()
+        self.scraper = GithubScraper(
+            make_source_config(), output=None, processor_manager=None
+        )
+
+    def move(self, old_path: str, new_path: str):
+        new_dir = os.path.join(self.repo_dir, os.path.dirname(new_path))
+        os.makedirs(new_dir, exist_ok=True)
+        self.repo.git.mv(old_path, new_path)
+
+    def change_set(self, previous_commit: str) -> ChangeSet:
+        self.scraper.commit = self.repo.head.commit
+        return self.scraper.get_change_set(self.repo, previous_commit)
+
+    def test_changes_are_grouped_by_kind(self):
+        # Distinct contents, so that renames are detected by similarity
+        contents = {
+            name: f"# {name}\n\n" + f"Line about {name}.\n" * 20
+            for name in ["modified", "deleted", "renamed", "to_text", "from_text"]
+        }
+        self.write("docs/modified.md", contents["modified"])
+        self.write("docs/deleted.md", contents["deleted"])
+        self.write("docs/renamed.md", contents["renamed"])
+        self.write("docs/to_text.md", contents["to_text"])
+        self.write("docs/from_text.txt", contents["from_text"])
+        self.write("docs/notes.txt", "not relevant\n")
+        previous = self.commit()
+
+        self.write("docs/added.md", "# Added\n")
+        self.write("docs/modified.md", contents["modified"] + "More.\n")
+        self.repo.git.rm("docs/deleted.md")
+        self.move("docs/renamed.md", "docs/moved/renamed.md")
+        self.move("docs/to_text.md", "docs/to_text.txt")
+        self.move("docs/from_text.txt", "docs/from_text.md")
+        self.write("docs/notes.txt", "still not relevant\n")
+        self.commit()
+
+        change_set = self.change_set(previous)
+        self.assertEqual(
+            sorted(change_set.added), ["docs/added.md", "docs/from_text.md"]
+        )
+        self.assertEqual(change_set.modified, ["docs/modified.md"])
+        self.assertEqual(
+            sorted(change_set.deleted), ["docs/deleted.md", "docs/to_text.md"]
+        )
+        self.assertEqual(
+            change_set.renamed, [("docs/renamed.md", "docs/moved/renamed.md")]
+        )
+        self.assertEqual(
+            sorted(change_set.files_to_process()),
+            [
+                "docs/added.md",
+                "docs/from_text.md",
+                "docs/modified.md",
+                "docs/moved/renamed.md",
+            ],
+        )
+
+    def test_changed_files_are_listed_eagerly(self):
+        self.write("docs/first.md", "# First\n")
+        self.write("docs/notes.txt", "not relevant\n")
+        previous = self.commit()
+        self.write("docs/second.md", "# Second\n")
+        self.commit()
+        self.scraper.commit = self.repo.head.commit
+
+        all_files = self.scraper.get_changed_files(self.repo, None)
+        self.assertEqual(all_files, ["docs/first.md", "docs/second.md"])
+        self.assertIsNone(self.scraper.change_set)
+
+        changed_files = self.scraper.get_changed_files(self.repo, previous)
+        self.assertEqual(changed_files, ["docs/second.md"])
+        self.assertEqual(self.scraper.change_set.added, ["docs/second.md"])
+
+    def test_removed_and_renamed_documents_are_deleted(self):
+        change_set = ChangeSet(
+            deleted=["docs/deleted.md"],
+            renamed=[
+                ("docs/old.md", "docs/new.md"),
+                # Same id once the extension is dropped, nothing to delete
+                ("docs/same.md", "docs/same.markdown"),
+            ],
+        )
+        deleted = []
+
+        async def delete_documents(ids):
+            deleted.extend(ids)
+
+        self.scraper.delete_documents = delete_documents
+        asyncio.run(self.scraper.delete_removed_documents(change_set))
+        self.assertEqual(
+            deleted,
+            [
+                self.scraper.generate_id("docs/deleted.md"),
+                self.scraper.generate_id("docs/old.md"),
+            ],
+        )
+
+    def test_no_deletions_without_removed_documents(self):
+        deleted = []
+
+        async def delete_documents(ids):
+            deleted.extend(ids)
+
+        self.scraper.delete_documents = delete_documents
+        asyncio.run(self.scraper.delete_removed_documents(ChangeSet(added=["a.md"])))
+        self.assertEqual(deleted, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import asyncio
+import gzip
+import json
+import unittest
+
+from scraper.outputs.jsonl_output import JsonlOutput, zstandard
+from tests.helpers import TempDirTestCase, make_document, make_run
+
+
+class JsonlOutputTest(TempDirTestCase):
+    def make_output(self, **kwargs) -> JsonlOutput:
+        return JsonlOutput(index_name="test", batch_size=2, **kwargs)
+
+    def write(self, output: JsonlOutput):
+        async def run():
+            async with output:
+                for doc_id in ["a", "b", "c"]:
+                    await output.index_document(make_document(doc_id))
+                await output.delete_documents(["old"])
+
+        asyncio.run(run())
+
+    def read_lines(self, data: bytes):
+        return [json.loads(line) for line in data.decode("utf-8").splitlines()]
+
+    def assert_written(self, records):
+        self.assertEqual([record["id"] for record in records], ["a", "b", "c", "old"])
+        self.assertEqual(records[0]["title"], "Title a")
+        self.assertEqual(records[-1], {"id": "old", "deleted": True})
+
+    def test_documents_and_tombstones(self):
+        output = self.make_output()
+        self.write(output)
+        with open(output.output_file, "rb") as f:
+            self.assert_written(self.read_lines(f.read()))
+
+    def test_gzip_compression(self):
+        output = self.make_output()
+        output.compression = "gzip"
+        output.output_file += ".gz"
+        self.write(output)
+        with gzip.open(output.output_file, "rb") as f:
+            self.assert_written(self.read_lines(f.read()))
+
+    @unittest.skipIf(zstandard is None, "zstandard is not installed")
+    def test_zstd_compression(self):
+        output = self.make_output()
+        output.compression = "zstd"
+        output.output_file += ".zst"
+        self.write(output)
+        with open(output.output_file, "rb") as f:
+            reader = zstandard.ZstdDecompressor().stream_reader(f)
+            self.assert_written(self.read_lines(reader.read()))
+
+    def test_sources_write_to_their_own_file(self):
+        first = self.make_output(source_name="Delving Bitcoin")
+        second = self.make_output(source_name="BitcoinTalk")
+        self.assertNotEqual(first.output_file, second.output_file)
+        self.assertIn("delving-bitcoin", first.output_file)
+
+    def test_last_successful_run(self):
+        output = self.make_output()
+
+        async def run():
+            await output.record_run(make_run("A", "2024-01-01T00:00:00"))
+            await output.record_run(make_run("A", "2024-03-01T00:00:00"))
+            await output.record_run(make_run("A", "2024-04-01T00:00:00", False))
+            await output.record_run(make_run("B", "2024-05-01T00:00:00"))
+            return (
+                await output.get_last_successful_run("a"),
+                await output.get_last_successful_run("C"),
+            )
+
+        last_run, missing = asyncio.run(run())
+        self.assertEqual(last_run.finished_at, "2024-03-01T00:00:00")
+        self.assertIsNone(missing)
+
+
+if __name__ == "__main__":
+    unittest.main()
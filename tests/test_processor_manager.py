@@ -0,0 +1,246 @@
+import asyncio
+import unittest
+from typing import List
+from unittest import mock
+
+from scraper.models import ScrapedDocument
+from scraper.processors import BaseProcessor, ProcessorManager
+from scraper.registry import processor_registry
+from tests.helpers import make_document
+
+
+class RecordingProcessor(BaseProcessor):
+    """Tags documents with its name and records the batches it is given."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.batches: List[List[str]] = []
+        self.closed = False
+
+    async def process(self, document: ScrapedDocument) -> ScrapedDocument:
+        document.tags = (document.tags or []) + [self.name]
+        return document
+
+    async def process_batch(
+        self, documents: List[ScrapedDocument]
+    ) -> List[ScrapedDocument]:
+        self.batches.append([document.id for document in documents])
+        return await super().process_batch(documents)
+
+    def close(self):
+        self.closed = True
+
+
+class SlowProcessor(RecordingProcessor):
+    async def process_batch(
+        self, documents: List[ScrapedDocument]
+    ) -> List[ScrapedDocument]:
+        await asyncio.sleep(0.1)
+        return await super().process_batch(documents)
+
+
+class FailingProcessor(RecordingProcessor):
+    async def process_batch(
+        self, documents: List[ScrapedDocument]
+    ) -> List[ScrapedDocument]:
+        raise RuntimeError("processing failed")
+
+
+class Collector:
+    def __init__(self):
+        self.documents: List[ScrapedDocument] = []
+
+    async def __call__(self, document: ScrapedDocument):
+        self.documents.append(document)
+
+    @property
+    def ids(self) -> List[str]:
+        return [document.id for document in self.documents]
+
+
+class BatchingTest(unittest.TestCase):
+    def test_full_batch_is_processed_at_once(self):
+        processor = RecordingProcessor("p")
+        manager = ProcessorManager([processor], batch_size=3, max_latency=60)
+        sink = Collector()
+
+        async def run():
+            for doc_id in ["a", "b"]:
+                await manager.submit(make_document(doc_id), sink)
+            self.assertEqual(sink.ids, [])
+            await manager.submit(make_document("c"), sink)
+            self.assertEqual(sink.ids, ["a", "b", "c"])
+            self.assertIsNone(manager._timer)
+
+        asyncio.run(run())
+        self.assertEqual(processor.batches, [["a", "b", "c"]])
+        self.assertEqual(sink.documents[0].tags, ["p"])
+
+    def test_partial_batch_is_processed_after_the_latency(self):
+        processor = RecordingProcessor("p")
+        manager = ProcessorManager([processor], batch_size=10, max_latency=0.05)
+        sink = Collector()
+
+        async def run():
+            await manager.submit(make_document("a"), sink)
+            await manager.submit(make_document("b"), sink)
+            self.assertEqual(sink.ids, [])
+            await asyncio.sleep(0.2)
+            self.assertEqual(sink.ids, ["a", "b"])
+            # A new batch starts a new timer
+            await manager.submit(make_document("c"), sink)
+            await asyncio.sleep(0.2)
+
+        asyncio.run(run())
+        self.assertEqual(processor.batches, [["a", "b"], ["c"]])
+
+    def test_flush_processes_queued_documents(self):
+        processor = RecordingProcessor("p")
+        manager = ProcessorManager([processor], batch_size=10, max_latency=60)
+        sink = Collector()
+
+        async def run():
+            await manager.submit(make_document("a"), sink)
+            await manager.flush()
+            self.assertIsNone(manager._timer)
+
+        asyncio.run(run())
+        self.assertEqual(sink.ids, ["a"])
+
+    def test_documents_are_processed_one_by_one_without_batching(self):
+        processor = RecordingProcessor("p")
+        manager = ProcessorManager([processor], batch_size=1)
+        sink = Collector()
+
+        async def run():
+            await manager.submit(make_document("a"), sink)
+            self.assertEqual(sink.ids, ["a"])
+
+        asyncio.run(run())
+        self.assertEqual(processor.batches, [])
+
+    def test_close_processes_queued_documents(self):
+        processor = RecordingProcessor("p")
+        manager = ProcessorManager([processor], batch_size=10, max_latency=60)
+        sink = Collector()
+
+        async def run():
+            await manager.submit(make_document("a"), sink)
+            await manager.submit(make_document("b"), sink)
+            await manager.close()
+            self.assertIsNone(manager._timer)
+
+        asyncio.run(run())
+        self.assertEqual(sink.ids, ["a", "b"])
+        self.assertTrue(processor.closed)
+
+    def test_close_waits_for_a_batch_flushed_by_the_timer(self):
+        processor = SlowProcessor("p")
+        manager = ProcessorManager([processor], batch_size=10, max_latency=0.01)
+        sink = Collector()
+
+        async def run():
+            await manager.submit(make_document("a"), sink)
+            # The timer is now processing the batch
+            await asyncio.sleep(0.05)
+            await manager.submit(make_document("b"), sink)
+            await manager.close()
+
+        asyncio.run(run())
+        self.assertEqual(processor.batches, [["a"], ["b"]])
+        self.assertEqual(sink.ids, ["a", "b"])
+
+    def test_close_logs_processing_errors(self):
+        processor = FailingProcessor("p")
+        manager = ProcessorManager([processor], batch_size=10, max_latency=60)
+        sink = Collector()
+
+        async def run():
+            await manager.submit(make_document("a"), sink)
+            await manager.close()
+
+        asyncio.run(run())
+        self.assertEqual(sink.ids, [])
+        self.assertTrue(processor.closed)
+
+    def test_close_closes_the_processors(self):
+        processors = [RecordingProcessor("p"), RecordingProcessor("q")]
+        manager = ProcessorManager(processors, batch_size=1)
+        asyncio.run(manager.close())
+        self.assertTrue(all(processor.closed for processor in processors))
+
+
+class TitleProcessor(BaseProcessor):
+    async def process(self, document: ScrapedDocument) -> ScrapedDocument:
+        document.title = document.title.upper()
+        return document
+
+
+class SummaryProcessor(BaseProcessor):
+    async def process(self, document: ScrapedDocument) -> ScrapedDocument:
+        document.summary = f"Summary of {document.id}"
+        return document
+
+
+class CombiningProcessor(BaseProcessor):
+    depends_on = ["test_title", "test_summary"]
+
+    async def process(self, document: ScrapedDocument) -> ScrapedDocument:
+        document.body = f"{document.title} / {document.summary}"
+        return document
+
+
+class CyclicProcessor(BaseProcessor):
+    depends_on = ["test_cyclic"]
+
+    async def process(self, document: ScrapedDocument) -> ScrapedDocument:
+        return document
+
+
+class DependenciesTest(unittest.TestCase):
+    def setUp(self):
+        patch = mock.patch.dict(
+            processor_registry._registry,
+            {
+                "test_title": TitleProcessor,
+                "test_summary": SummaryProcessor,
+                "test_combining": CombiningProcessor,
+                "test_cyclic": CyclicProcessor,
+            },
+        )
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_processors_run_after_their_dependencies(self):
+        combining, title, summary = (
+            CombiningProcessor(),
+            TitleProcessor(),
+            SummaryProcessor(),
+        )
+        manager = ProcessorManager([combining, title, summary], batch_size=1)
+        self.assertEqual(manager.stages, [[title, summary], [combining]])
+
+        document = asyncio.run(manager.process_document(make_document("a")))
+        # Changes of concurrent processors are merged before the next stage
+        self.assertEqual(document.body, "TITLE A / Summary of a")
+
+        documents = asyncio.run(
+            manager.process_batch([make_document("b"), make_document("c")])
+        )
+        self.assertEqual(
+            [document.body for document in documents],
+            ["TITLE B / Summary of b", "TITLE C / Summary of c"],
+        )
+
+    def test_dependencies_on_unused_processors_are_ignored(self):
+        combining = CombiningProcessor()
+        manager = ProcessorManager([combining], batch_size=1)
+        self.assertEqual(manager.stages, [[combining]])
+
+    def test_circular_dependencies_are_rejected(self):
+        with self.assertRaisesRegex(ValueError, "Circular"):
+            ProcessorManager([CyclicProcessor(), CyclicProcessor()], batch_size=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
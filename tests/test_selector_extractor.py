@@ -0,0 +1,106 @@
+import os
+import unittest
+
+from scraper.benchmarks.selectors import (
+    BitcoinTalkExtractor,
+    extract_page,
+    parse_with_lxml,
+    parse_with_soup,
+)
+from scraper.config import get_project_root
+from scraper.scrapers.scrapy.spider_config import SpiderConfig
+from scraper.utils import html_to_markdown
+
+POST = """
+<tr><td class="{style}">
+  <table><tr>
+    <td class="poster_info"><b><a href="/profile;u={n}">author{n}</a></b></td>
+    <td class="td_headerandpost">
+      <table><tr>
+        <td><div class="subject">
+          <a href="https://bitcointalk.org/index.php?topic=1.msg{n}#msg{n}">
+            Re: Topic &amp; title</a>
+        </div></td>
+      </tr></table>
+      <div class="smalltext">March 1{n}, 2024, 0{n}:15:00 PM</div>
+      <div class="post">{body}</div>
+    </td>
+  </tr></table>
+</td></tr>
+"""
+
+BODIES = [
+    "Plain <b>bold</b> text<br/>on two lines",
+    '<div class="quoteheader"><a href="#">Quote from: someone</a></div>'
+    '<div class="quote">Quoted <i>text</i></div>Reply after the quote',
+    "<ul><li>One</li><li>Two &lt;3</li></ul><code>x = 1</code>",
+    '<div class="quote">Only a quote</div>',
+    "Unicode: café, ₿<script>ignored()</script>",
+]
+
+TOPIC_PAGE = (
+    '<html><body><table class="bordercolor"><tr><td><table>'
+    + "".join(
+        POST.format(n=n, style="windowbg" if n % 2 else "windowbg2", body=body)
+        for n, body in enumerate(BODIES, start=1)
+    )
+    + "</table></td></tr></table>"
+    + '<table><tr><td class="middletext">'
+    '<span class="prevnext"><a class="navPages" href="?topic=1.0">1</a></span>'
+    '<span class="prevnext"><a class="navPages" href="?topic=1.20">2</a></span>'
+    "</td></tr></table></body></html>"
+).encode("utf-8")
+
+
+class SelectorEnginesTest(unittest.TestCase):
+    def setUp(self):
+        self.spider_config = SpiderConfig(
+            os.path.join(
+                get_project_root(), "scrapy_sources_configs", "bitcointalk.yaml"
+            )
+        )
+        self.extractor = BitcoinTalkExtractor()
+
+    def test_lxml_engine_matches_beautifulsoup_engine(self):
+        soup_items = extract_page(
+            self.extractor, parse_with_soup(TOPIC_PAGE), self.spider_config
+        )
+        lxml_items = extract_page(
+            self.extractor, parse_with_lxml(TOPIC_PAGE), self.spider_config
+        )
+        self.assertEqual(len(soup_items), len(BODIES))
+        self.assertEqual(lxml_items, soup_items)
+        self.assertEqual(soup_items[0]["author"], "author1")
+        self.assertEqual(soup_items[1]["content"], "Reply after the quote")
+        self.assertIsNone(soup_items[3]["content"])
+
+    def test_processed_html_converts_to_the_same_markdown(self):
+        item_config = self.spider_config.scraping_config.resource_page.items
+        bodies = []
+        for root in (parse_with_soup(TOPIC_PAGE), parse_with_lxml(TOPIC_PAGE)):
+            items = self.extractor._extract_items(root, item_config.item_selector)
+            results = [
+                self.extractor._extract_field(item, item_config.content)
+                for item in items
+            ]
+            bodies.append(
+                [
+                    html_to_markdown(result.processed_html)[0].strip()
+                    if result.text
+                    else None
+                    for result in results
+                ]
+            )
+        self.assertEqual(bodies[1], bodies[0])
+        self.assertNotIn("Quoted", bodies[0][1])
+
+    def test_next_page_links_match(self):
+        next_page = self.spider_config.scraping_config.resource_page.next_page
+        for root in (parse_with_soup(TOPIC_PAGE), parse_with_lxml(TOPIC_PAGE)):
+            self.assertEqual(
+                self.extractor._extract_next_page(root, next_page), "?topic=1.20"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
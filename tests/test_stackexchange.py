@@ -0,0 +1,124 @@
+import asyncio
+import unittest
+
+from scraper.scrapers.stackexchange import StackExchangeScraper
+from tests.helpers import make_source_config
+
+
+def make_scraper() -> StackExchangeScraper:
+    return StackExchangeScraper(
+        make_source_config(
+            name="StackExchange",
+            domain="https://bitcoin.stackexchange.com",
+            url="https://api.stackexchange.com",
+        ),
+        output=None,
+        processor_manager=None,
+    )
+
+
+class PostDetailsTest(unittest.TestCase):
+    def setUp(self):
+        self.scraper = make_scraper()
+        self.calls = []
+        self.scraper._api_get = self.api_get
+
+    async def api_get(self, method, params):
+        """
+        Answer n belongs to question n % 7, questions with an even id have an
+        accepted answer.
+        """
+        self.calls.append((method, params))
+        kind, ids = method.split("/")
+        ids = [int(i) for i in ids.split(";")]
+        if kind == "answers":
+            items = [{"answer_id": i, "question_id": i % 7} for i in ids]
+        else:
+            items = [
+                {
+                    "question_id": i,
+                    "tags": [f"tag{i}"],
+                    **({"accepted_answer_id": 1000 + i} if i % 2 == 0 else {}),
+                }
+                for i in ids
+            ]
+        return {"items": items, "quota_remaining": 100}
+
+    def test_details_of_questions_and_answers(self):
+        posts = [
+            {"post_id": 2, "post_type": "question"},
+            {"post_id": 3, "post_type": "question"},
+            {"post_id": 10, "post_type": "answer"},
+        ]
+        details = asyncio.run(self.scraper._get_post_details(posts))
+
+        self.assertEqual(
+            details[2],
+            {
+                "accepted_answer_id": "1002",
+                "tags": ["tag2"],
+                "thread_url": "https://bitcoin.stackexchange.com/q/2",
+            },
+        )
+        self.assertIsNone(details[3]["accepted_answer_id"])
+        # Answers get the details of their question
+        self.assertEqual(details[10], details[3])
+        self.assertEqual(
+            [method for method, _ in self.calls], ["answers/10", "questions/2;3"]
+        )
+
+    def test_ids_are_fetched_in_batches(self):
+        posts = [{"post_id": i, "post_type": "answer"} for i in range(100, 350)]
+        posts += [{"post_id": i, "post_type": "question"} for i in range(1, 6)]
+        details = asyncio.run(self.scraper._get_post_details(posts))
+
+        self.assertEqual(len(details), 255)
+        answer_batches = [
+            method.split("/")[1].split(";")
+            for method, _ in self.calls
+            if method.startswith("answers/")
+        ]
+        self.assertEqual([len(batch) for batch in answer_batches], [100, 100, 50])
+        self.assertEqual(
+            sorted(int(i) for batch in answer_batches for i in batch),
+            list(range(100, 350)),
+        )
+        # Questions of the answers and of the posts, fetched at once
+        self.assertEqual(
+            [method for method, _ in self.calls if method.startswith("questions/")],
+            ["questions/0;1;2;3;4;5;6"],
+        )
+        self.assertEqual(details[349]["tags"], ["tag6"])
+        for _, params in self.calls:
+            self.assertEqual(params["filter"], self.scraper.details_filter)
+            self.assertEqual(params["pagesize"], 100)
+
+    def test_no_request_without_posts(self):
+        self.assertEqual(asyncio.run(self.scraper._get_post_details([])), {})
+        self.assertEqual(self.calls, [])
+
+
+class DetailsFilterTest(unittest.TestCase):
+    def test_filter_keeps_the_response_wrapper_fields(self):
+        scraper = make_scraper()
+        calls = []
+
+        async def api_get(method, params):
+            calls.append((method, params))
+            return {"items": [{"filter": "!abc"}]}
+
+        scraper._api_get = api_get
+        self.assertEqual(asyncio.run(scraper._get_details_filter()), "!abc")
+
+        method, params = calls[0]
+        self.assertEqual(method, "filters/create")
+        self.assertEqual(params["base"], "none")
+        included = params["include"].split(";")
+        for field in [".items", ".backoff", ".quota_remaining"]:
+            self.assertIn(field, included)
+        self.assertIn("question.tags", included)
+        self.assertIn("answer.question_id", included)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+import os
+import unittest
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from unittest import mock
+
+from scraper.scrapers import stackexchange_dump
+from scraper.scrapers.stackexchange_dump import StackExchangeDumpScraper, iter_rows
+from tests.helpers import TempDirTestCase, make_source_config
+from tests.test_stackexchange import make_scraper as make_api_scraper
+
+BODY = "&lt;p&gt;What is &lt;b&gt;Bitcoin&lt;/b&gt;?&lt;/p&gt;"
+
+POSTS = f"""<?xml version="1.0" encoding="utf-8"?>
+<posts>
+  <row Id="1" PostTypeId="1" AcceptedAnswerId="3" OwnerUserId="10"
+       CreationDate="2011-08-30T21:15:29.990" Title="What &amp; why"
+       Tags="&lt;mining&gt;&lt;fees&gt;" Body="{BODY}" />
+  <row Id="2" PostTypeId="1" OwnerDisplayName="anon"
+       CreationDate="2011-08-31T10:00:00.000" Title="Taproot" Tags="|taproot|"
+       Body="&lt;p&gt;Second&lt;/p&gt;" />
+  <row Id="3" PostTypeId="2" ParentId="1" OwnerUserId="11"
+       CreationDate="2011-08-31T11:00:00.000" Body="&lt;p&gt;Answer&lt;/p&gt;" />
+  <row Id="4" PostTypeId="2" ParentId="99" OwnerUserId="11"
+       CreationDate="2011-08-31T12:00:00.000" Body="&lt;p&gt;Orphan&lt;/p&gt;" />
+  <row Id="5" PostTypeId="5" CreationDate="2011-08-31T13:00:00.000" Body="" />
+</posts>
+"""
+
+USERS = """<?xml version="1.0" encoding="utf-8"?>
+<users>
+  <row Id="10" DisplayName="Alice" />
+  <row Id="11" DisplayName="Bob" />
+</users>
+"""
+
+
+class DumpTest(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.scraper = StackExchangeDumpScraper(
+            make_source_config(
+                name="StackExchangeDump", domain="https://bitcoin.stackexchange.com"
+            ),
+            output=None,
+            processor_manager=None,
+        )
+        os.makedirs(self.scraper.dump_dir)
+        self.posts_path = os.path.join(self.scraper.dump_dir, "Posts.xml")
+        self.users_path = os.path.join(self.scraper.dump_dir, "Users.xml")
+        for path, content in [(self.posts_path, POSTS), (self.users_path, USERS)]:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+
+    def read_documents(self):
+        users = self.scraper._read_users(self.users_path)
+        questions = self.scraper._read_questions(self.posts_path)
+        self.scraper.resources_to_process = 0
+        rows = iter_rows(self.posts_path)
+        with mock.patch.object(stackexchange_dump, "ROWS_PER_BATCH", 2):
+            batches = []
+            while True:
+                documents = self.scraper._next_documents(rows, users, questions)
+                if documents is None:
+                    break
+                batches.append(documents)
+        return [document for batch in batches for document in batch]
+
+    def test_rows_are_cleared_once_read(self):
+        iterparse = ET.iterparse
+        roots = []
+
+        def recording_iterparse(*args, **kwargs):
+            for event, elem in iterparse(*args, **kwargs):
+                if not roots:
+                    roots.append(elem)
+                yield event, elem
+
+        with mock.patch.object(ET, "iterparse", recording_iterparse):
+            ids = []
+            for row in iter_rows(self.posts_path):
+                # Rows already read are no longer attached to the root
+                attached = {child.get("Id") for child in roots[0]}
+                self.assertFalse(attached & set(ids))
+                ids.append(row["Id"])
+        self.assertEqual(ids, ["1", "2", "3", "4", "5"])
+        self.assertEqual(len(roots[0]), 0)
+
+    def test_first_pass_keeps_only_question_titles_and_tags(self):
+        self.assertEqual(
+            self.scraper._read_questions(self.posts_path),
+            {1: ("What & why", "<mining><fees>"), 2: ("Taproot", "|taproot|")},
+        )
+
+    def test_answers_are_joined_with_their_question(self):
+        documents = self.read_documents()
+
+        # The answer to a missing question and the tag wiki are skipped
+        self.assertEqual(
+            [document.id for document in documents],
+            ["stackexchange-1", "stackexchange-2", "stackexchange-3"],
+        )
+        self.assertEqual(self.scraper.resources_to_process, 4)
+
+        question, second, answer = documents
+        self.assertEqual(question.tags, ["mining", "fees"])
+        self.assertEqual(question.accepted_answer_id, "3")
+        self.assertEqual(second.tags, ["taproot"])
+        self.assertEqual(second.authors, ["anon"])
+        self.assertEqual(answer.title, "What & why")
+        self.assertEqual(answer.tags, ["mining", "fees"])
+        self.assertEqual(answer.authors, ["Bob"])
+        self.assertEqual(answer.type, "answer")
+        self.assertEqual(answer.url, "https://bitcoin.stackexchange.com/a/3")
+        self.assertEqual(answer.thread_url, "https://bitcoin.stackexchange.com/q/1")
+        self.assertEqual(answer.created_at, "2011-08-31T11:00:00")
+
+    def test_documents_match_those_of_the_api_scraper(self):
+        dump_document = self.read_documents()[0]
+
+        api_post = {
+            "post_id": 1,
+            "post_type": "question",
+            "title": "What &amp; why",
+            "body": "<p>What is <b>Bitcoin</b>?</p>",
+            "body_markdown": "What is **Bitcoin**?",
+            "owner": {"display_name": "Alice"},
+            "creation_date": int(datetime(2011, 8, 30, 21, 15, 29).timestamp()),
+            "link": "https://bitcoin.stackexchange.com/q/1",
+        }
+        api_details = {
+            "accepted_answer_id": "3",
+            "tags": ["mining", "fees"],
+            "thread_url": "https://bitcoin.stackexchange.com/q/1",
+        }
+        api_document = make_api_scraper()._process_post(api_post, api_details)
+
+        self.assertEqual(
+            dump_document.model_dump(exclude={"indexed_at"}),
+            api_document.model_dump(exclude={"indexed_at"}),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from scraper.storage import FingerprintStore
+from tests.helpers import TempDirTestCase, make_document
+
+
+def fingerprinted(doc_id: str, body: str = None):
+    document = make_document(doc_id, **({"body": body} if body else {}))
+    document.content_hash = document.compute_content_hash()
+    return document
+
+
+class FingerprintStoreTest(TempDirTestCase):
+    def test_fingerprints_are_only_stored_on_commit(self):
+        store = FingerprintStore("source:output:index")
+        self.addCleanup(store.close)
+        document = fingerprinted("a")
+        store.stage(document)
+        self.assertFalse(store.is_unchanged(document))
+
+        store.commit()
+        self.assertTrue(store.is_unchanged(document))
+        self.assertFalse(store.is_unchanged(fingerprinted("a", body="Changed")))
+
+    def test_excluded_ids_are_not_committed(self):
+        with FingerprintStore("source:output:index") as store:
+            store.stage(fingerprinted("indexed"))
+            store.stage(fingerprinted("failed"))
+            store.commit(exclude_ids=["failed"])
+
+        with FingerprintStore("source:output:index") as store:
+            self.assertTrue(store.is_unchanged(fingerprinted("indexed")))
+            self.assertIsNone(store.get("failed"))
+
+    def test_namespaces_are_separate(self):
+        with FingerprintStore("a:output:index") as store:
+            store.stage(fingerprinted("doc"))
+            store.commit()
+        with FingerprintStore("b:output:index") as store:
+            self.assertFalse(store.is_unchanged(fingerprinted("doc")))
+
+    def test_forgotten_fingerprints_are_deleted_on_commit(self):
+        with FingerprintStore("source:output:index") as store:
+            store.stage(fingerprinted("deleted"))
+            store.stage(fingerprinted("kept"))
+            store.commit()
+
+            store.stage(fingerprinted("staged_then_deleted"))
+            store.forget(["deleted", "staged_then_deleted"])
+            self.assertIsNotNone(store.get("deleted"))
+            store.commit()
+
+            self.assertIsNone(store.get("deleted"))
+            self.assertIsNone(store.get("staged_then_deleted"))
+            self.assertIsNotNone(store.get("kept"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import asyncio
+import unittest
+from typing import List
+from unittest import mock
+
+from scraper.processors.summarization_processor import SummarizationProcessor
+from scraper.processors.summarizers import BaseSummarizer, split_markdown
+
+SECTION = "# {title}\n\n" + "Some text about {title}.\n\n" * 8
+
+
+class SplitMarkdownTest(unittest.TestCase):
+    def test_chunks_start_at_headings(self):
+        sections = [SECTION.format(title=title) for title in ["A", "B", "C"]]
+        chunks = split_markdown("".join(sections), len(sections[0]) + 10)
+        self.assertEqual(chunks, [section.strip() for section in sections])
+
+    def test_sections_are_grouped_up_to_the_limit(self):
+        sections = [SECTION.format(title=title) for title in ["A", "B", "C"]]
+        chunks = split_markdown("".join(sections), 2 * len(sections[0]))
+        self.assertEqual(
+            chunks, [(sections[0] + sections[1]).strip(), sections[2].strip()]
+        )
+
+    def test_headings_in_code_blocks_are_ignored(self):
+        code = "```python\n# not a heading\nx = 1\n```\n\n"
+        first = SECTION.format(title="A") + code
+        second = SECTION.format(title="B")
+        chunks = split_markdown(first + second, len(first) + 1)
+        self.assertEqual(chunks, [first.strip(), second.strip()])
+
+    def test_text_without_headings_is_split_between_paragraphs(self):
+        paragraphs = [f"Paragraph {i} " + "word " * 10 for i in range(6)]
+        text = "\n\n".join(paragraphs)
+        chunks = split_markdown(text, 2 * len(paragraphs[0]) + 4)
+        self.assertEqual(
+            chunks,
+            [
+                "\n\n".join(paragraphs[i : i + 2]).strip()
+                for i in range(0, len(paragraphs), 2)
+            ],
+        )
+
+    def test_long_paragraphs_are_cut(self):
+        chunks = split_markdown("x" * 25, 10)
+        self.assertEqual(chunks, ["x" * 10, "x" * 10, "x" * 5])
+
+
+class FakeSummarizer(BaseSummarizer):
+    model_name = "fake"
+    cached = False
+
+    def __init__(self, max_input_chars: int):
+        self.max_input_chars = max_input_chars
+        self.summarized: List[str] = []
+        self.combined: List[List[str]] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def summarize(self, text: str) -> str:
+        self.summarized.append(text)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return f"summary {len(self.summarized)}"
+
+    async def combine(self, summaries: List[str]) -> str:
+        self.combined.append(summaries)
+        return " + ".join(summaries)
+
+
+class MapReduceTest(unittest.TestCase):
+    def make_processor(self, max_input_chars: int) -> SummarizationProcessor:
+        self.summarizer = FakeSummarizer(max_input_chars)
+        with mock.patch(
+            "scraper.processors.summarization_processor.create_summarizer",
+            return_value=self.summarizer,
+        ):
+            return SummarizationProcessor()
+
+    def test_short_text_is_summarized_at_once(self):
+        processor = self.make_processor(1000)
+        summary = asyncio.run(processor.summarize("Short text"))
+        self.assertEqual(summary, "summary 1")
+        self.assertEqual(self.summarizer.summarized, ["Short text"])
+        self.assertEqual(self.summarizer.combined, [])
+
+    def test_sections_are_summarized_and_combined(self):
+        sections = [SECTION.format(title=str(i)) for i in range(10)]
+        processor = self.make_processor(len(sections[0]))
+        summary = asyncio.run(processor.summarize("".join(sections)))
+
+        self.assertEqual(len(self.summarizer.summarized), 10)
+        self.assertEqual(len(self.summarizer.combined), 1)
+        self.assertEqual(summary, " + ".join(self.summarizer.combined[0]))
+        # summarization_concurrency defaults to 4
+        self.assertEqual(self.summarizer.max_running, 4)
+
+    def test_single_section_skips_the_reduce_step(self):
+        section = SECTION.format(title="A")
+        processor = self.make_processor(len(section))
+        summary = asyncio.run(processor.summarize(section + "\n" * 20))
+
+        self.assertEqual(summary, "summary 1")
+        self.assertEqual(self.summarizer.summarized, [section.strip()])
+        self.assertEqual(self.summarizer.combined, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import random
+import unittest
+from collections import Counter
+from typing import List
+
+from scraper.processors.topic_matcher import TopicMatcher
+
+
+def is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def naive_count(topics: List[str], text: str) -> Counter:
+    """Count whole-word occurrences by searching for each topic on its own."""
+    text = text.lower()
+    counts: Counter = Counter()
+    for topic in topics:
+        pattern = topic.lower()
+        if not pattern:
+            continue
+        start = text.find(pattern)
+        while start >= 0:
+            end = start + len(pattern)
+            starts_word = not is_word_char(pattern[0]) or (
+                start == 0 or not is_word_char(text[start - 1])
+            )
+            ends_word = not is_word_char(pattern[-1]) or (
+                end == len(text) or not is_word_char(text[end])
+            )
+            if starts_word and ends_word:
+                counts[topic] += 1
+            start = text.find(pattern, start + 1)
+    return counts
+
+
+TOPICS = [
+    "Taproot",
+    "Schnorr signatures",
+    "Lightning Network",
+    "Lightning",
+    "Network",
+    "PSBT",
+    "C++",
+    "fee",
+    "fees",
+    "Fee bumping",
+    "segwit",
+    "Segregated Witness",
+    "aa",
+    "a",
+]
+
+VOCABULARY = [
+    "taproot",
+    "taproot's",
+    "taprooted",
+    "schnorr",
+    "signatures",
+    "lightning",
+    "network",
+    "networks",
+    "psbt",
+    "psbts",
+    "c++",
+    "c",
+    "fee",
+    "fees",
+    "feed",
+    "bumping",
+    "segwit",
+    "segregated",
+    "witness",
+    "a",
+    "aa",
+    "aaa",
+    "_a",
+    "the",
+    "of",
+]
+
+
+class TopicMatcherTest(unittest.TestCase):
+    def test_matches_naive_matcher(self):
+        matcher = TopicMatcher(TOPICS)
+        rng = random.Random(0)
+        separators = [" ", " ", "\n", ", ", ". ", "-", "(", ")", "/", ""]
+        for _ in range(300):
+            parts = []
+            for word in rng.choices(VOCABULARY, k=rng.randint(0, 40)):
+                parts.append(word.upper() if rng.random() < 0.2 else word)
+                parts.append(rng.choice(separators))
+            text = "".join(parts)
+            with self.subTest(text=text):
+                self.assertEqual(matcher.count(text), naive_count(TOPICS, text))
+
+    def test_whole_words_only(self):
+        matcher = TopicMatcher(["taproot", "fee"])
+        counts = matcher.count("Taproot, taproot's and taprooted fees; fee.")
+        self.assertEqual(counts, Counter({"taproot": 2, "fee": 1}))
+
+    def test_overlapping_topics(self):
+        matcher = TopicMatcher(["Lightning Network", "Lightning", "Network"])
+        counts = matcher.count("The lightning network is a network.")
+        self.assertEqual(
+            counts, Counter({"Lightning Network": 1, "Lightning": 1, "Network": 2})
+        )
+
+    def test_topics_sharing_a_lowercased_form(self):
+        matcher = TopicMatcher(["PSBT", "psbt"])
+        self.assertEqual(matcher.count("A Psbt"), Counter({"PSBT": 1, "psbt": 1}))
+
+    def test_top_orders_by_count_then_topic_order(self):
+        matcher = TopicMatcher(["fee", "segwit", "taproot"])
+        text = "taproot segwit taproot fee segwit"
+        self.assertEqual(matcher.top(text, 5), ["segwit", "taproot", "fee"])
+        self.assertEqual(matcher.top(text, 1), ["segwit"])
+        self.assertEqual(matcher.top("nothing here", 5), [])
+
+
+if __name__ == "__main__":
+    unittest.main()